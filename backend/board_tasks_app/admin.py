@@ -1,8 +1,19 @@
 from django.contrib import admin
-from .models import Task, BoardSettings
+from .models import ArchivedTask, Task, TaskAssignment, Subtask, BoardSettings
+
+class TaskAssignmentInline(admin.TabularInline):
+    model = TaskAssignment
+    extra = 0
+    raw_id_fields = ('contact',)
+
+class SubtaskInline(admin.TabularInline):
+    model = Subtask
+    extra = 0
+    ordering = ('position',)
 
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
+    inlines = [TaskAssignmentInline, SubtaskInline]
     list_display = ('id', 'title', 'isPrivate', 'ownerId')
     search_fields = ('title', 'ownerId')
     list_filter = ('isPrivate',)
@@ -14,6 +25,13 @@ class TaskAdmin(admin.ModelAdmin):
         return self.title
     
     
+@admin.register(ArchivedTask)
+class ArchivedTaskAdmin(admin.ModelAdmin):
+    list_display = ('id', 'title', 'isPrivate', 'ownerId', 'archivedAt')
+    search_fields = ('title', 'ownerId')
+    list_filter = ('isPrivate',)
+
+
 @admin.register(BoardSettings)
 class BoardSettingsAdmin(admin.ModelAdmin):
     list_display = ('id', 'userId')
@@ -0,0 +1,16 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from .async_views import AsyncTaskViewSet, AsyncBoardSettingsViewSet
+from .views import ArchivedTaskViewSet, TaskEventStreamView, BoardSummaryView
+
+# Same routes and names as urls.py, with the async viewsets (served by core/asgi.py).
+router = DefaultRouter()
+router.register(r'tasks', AsyncTaskViewSet, basename='tasks')
+router.register(r'archived-tasks', ArchivedTaskViewSet, basename='archived-tasks')
+router.register(r'board-settings', AsyncBoardSettingsViewSet, basename='board-settings')
+
+urlpatterns = [
+    path('tasks/stream/', TaskEventStreamView.as_view(), name='tasks-stream'),
+    path('summary/', BoardSummaryView.as_view(), name='board-summary'),
+    path('', include(router.urls)),
+]
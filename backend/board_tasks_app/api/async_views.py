@@ -0,0 +1,20 @@
+from core.async_views import AsyncViewSetMixin
+from sync_app.api.mixins import AsyncConditionalGetMixin
+from .views import TaskViewSet, BoardSettingsViewSet
+
+
+class AsyncTaskViewSet(AsyncConditionalGetMixin, AsyncViewSetMixin, TaskViewSet):
+    """
+    Async equivalent of TaskViewSet, served under ASGI (core/urls_async.py).
+    List (plain and keyset-paginated, through TaskListReader) and retrieve read through
+    the async ORM, with ETag / 304 handling and the response cache awaited on the event
+    loop. Writes and the custom actions run the sync implementation through
+    sync_to_async. Responses are identical to TaskViewSet.
+    """
+
+
+class AsyncBoardSettingsViewSet(AsyncConditionalGetMixin, AsyncViewSetMixin, BoardSettingsViewSet):
+    """
+    Async equivalent of BoardSettingsViewSet, served under ASGI (core/urls_async.py).
+    List and retrieve read through the async ORM; writes run the sync implementation.
+    """
@@ -0,0 +1,95 @@
+from rest_framework import serializers
+from board_tasks_app.models import ArchivedTask, Task, TaskAssignment, Subtask, BoardSettings, BoardSummary
+from board_tasks_app.search import task_index
+from contacts_app.models import Contact
+from core.ndjson import NdjsonImporter
+from core.ranking import is_rank
+from sync_app.models import CollectionVersion
+from .serializers import TaskSerializer, BoardSettingsSerializer
+
+
+class TaskImporter(NdjsonImporter):
+    """
+    TaskImporter
+    Imports tasks exported as NDJSON (TaskExportReader lines).
+
+    - Keeps the ids and rank keys of the records, so references and the column order
+      survive; records without a (valid) rank key go to the end of their column.
+      Done tasks keep their `completedAt` (default: as derived by migration 0009).
+      Records whose id is taken by a task or an archived task are skipped.
+    - Assignees are validated like on the API: contact ids that do not exist are
+      dropped, so import the contacts first.
+    - Per chunk: bulk INSERTs of the tasks, assignments and subtasks (the tasks are new,
+      so nothing is replaced and the subtask counters are set before the insert), one
+      change sequence number and one board summary update.
+    """
+    serializer_class = TaskSerializer
+
+    def build(self, record, data):
+        contact_ids = data.pop('assignments', [])
+        subtasks = data.pop('subtasks', [])
+        task = Task(id=self.parse_id(record), **data, **Task.subtask_counters(subtasks))
+        rank = record.get('rank')
+        if is_rank(rank) and len(rank) <= Task._meta.get_field('rank').max_length:
+            task.rank = rank
+        if task.status == 'done':
+            completed_at = record.get('completedAt')
+            if completed_at is None:
+                # Done at the last update, as migration 0009 assumes for existing tasks.
+                task.completedAt = task.updatedAt or task.createdAt
+            else:
+                task.completedAt = self.parse_completed_at(completed_at)
+        return task, contact_ids, subtasks
+
+    def parse_completed_at(self, value):
+        try:
+            return serializers.DateTimeField().to_internal_value(value)
+        except serializers.ValidationError as error:
+            raise serializers.ValidationError({'completedAt': error.detail})
+
+    def write(self, items):
+        ids = [task.pk for _, (task, _, _) in items if task.pk is not None]
+        existing = [
+            *Task.objects.filter(pk__in=ids).values_list('pk', flat=True),
+            *ArchivedTask.objects.filter(pk__in=ids).values_list('pk', flat=True),
+        ]
+        items = self.reject_existing(items, existing, lambda built: built[0].pk, 'Task {} already exists.')
+        if not items:
+            return 0
+        tasks = [task for _, (task, _, _) in items]
+        seq = CollectionVersion.objects.bump(CollectionVersion.TASKS)
+        for task in tasks:
+            task.changeSeq = seq
+        Task.objects.assign_ranks(tasks)
+        Task.objects.bulk_create(tasks)
+        requested = {contact_id for _, (_, contact_ids, _) in items for contact_id in contact_ids}
+        contacts = set(Contact.objects.filter(id__in=requested).values_list('id', flat=True))
+        assignments, subtasks = [], []
+        for _, (task, contact_ids, task_subtasks) in items:
+            known = [contact_id for contact_id in dict.fromkeys(contact_ids) if contact_id in contacts]
+            for position, contact_id in enumerate(known):
+                assignments.append(TaskAssignment(task_id=task.pk, contact_id=contact_id, position=position))
+            for position, item in enumerate(task_subtasks):
+                subtasks.append(Subtask(task_id=task.pk, position=position, **item))
+        TaskAssignment.objects.bulk_create(assignments)
+        Subtask.objects.bulk_create(subtasks)
+        task_index.refresh(task.pk for task in tasks)
+        BoardSummary.objects.apply([(None, task.get_summary_state()) for task in tasks])
+        return len(tasks)
+
+
+class BoardSettingsImporter(NdjsonImporter):
+    """
+    BoardSettingsImporter
+    Imports board settings exported as NDJSON; settings of users that already have
+    some are skipped (the serializer's unique check). One bulk INSERT per chunk.
+    """
+    serializer_class = BoardSettingsSerializer
+
+    def write(self, items):
+        items = self.reject_existing(items, [], lambda data: data['userId'], 'Board settings of user {} already exist.')
+        if not items:
+            return 0
+        BoardSettings.objects.bulk_create([BoardSettings(**data) for _, data in items])
+        CollectionVersion.objects.bump(CollectionVersion.BOARD_SETTINGS)
+        return len(items)
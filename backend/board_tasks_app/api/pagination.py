@@ -0,0 +1,162 @@
+import base64
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class TaskKeysetPagination(BasePagination):
+    """
+    TaskKeysetPagination
+    Opt-in keyset (cursor) pagination for the task list.
+
+    - Only active when the request carries a `cursor` or `pageSize` query parameter,
+      so existing clients keep receiving the plain list.
+    - Orders by the stable key (status, rank, id) and seeks past the last row of the
+      previous page instead of using OFFSET, so every page costs the same.
+    - A cursor that does not decode to a position is rejected with 400.
+    - Returns `{"next": <url or null>, "results": [...]}`.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'pageSize'
+    page_size = 100
+    max_page_size = 1000
+    ordering_fields = ('status', 'rank', 'id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    def is_enabled(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self):
+        return self.ordering_fields
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_enabled(request):
+            return None
+        return self.set_page(list(self.get_page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset() for async views: reads the page with async iteration."""
+        if not self.is_enabled(request):
+            return None
+        return self.set_page([row async for row in self.get_page_queryset(queryset, request)])
+
+    def get_page_queryset(self, queryset, request):
+        """The rows of the requested page plus one, which tells whether a next page exists."""
+        self.request = request
+        self.page_size_value = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        queryset = queryset.order_by(*self.get_ordering())
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(position))
+        return queryset[:self.page_size_value + 1]
+
+    def set_page(self, rows):
+        self.has_next = len(rows) > self.page_size_value
+        rows = rows[:self.page_size_value]
+        self.next_position = self.get_position(rows[-1]) if self.has_next else None
+        return rows
+
+    def get_position(self, row):
+        if isinstance(row, dict):
+            return [row[name] for name in self.ordering_fields]
+        return [getattr(row, name) for name in self.ordering_fields]
+
+    def get_position_filter(self, position):
+        """
+        Builds the "strictly after (status, rank, id)" condition.
+        """
+        status, rank, pk = position
+        same_status = Q(rank__gt=rank) | Q(rank=rank, id__gt=pk)
+        return Q(status__gt=status) | (Q(status=status) & same_status)
+
+    def encode_cursor(self, position):
+        raw = json.dumps(position, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            return self.parse_position(json.loads(base64.urlsafe_b64decode(padded.encode('ascii'))))
+        except (TypeError, ValueError):
+            raise ValidationError({self.cursor_query_param: [self.invalid_cursor_message]})
+
+    def parse_position(self, position):
+        """Validates a decoded cursor; raises ValueError (or TypeError) if it is malformed."""
+        status, rank, pk = position
+        if not isinstance(status, str) or not isinstance(rank, str) or not isinstance(pk, int):
+            raise ValueError
+        return [status, rank, pk]
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size_value)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class ArchivedTaskPagination(TaskKeysetPagination):
+    """
+    ArchivedTaskPagination
+    Keyset pagination for the task archive: newest first by (archivedAt, id).
+    Always active, since the archive grows with the history of the board.
+    """
+    page_size = 50
+    ordering_fields = ('archivedAt', 'id')
+
+    def is_enabled(self, request):
+        return True
+
+    def get_ordering(self):
+        return ('-archivedAt', '-id')
+
+    def get_position(self, row):
+        archived_at, pk = super().get_position(row)
+        return [archived_at.isoformat(), pk]
+
+    def get_position_filter(self, position):
+        """
+        Builds the "strictly before (archivedAt, id)" condition.
+        """
+        archived_at, pk = position
+        return Q(archivedAt__lt=archived_at) | Q(archivedAt=archived_at, id__lt=pk)
+
+    def parse_position(self, position):
+        archived_at, pk = position
+        archived_at = parse_datetime(archived_at)
+        if archived_at is None or not isinstance(pk, int):
+            raise ValueError
+        return [archived_at, pk]
@@ -0,0 +1,53 @@
+from collections import defaultdict
+
+from board_tasks_app.models import TaskAssignment, Subtask
+from core.readers import ValuesListReader
+from .pagination import TaskKeysetPagination
+from .serializers import TaskSerializer, TaskExportSerializer, BoardSettingsSerializer
+
+
+class TaskListReader(ValuesListReader):
+    """
+    TaskListReader
+    Read path of the task list: task columns via values(), assignees and subtasks
+    with one values_list() query per chunk of tasks.
+    """
+    serializer_class = TaskSerializer
+    extra_columns = TaskKeysetPagination.ordering_fields
+
+    def load_assignedTo(self, task_ids):
+        assignees = defaultdict(list)
+        rows = (
+            TaskAssignment.objects.filter(task_id__in=task_ids)
+            .order_by('position').values_list('task_id', 'contact_id')
+        )
+        for task_id, contact_id in rows:
+            assignees[task_id].append(str(contact_id))
+        return assignees
+
+    def load_subtasks(self, task_ids):
+        subtasks = defaultdict(list)
+        rows = (
+            Subtask.objects.filter(task_id__in=task_ids)
+            .order_by('position').values_list('task_id', 'key', 'title', 'completed')
+        )
+        for task_id, key, title, completed in rows:
+            subtasks[task_id].append({'id': key, 'title': title, 'completed': completed})
+        return subtasks
+
+
+class TaskExportReader(TaskListReader):
+    """
+    TaskExportReader
+    Tasks as exported to NDJSON: the list representation plus `id` and `completedAt`.
+    """
+    serializer_class = TaskExportSerializer
+    extra_columns = ()
+
+
+class BoardSettingsExportReader(ValuesListReader):
+    """
+    BoardSettingsExportReader
+    Board settings as exported to NDJSON.
+    """
+    serializer_class = BoardSettingsSerializer
@@ -1,11 +1,73 @@
+from django.db import transaction
 from rest_framework import serializers
-from board_tasks_app.models import Task, BoardSettings
+from board_tasks_app.models import ArchivedTask, Task, TaskAssignment, Subtask, BoardSettings, BoardSummary
+from core.serializers import ProfiledSerializerMixin
+from sync_app.tracking import suppress_tracking
 
-class TaskSerializer(serializers.ModelSerializer):
+class SparseFieldsetMixin:
+    """
+    SparseFieldsetMixin
+    Drops every field that is not listed in the `fields` serializer context entry.
+    Without a `fields` entry all fields except `Meta.optional_fields` are serialized.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = self.context.get('fields')
+        if requested:
+            dropped = set(self.fields) - set(requested)
+        else:
+            dropped = set(getattr(self.Meta, 'optional_fields', []))
+        for name in dropped:
+            self.fields.pop(name)
+
+class AssignedToField(serializers.ListField):
+    """
+    AssignedToField
+    Exposes the TaskAssignment rows of a task as the list of contact id strings
+    clients used to store in the former assignedTo JSON column.
+    Reads from the `assignments` prefetch cache when available.
+    """
+    child = serializers.CharField()
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('source', 'assignments')
+        kwargs.setdefault('required', False)
+        super().__init__(**kwargs)
+
+    def to_representation(self, data):
+        return [str(assignment.contact_id) for assignment in data.all()]
+
+    def to_internal_value(self, data):
+        values = super().to_internal_value(data)
+        try:
+            return [int(value) for value in values]
+        except ValueError:
+            raise serializers.ValidationError('Expected a list of contact ids.')
+
+class SubtaskSerializer(serializers.ModelSerializer):
+    """
+    Serializer for Subtask model.
+    Keeps the former JSON shape: `id` is the client-side subtask id.
+    """
+    id = serializers.CharField(source='key', max_length=100)
+
+    class Meta:
+        model = Subtask
+        fields = ['id', 'title', 'completed']
+
+class TaskSerializer(ProfiledSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Task model.
     Serializes and deserializes Task instances for API requests and responses.
+    `assignedTo` is stored as TaskAssignment rows; unknown contact ids are dropped.
+    `subtasks` is stored as Subtask rows; the progress counters are only sent when
+    requested via sparse fields.
+    `rank` orders the tasks of a column and is only changed through the move action;
+    a task that changes its column here is appended to the end of the new one.
     """
+    assignedTo = AssignedToField()
+    subtasks = SubtaskSerializer(many=True, required=False)
+
     class Meta:
         model = Task
         fields = [
@@ -19,12 +81,150 @@ class TaskSerializer(serializers.ModelSerializer):
             'subtasks',
             'createdAt',
             'updatedAt',
-            'order',
+            'rank',
+            'isPrivate',
+            'ownerId',
+            'subtasksTotal',
+            'subtasksDone'
+        ]
+        optional_fields = ['subtasksTotal', 'subtasksDone']
+        read_only_fields = ['subtasksTotal', 'subtasksDone', 'rank']
+        extra_kwargs = {
+            'dueDate': {'required': True, 'allow_null': False},
+        }
+
+    def validate_subtasks(self, value):
+        keys = [item['key'] for item in value]
+        if len(keys) != len(set(keys)):
+            raise serializers.ValidationError('Subtask ids must be unique within a task.')
+        return value
+
+    def create(self, validated_data):
+        contact_ids = validated_data.pop('assignments', [])
+        subtasks = validated_data.pop('subtasks', [])
+        with transaction.atomic(savepoint=False):
+            task = super().create({**validated_data, **Task.subtask_counters(subtasks)})
+            # A new task has no relations yet: empty lists need no queries.
+            self.replace_relations(task, contact_ids or None, subtasks or None)
+        return task
+
+    def update(self, instance, validated_data):
+        contact_ids = validated_data.pop('assignments', None)
+        subtasks = validated_data.pop('subtasks', None)
+        if instance.leaves_column(validated_data):
+            instance.rank = ''
+        with transaction.atomic(savepoint=False):
+            if subtasks is not None:
+                # Stored by the task's own UPDATE, like the change sequence number.
+                validated_data.update(Task.subtask_counters(subtasks))
+            task = super().update(instance, validated_data)
+            self.replace_relations(task, contact_ids, subtasks)
+        return task
+
+    def replace_relations(self, task, contact_ids, subtasks):
+        """
+        Writes the assignees and subtasks (None: unchanged) of a task that was just saved.
+        The task's save already stamped its change sequence number and counters, so the
+        relations are written without another collection bump.
+        """
+        with suppress_tracking():
+            if contact_ids is not None:
+                TaskAssignment.objects.replace({task.pk: contact_ids})
+            if subtasks is not None:
+                Subtask.objects.replace({task: subtasks}, save_counters=False)
+
+class TaskChangeSerializer(TaskSerializer):
+    """
+    Serializer for the task delta-sync feed.
+    Same representation as TaskSerializer plus the `id` clients need to merge rows.
+    """
+    class Meta(TaskSerializer.Meta):
+        fields = ['id', *TaskSerializer.Meta.fields]
+
+class TaskExportSerializer(TaskChangeSerializer):
+    """
+    Serializer for the NDJSON task export.
+    Same representation as TaskChangeSerializer plus `completedAt`, so an import keeps
+    the archive schedule of done tasks.
+    """
+    class Meta(TaskChangeSerializer.Meta):
+        fields = [*TaskChangeSerializer.Meta.fields, 'completedAt']
+        read_only_fields = [*TaskChangeSerializer.Meta.read_only_fields, 'completedAt']
+
+class ArchivedTaskSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for ArchivedTask model (read-only).
+    Same shape as TaskChangeSerializer minus the board position (`rank`), plus when the
+    task was completed and archived. `assignedTo` may hold contacts deleted since.
+    """
+    assignedTo = serializers.ListField(child=serializers.CharField(), read_only=True)
+
+    class Meta:
+        model = ArchivedTask
+        fields = [
+            'id',
+            'title',
+            'description',
+            'dueDate',
+            'priority',
+            'category',
+            'status',
+            'assignedTo',
+            'subtasks',
+            'createdAt',
+            'updatedAt',
+            'completedAt',
             'isPrivate',
-            'ownerId'
+            'ownerId',
+            'archivedAt'
         ]
+        read_only_fields = fields
 
-class BoardSettingsSerializer(serializers.ModelSerializer):
+class TaskBulkOperationSerializer(serializers.Serializer):
+    """
+    Serializer for a single operation of the bulk task endpoint.
+    - create: requires `data` (full task payload).
+    - update: requires `id` and `data` (partial task payload).
+    - delete: requires `id`.
+    """
+    OPERATIONS = ['create', 'update', 'delete']
+
+    op = serializers.ChoiceField(choices=OPERATIONS)
+    id = serializers.IntegerField(required=False)
+    data = serializers.DictField(required=False)
+
+    def validate(self, data):
+        if data['op'] in ['update', 'delete'] and 'id' not in data:
+            raise serializers.ValidationError({'id': 'This field is required.'})
+        if data['op'] in ['create', 'update'] and 'data' not in data:
+            raise serializers.ValidationError({'data': 'This field is required.'})
+        return data
+
+class TaskMoveSerializer(serializers.Serializer):
+    """
+    Serializer for the task move action.
+    `after` / `before` are the ids of the tasks the moved task is placed between, in
+    the column `status` (default: the task's current status) of the task's board.
+    """
+    status = serializers.ChoiceField(choices=Task.STATUS_CHOICES, required=False)
+    after = serializers.IntegerField(required=False, allow_null=True)
+    before = serializers.IntegerField(required=False, allow_null=True)
+
+class TaskBulkSerializer(serializers.Serializer):
+    """
+    Serializer for the bulk task endpoint envelope.
+    Validates the shape of the operation list; the task payloads themselves
+    are validated per operation with TaskSerializer.
+    """
+    MAX_OPERATIONS = 1000
+
+    operations = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=MAX_OPERATIONS
+    )
+
+class BoardSettingsSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for BoardSettings model.
     Serializes and deserializes BoardSettings instances for API requests and responses.
@@ -35,4 +235,21 @@ class BoardSettingsSerializer(serializers.ModelSerializer):
             'userId',
             'viewMode',
             'lastChanged'
-        ]
\ No newline at end of file
+        ]
+
+class BoardSummarySerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for BoardSummary model.
+    Also accepts the dict of summed counters returned for the "all tasks" view mode.
+    """
+    class Meta:
+        model = BoardSummary
+        fields = [
+            'total',
+            'todo',
+            'inprogress',
+            'awaitfeedback',
+            'done',
+            'urgent',
+            'nextDeadline'
+        ]
@@ -1,11 +1,14 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import TaskViewSet, BoardSettingsViewSet
+from .views import TaskViewSet, ArchivedTaskViewSet, TaskEventStreamView, BoardSettingsViewSet, BoardSummaryView
 
 router = DefaultRouter()
 router.register(r'tasks', TaskViewSet, basename='tasks')
+router.register(r'archived-tasks', ArchivedTaskViewSet, basename='archived-tasks')
 router.register(r'board-settings', BoardSettingsViewSet, basename='board-settings')
 
 urlpatterns = [
+    path('tasks/stream/', TaskEventStreamView.as_view(), name='tasks-stream'),
+    path('summary/', BoardSummaryView.as_view(), name='board-summary'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -1,9 +1,58 @@
-from rest_framework import viewsets
+import datetime
+
+from django.db import transaction
+from django.db.models import F, Prefetch
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.views import View
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
 from rest_framework.permissions import IsAuthenticated
-from board_tasks_app.models import Task, BoardSettings
-from .serializers import TaskSerializer, BoardSettingsSerializer
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from board_tasks_app.models import (
+    RANK_REBALANCE_LENGTH,
+    ArchivedTask,
+    Task,
+    TaskAssignment,
+    Subtask,
+    BoardSettings,
+    BoardSummary
+)
+from board_tasks_app.ranking import schedule_rebalance
+from board_tasks_app.search import get_highlights, task_index
+from core.ndjson import export_records, streaming_response
+from core.readers import ValuesListMixin
+from core.renderers import FastJSONRenderer, NdjsonRenderer
+from core.search import SearchPagination, parse_terms
+from sync_app.api.mixins import CachedResponseMixin, ChangeFeedMixin, ConditionalGetMixin
+from sync_app.feeds import ChangeFeed
+from sync_app.models import CollectionVersion, Tombstone
+from sync_app.streams import (
+    ChangeStream,
+    authenticate_stream,
+    authentication_failed_response,
+    parse_stream_cursor
+)
+from sync_app.tracking import suppress_tracking
+from .pagination import ArchivedTaskPagination, TaskKeysetPagination
+from .readers import BoardSettingsExportReader, TaskExportReader, TaskListReader
+from .serializers import (
+    TaskSerializer,
+    TaskChangeSerializer,
+    SubtaskSerializer,
+    TaskBulkSerializer,
+    TaskBulkOperationSerializer,
+    TaskMoveSerializer,
+    ArchivedTaskSerializer,
+    BoardSettingsSerializer,
+    BoardSummarySerializer
+)
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(ChangeFeedMixin, CachedResponseMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet for Task model.
     Provides CRUD operations for tasks.
@@ -13,9 +62,34 @@ class TaskViewSet(viewsets.ModelViewSet):
     - Filtering by view mode (public/private)
     - Filtering by owner for private tasks
     - Returns only public tasks by default
+    - Opt-in keyset pagination via `pageSize` / `cursor` (see TaskKeysetPagination)
+    - Sparse fieldsets via `fields=title,status,...` on list and retrieve
+    - Progress counters instead of subtask lists via `subtasks=counts`
+    - Filtering by assigned contact via `assignee=<contactId>`
+    - Due date range via `dueAfter` (inclusive) / `dueBefore` (exclusive)
+    - Sorting via `ordering=dueDate,-createdAt,...` (ignored when paginated)
+    - Batched create/update/delete in one transaction via POST tasks/bulk/
+    - Single subtask updates via PATCH tasks/{id}/subtasks/{subtaskId}/ and
+      POST tasks/{id}/subtasks/{subtaskId}/toggle/
+    - ETag / Last-Modified with 304 responses on list and retrieve
+    - Server-side cache of rendered list responses (see CachedResponseMixin)
+    - List served from values() rows (TaskListReader) and rendered with orjson when available
+    - Delta sync via GET tasks/changes/?since=<cursor>&viewMode=...&userId=...
+    - Full-text search with highlighted snippets via GET tasks/search/?q=<text> (see search())
+    - Drag and drop via POST tasks/{id}/move/ (see move())
+    - Streaming NDJSON export via GET tasks/export/ (see export())
     """
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = TaskKeysetPagination
+    list_reader_class = TaskListReader
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    sparse_field_actions = ['list', 'retrieve']
+    ordering_fields = ['dueDate', 'createdAt', 'updatedAt', 'status', 'rank', 'priority', 'title']
+    version_collections = [CollectionVersion.TASKS]
+    cached_actions = ['list', 'search']
+    change_collection = CollectionVersion.TASKS
+    change_serializer_class = TaskChangeSerializer
 
     def get_queryset(self):
         """
@@ -23,28 +97,511 @@ class TaskViewSet(viewsets.ModelViewSet):
         - If action is retrieve/update/destroy: returns all tasks.
         - If viewMode=private and userId is set: returns private tasks for user.
         - If viewMode=public: returns all public tasks.
+        - assignee, dueAfter/dueBefore and ordering are applied on top of the view mode filter.
         """
+        queryset = self.prefetch_relations(self.restrict_columns(Task.objects.all()))
         if self.action in ['retrieve', 'update', 'partial_update', 'destroy']:
-            return Task.objects.all()
-        queryset = Task.objects.all()
+            return queryset
         view_mode = self.request.query_params.get('viewMode', 'public')
         user_id = self.request.query_params.get('userId')
 
+        # `isPrivate__in` instead of `isPrivate=...`: SQLite renders boolean equality as a bare
+        # column test, which keeps the planner from using the (isPrivate, ...) composite indexes.
         if view_mode == 'private' and user_id:
-            return queryset.filter(isPrivate=True, ownerId=user_id)
-        if view_mode == 'public':
-            return queryset.filter(isPrivate=False)
+            queryset = queryset.filter(isPrivate__in=[True], ownerId=user_id)
+        elif view_mode == 'public':
+            queryset = queryset.filter(isPrivate__in=[False])
+
+        assignee = self.request.query_params.get('assignee')
+        if assignee:
+            if not assignee.isdigit():
+                raise ValidationError({'assignee': ['Expected a contact id.']})
+            queryset = queryset.filter(assignments__contact_id=int(assignee))
+
+        queryset = self.filter_due_range(queryset)
+        return self.apply_ordering(queryset)
+
+    def get_change_queryset(self):
+        return self.prefetch_relations(Task.objects.all())
+
+    def is_in_change_scope(self, task):
+        """
+        Mirrors the view mode filter of get_queryset() for the delta-sync feed, so a task
+        that left the client's board (e.g. became private) is reported as deleted.
+        """
+        return task.is_visible(
+            self.request.query_params.get('viewMode', 'public'),
+            self.request.query_params.get('userId')
+        )
+
+    def parse_due_param(self, name):
+        """
+        Parses an ISO date or datetime query parameter into an aware datetime.
+        Plain dates are interpreted as midnight UTC.
+        """
+        raw = self.request.query_params.get(name)
+        if not raw:
+            return None
+        try:
+            value = parse_datetime(raw)
+            if value is None and (date := parse_date(raw)) is not None:
+                value = datetime.datetime.combine(date, datetime.time.min)
+        except ValueError:
+            value = None
+        if value is None:
+            raise ValidationError({name: ['Expected an ISO 8601 date or datetime.']})
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value, datetime.timezone.utc)
+        return value
+
+    def filter_due_range(self, queryset):
+        due_after = self.parse_due_param('dueAfter')
+        due_before = self.parse_due_param('dueBefore')
+        if due_after is not None:
+            queryset = queryset.filter(dueDate__gte=due_after)
+        if due_before is not None:
+            queryset = queryset.filter(dueDate__lt=due_before)
+        return queryset
+
+    def apply_ordering(self, queryset):
+        raw = self.request.query_params.get('ordering')
+        if not raw:
+            return queryset
+        terms = [term.strip() for term in raw.split(',') if term.strip()]
+        unknown = [term for term in terms if term.lstrip('-') not in self.ordering_fields]
+        if unknown:
+            raise ValidationError({'ordering': [f'Unknown ordering field: {term}' for term in unknown]})
+        return queryset.order_by(*terms, 'id')
+
+    def get_sparse_fields(self):
+        """
+        Returns the list of field names requested via `fields=`, or None for all fields.
+        With `subtasks=counts` the subtask list is swapped for the progress counters.
+        Raises a 400 for unknown field names.
+        """
+        if self.action not in self.sparse_field_actions:
+            return None
+        raw = self.request.query_params.get('fields')
+        counts_only = self.request.query_params.get('subtasks') == 'counts'
+        if not raw and not counts_only:
+            return None
+        if raw:
+            requested = [name.strip() for name in raw.split(',') if name.strip()]
+        else:
+            optional = TaskSerializer.Meta.optional_fields
+            requested = [name for name in TaskSerializer.Meta.fields if name not in optional]
+        unknown = [name for name in requested if name not in TaskSerializer.Meta.fields]
+        if unknown:
+            raise ValidationError({'fields': [f'Unknown field: {name}' for name in unknown]})
+        if counts_only:
+            requested = [name for name in requested if name != 'subtasks']
+            requested += [name for name in ['subtasksTotal', 'subtasksDone'] if name not in requested]
+        return requested
+
+    def restrict_columns(self, queryset):
+        """
+        Loads only the columns needed for the requested fields plus the pagination key,
+        so large text/JSON columns are not read when they are not sent.
+        """
+        fields = self.get_sparse_fields()
+        if not fields:
+            return queryset
+        columns = {field.name for field in Task._meta.concrete_fields}
+        return queryset.only(*[name for name in fields if name in columns], *TaskKeysetPagination.ordering_fields)
+
+    def prefetch_relations(self, queryset):
+        """
+        Loads the assignees and subtasks of all tasks with one extra query each instead
+        of one per task. Skipped for relations a sparse fieldset does not ask for.
+        """
+        fields = self.get_sparse_fields()
+        if not fields or 'assignedTo' in fields:
+            assignments = TaskAssignment.objects.only('task_id', 'contact_id').order_by('position')
+            queryset = queryset.prefetch_related(Prefetch('assignments', queryset=assignments))
+        if not fields or 'subtasks' in fields:
+            subtasks = Subtask.objects.order_by('position')
+            queryset = queryset.prefetch_related(Prefetch('subtasks', queryset=subtasks))
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = self.get_sparse_fields()
+        return context
+
+    @action(detail=False, methods=['get'], url_path='search')
+    def search(self, request):
+        """
+        Ranked search over title, description and subtask titles: every word of `q` must
+        start a word of one of them. Scoped by viewMode / userId (and assignee, dueAfter,
+        dueBefore) like the list. Served from the FTS5 index on SQLite (bm25, title matches
+        first), so the cost depends on the number of matches rather than the board size.
+        Each result is the task (with `id`) plus `highlights`: HTML-escaped snippets of the
+        matching fields with <mark> around the matched word prefixes. Paginated with
+        `page` / `pageSize` (default 20). Conditional GET and the response cache apply.
+        """
+        return self.conditional_response(self.search_response, request)
+
+    def search_response(self, request):
+        terms = parse_terms(request.query_params.get('q'))
+        queryset = task_index.filter(self.get_queryset(), terms)
+        paginator = SearchPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        results = TaskChangeSerializer(page, many=True, context=self.get_serializer_context()).data
+        for task, result in zip(page, results):
+            result['highlights'] = get_highlights(task, terms)
+        return paginator.get_paginated_response(results)
+
+    @action(detail=False, methods=['get'], url_path='export', renderer_classes=[FastJSONRenderer, NdjsonRenderer])
+    def export(self, request):
+        """
+        Streams the tasks of the view mode (viewMode / userId, assignee, dueAfter,
+        dueBefore) as NDJSON, one TaskExportSerializer record per line in id order, with
+        `rank` so `import_ndjson tasks` restores the columns. Rows are read in chunks
+        with QuerySet.iterator(), so memory stays flat however large the board is.
+        """
+        queryset = self.get_queryset().order_by('pk')
+        return streaming_response(export_records(TaskExportReader(), queryset), 'tasks.ndjson')
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        """
+        Applies a list of create/update/delete operations in a single transaction.
+        - The referenced tasks are loaded and all operations validated inside the
+          transaction; if any fails, nothing is written and a 400 with one result
+          entry per operation is returned.
+        - Otherwise creates use bulk_create, updates a single bulk_update and deletes
+          a single DELETE, so the query count does not grow with the number of operations.
+        - All written tasks share one change sequence number; deletes leave tombstones.
+        - The board summary counters are updated once for the whole batch.
+        """
+        envelope = TaskBulkSerializer(data=request.data)
+        envelope.is_valid(raise_exception=True)
+        operations = envelope.validated_data['operations']
+
+        parsed = [TaskBulkOperationSerializer(data=operation) for operation in operations]
+        referenced_ids = [op.validated_data.get('id') for op in parsed if op.is_valid()]
+
+        with transaction.atomic(), suppress_tracking():
+            # Loaded inside the transaction, so the summary deltas are taken from the
+            # same rows the updates and deletes are applied to.
+            instances = Task.objects.select_for_update().in_bulk(
+                [pk for pk in referenced_ids if pk is not None]
+            )
+            summary_before = {pk: task.get_summary_state() for pk, task in instances.items()}
+            results, to_create, to_update, to_delete, assignments, subtasks = (
+                self.validate_bulk_operations(parsed, instances)
+            )
+            if any('errors' in result for result in results):
+                return Response({'results': results}, status=status.HTTP_400_BAD_REQUEST)
+
+            seq = CollectionVersion.objects.bump(CollectionVersion.TASKS)
+            for task in [*to_create, *(task for task, _ in to_update)]:
+                task.changeSeq = seq
+            Task.objects.assign_ranks([*to_create, *(task for task, _ in to_update)])
+            created = Task.objects.bulk_create(to_create)
+            updated_fields = sorted({name for _, fields in to_update for name in fields} | {'changeSeq'})
+            if to_update:
+                Task.objects.bulk_update([task for task, _ in to_update], updated_fields)
+            if to_delete:
+                Task.objects.filter(id__in=to_delete).delete()
+                Tombstone.objects.record(CollectionVersion.TASKS, to_delete, seq)
+            TaskAssignment.objects.replace({task.pk: contact_ids for task, contact_ids in assignments})
+            Subtask.objects.replace(dict(subtasks))
+            relation_only = {task.pk for task, _ in [*assignments, *subtasks] if task.changeSeq != seq}
+            if relation_only:
+                Task.objects.filter(pk__in=relation_only).update(changeSeq=seq)
+            BoardSummary.objects.apply([
+                *[(None, task.get_summary_state()) for task in created],
+                *[(summary_before[task.pk], task.get_summary_state()) for task, _ in to_update],
+                *[(summary_before[pk], None) for pk in to_delete],
+            ])
+
+        created_ids = iter(task.pk for task in created)
+        for result in results:
+            if result['op'] == 'create':
+                result['id'] = next(created_ids)
+        return Response({'results': results}, status=status.HTTP_200_OK)
+
+    def validate_bulk_operations(self, parsed, instances):
+        """
+        Validates every bulk operation without touching the database.
+        Returns the per-operation results plus the unsaved tasks to create,
+        the (task, changed fields) pairs to update, the ids to delete and the
+        (task, contact ids) / (task, subtasks) pairs whose relations are replaced.
+        """
+        results, to_create, to_update, to_delete, assignments, subtasks = [], [], [], [], [], []
+        seen_ids = set()
+        for index, operation in enumerate(parsed):
+            result = {'index': index, 'op': operation.initial_data.get('op')}
+            results.append(result)
+            if not operation.is_valid():
+                result['errors'] = operation.errors
+                continue
+            op = operation.validated_data
+            pk = op.get('id')
+            if pk is not None:
+                result['id'] = pk
+                if pk not in instances:
+                    result['errors'] = {'id': ['Task not found.']}
+                    continue
+                if pk in seen_ids:
+                    result['errors'] = {'id': ['Task is referenced by more than one operation.']}
+                    continue
+                seen_ids.add(pk)
 
+            if op['op'] == 'delete':
+                to_delete.append(pk)
+                continue
+            serializer = TaskSerializer(
+                instances.get(pk),
+                data=op['data'],
+                partial=op['op'] == 'update'
+            )
+            if not serializer.is_valid():
+                result['errors'] = serializer.errors
+                continue
+            validated_data = dict(serializer.validated_data)
+            contact_ids = validated_data.pop('assignments', None)
+            subtask_items = validated_data.pop('subtasks', None)
+            if op['op'] == 'create':
+                task = Task(**validated_data)
+                task.track_completion()
+                to_create.append(task)
+                contact_ids = contact_ids or []
+            else:
+                task = instances[pk]
+                fields = list(validated_data)
+                if task.leaves_column(validated_data):
+                    task.rank = ''
+                    fields.append('rank')
+                for name, value in validated_data.items():
+                    setattr(task, name, value)
+                if task.track_completion():
+                    fields.append('completedAt')
+                if fields:
+                    to_update.append((task, fields))
+            if contact_ids is not None:
+                assignments.append((task, contact_ids))
+            if subtask_items:
+                subtasks.append((task, subtask_items))
+            elif subtask_items is not None and op['op'] == 'update':
+                subtasks.append((task, []))
+        return results, to_create, to_update, to_delete, assignments, subtasks
+
+    @action(detail=True, methods=['post'], url_path='move')
+    def move(self, request, pk=None):
+        """
+        Moves a task within its column, or to another status column of its board: between
+        the tasks `after` and `before` (ids; with only one of them right next to that task,
+        with none to the end of the column). Only the moved task is written: it gets a rank
+        key between its new neighbours' keys. Columns whose keys grew long are rebalanced
+        in the background after the response. Responds with the task including `id`.
+        """
+        serializer = TaskMoveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        with transaction.atomic():
+            task = get_object_or_404(Task, pk=pk)
+            task.status = data.get('status', task.status)
+            after, before = self.get_move_neighbours(task, data.get('after'), data.get('before'))
+            if after is not None and before is not None and after.rank > before.rank:
+                raise ValidationError({'before': ['Expected a task after `after`.']})
+            try:
+                task.rank = Task.objects.rank_for_move(task, after, before)
+            except ValueError:
+                task.rank = ''
+            if not task.rank or len(task.rank) > Task._meta.get_field('rank').max_length:
+                # Neighbours with equal keys (concurrent moves to the same spot) or keys
+                # that outgrew the column: rebalance it right away.
+                Task.objects.rebalance(task.get_board(), task.status)
+                after, before = self.get_move_neighbours(task, data.get('after'), data.get('before'))
+                try:
+                    task.rank = Task.objects.rank_for_move(task, after, before)
+                except ValueError:
+                    raise ValidationError({'before': ['Expected a task after `after`.']})
+            task.save(update_fields=['status', 'rank', 'changeSeq'])
+            if len(task.rank) > RANK_REBALANCE_LENGTH:
+                schedule_rebalance(task.get_board(), task.status)
+        return Response(TaskChangeSerializer(task, context=self.get_serializer_context()).data)
+
+    def get_move_neighbours(self, task, after_id, before_id):
+        """
+        Loads the tasks `after_id` / `before_id` (None if not given). Raises a 400 unless
+        they are other tasks of the column the task moves to.
+        """
+        ids = {'after': after_id, 'before': before_id}
+        tasks = Task.objects.in_bulk([pk for pk in ids.values() if pk is not None])
+        errors = {}
+        for name, neighbour_id in ids.items():
+            if neighbour_id is None:
+                continue
+            neighbour = tasks.get(neighbour_id)
+            if neighbour is None or neighbour.pk == task.pk or (
+                (neighbour.get_board(), neighbour.status) != (task.get_board(), task.status)
+            ):
+                errors[name] = ['Expected another task of the target column.']
+        if errors:
+            raise ValidationError(errors)
+        return tasks.get(after_id), tasks.get(before_id)
+
+    @action(detail=True, methods=['patch'], url_path=r'subtasks/(?P<subtask_id>[^/]+)')
+    def update_subtask(self, request, pk=None, subtask_id=None):
+        """
+        Updates title and/or completed of a single subtask.
+        Only the subtask row and the task's subtasksDone counter are written.
+        """
+        serializer = SubtaskSerializer(data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        changes = {name: value for name, value in serializer.validated_data.items() if name != 'key'}
+        return self.write_subtask(pk, subtask_id, lambda subtask: changes)
+
+    @action(detail=True, methods=['post'], url_path=r'subtasks/(?P<subtask_id>[^/]+)/toggle')
+    def toggle_subtask(self, request, pk=None, subtask_id=None):
+        """
+        Flips the completed flag of a single subtask.
+        """
+        return self.write_subtask(pk, subtask_id, lambda subtask: {'completed': not subtask.completed})
+
+    def write_subtask(self, task_id, subtask_id, get_changes):
+        """
+        Applies the changes returned by `get_changes(subtask)` to one subtask and
+        adjusts the task's subtasksDone counter with a single-column UPDATE.
+        Responds with the subtask and the task's current progress counters.
+        """
+        with transaction.atomic():
+            subtask = get_object_or_404(
+                Subtask.objects.select_for_update(),
+                task_id=task_id,
+                key=subtask_id
+            )
+            was_completed = subtask.completed
+            changes = get_changes(subtask)
+            for name, value in changes.items():
+                setattr(subtask, name, value)
+            if changes:
+                subtask.save(update_fields=list(changes))
+            delta = int(subtask.completed) - int(was_completed)
+            if changes:
+                seq = CollectionVersion.objects.bump(CollectionVersion.TASKS)
+                Task.objects.filter(pk=task_id).update(
+                    subtasksDone=F('subtasksDone') + delta,
+                    changeSeq=seq
+                )
+            counters = Task.objects.filter(pk=task_id).values('subtasksTotal', 'subtasksDone').get()
+        return Response({'subtask': SubtaskSerializer(subtask).data, **counters})
+
+class TaskEventStreamView(View):
+    """
+    Server-Sent Events stream of task changes (GET tasks/stream/).
+    Authenticated with the DRF token (Authorization header or `token` query parameter)
+    and filtered by `viewMode` / `userId` like the task list.
+    Emits `task.changed`, `task.deleted` and `resync` events (see ChangeStream).
+    Needs an ASGI server; under WSGI every open stream would block a worker thread.
+    """
+    async def get(self, request):
+        try:
+            await authenticate_stream(request)
+        except AuthenticationFailed as exc:
+            return authentication_failed_response(exc)
+        view_mode = request.GET.get('viewMode', 'public')
+        user_id = request.GET.get('userId')
+        queryset = Task.objects.prefetch_related(
+            Prefetch('assignments', queryset=TaskAssignment.objects.only('task_id', 'contact_id').order_by('position')),
+            Prefetch('subtasks', queryset=Subtask.objects.order_by('position'))
+        )
+        stream = ChangeStream(
+            ChangeFeed(CollectionVersion.TASKS, queryset),
+            serialize=lambda task: TaskChangeSerializer(task).data,
+            in_scope=lambda task: task.is_visible(view_mode, user_id),
+            prefix='task',
+            since=parse_stream_cursor(request)
+        )
+        return stream.as_response()
+
+class ArchivedTaskViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    ViewSet for ArchivedTask model.
+    Browses the done tasks `manage.py archive_tasks` moved out of the task table and
+    moves them back onto the board.
+
+    Supports:
+    - Filtering by view mode (public/private) and owner, like the task list
+    - Keyset pagination, newest first (see ArchivedTaskPagination)
+    - Restoring a task via POST archived-tasks/{id}/restore/ (see restore())
+    - ETag / Last-Modified with 304 responses on list and retrieve
+    """
+    serializer_class = ArchivedTaskSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = ArchivedTaskPagination
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    # Archiving and restoring write the task collection (tombstones, restored rows).
+    version_collections = [CollectionVersion.TASKS]
+
+    def get_queryset(self):
+        """
+        Returns the archived tasks of the board selected by viewMode / userId (list only).
+        """
+        queryset = ArchivedTask.objects.all()
+        if self.action != 'list':
+            return queryset
+        view_mode = self.request.query_params.get('viewMode', 'public')
+        user_id = self.request.query_params.get('userId')
+        if view_mode == 'private' and user_id:
+            queryset = queryset.filter(isPrivate__in=[True], ownerId=user_id)
+        elif view_mode == 'public':
+            queryset = queryset.filter(isPrivate__in=[False])
         return queryset
 
-class BoardSettingsViewSet(viewsets.ModelViewSet):
+    @action(detail=True, methods=['post'], url_path='restore')
+    def restore(self, request, pk=None):
+        """
+        Moves an archived task back onto its board, under its old id and at the end of
+        its column. Responds with the task including `id` (201).
+        """
+        task = ArchivedTask.objects.restore(self.get_object())
+        return Response(TaskChangeSerializer(task).data, status=status.HTTP_201_CREATED)
+
+class BoardSummaryView(ConditionalGetMixin, APIView):
+    """
+    Board summary (GET summary/).
+    Returns the task counters per status, the number of urgent tasks and the next
+    deadline of the board selected by `viewMode` / `userId` (same rules as the task
+    list), read from the BoardSummary row of that board: one indexed lookup, however
+    many tasks the board has.
+    Carries ETag / Last-Modified of the task collection and answers 304 when unchanged.
+    """
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    version_collections = [CollectionVersion.TASKS]
+
+    def get(self, request):
+        return self.conditional_response(self.summary_response, request)
+
+    def summary_response(self, request):
+        summary = BoardSummary.objects.get_summary(
+            request.query_params.get('viewMode', 'public'),
+            request.query_params.get('userId')
+        )
+        return Response(BoardSummarySerializer(summary).data)
+
+class BoardSettingsViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet for BoardSettings model.
     Provides CRUD operations for board settings.
     Each user has their own board settings, identified by userId.
     Only authenticated users can access board settings.
+    List and retrieve responses carry ETag / Last-Modified and answer 304 when unchanged;
+    rendered retrieve responses are cached server-side.
+    GET board-settings/export/ streams all settings as NDJSON.
     """
     serializer_class = BoardSettingsSerializer
     permission_classes = [IsAuthenticated]
     queryset = BoardSettings.objects.all()
-    lookup_field = 'userId'
\ No newline at end of file
+    lookup_field = 'userId'
+    version_collections = [CollectionVersion.BOARD_SETTINGS]
+    cached_actions = ['retrieve']
+
+    @action(detail=False, methods=['get'], url_path='export', renderer_classes=[FastJSONRenderer, NdjsonRenderer])
+    def export(self, request):
+        queryset = self.get_queryset().order_by('pk')
+        return streaming_response(export_records(BoardSettingsExportReader(), queryset), 'board-settings.ndjson')
@@ -1,5 +1,16 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class BoardTasksAppConfig(AppConfig):
     name = 'board_tasks_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        post_migrate.connect(ensure_search_index, sender=self)
+
+
+def ensure_search_index(using, **kwargs):
+    """Recreates the task FTS5 triggers after migrations that rebuilt the task or subtask table."""
+    from .search import task_index
+    task_index.ensure(using)
@@ -0,0 +1,40 @@
+import datetime
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.utils import timezone
+from board_tasks_app.models import ArchivedTask
+
+
+class Command(BaseCommand):
+    """
+    Moves tasks that have been done for more than TASK_ARCHIVE['AFTER_DAYS'] days from
+    the task table into the archive (ArchivedTask), in batches of one transaction each.
+    Delta-sync clients see them as deleted and the board summary stops counting them;
+    POST /api/board-tasks/archived-tasks/{id}/restore/ brings a task back.
+    Meant to run periodically (e.g. daily from cron); --interval keeps it running.
+    """
+    help = 'Archives tasks that have been done for longer than TASK_ARCHIVE["AFTER_DAYS"].'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--after-days',
+            type=float,
+            default=settings.TASK_ARCHIVE['AFTER_DAYS'],
+            help='Archive tasks done for more than this many days.'
+        )
+        parser.add_argument('--batch-size', type=int, default=settings.TASK_ARCHIVE['BATCH_SIZE'])
+        parser.add_argument('--interval', type=float, help='Repeat every INTERVAL seconds until interrupted.')
+
+    def handle(self, *args, **options):
+        while True:
+            before = timezone.now() - datetime.timedelta(days=options['after_days'])
+            started = time.perf_counter()
+            count = ArchivedTask.objects.archive_completed(before, batch_size=options['batch_size'])
+            self.stdout.write(f'Archived {count} task(s) in {time.perf_counter() - started:.2f} s.')
+            connections.close_all()
+            if options['interval'] is None:
+                break
+            time.sleep(options['interval'])
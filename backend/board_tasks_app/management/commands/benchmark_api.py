@@ -0,0 +1,355 @@
+import asyncio
+import itertools
+import json
+import platform
+import time
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import AsyncClient, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import get_resolver
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from board_tasks_app.models import ArchivedTask, Task, BoardSettings
+from contacts_app.models import Contact
+from core.benchmark import seed_dataset, summarize, temporary_database
+from sync_app.models import CollectionVersion
+from user_auth_app.models import User
+
+PROFILES = {
+    'small': {'tasks': 1000, 'contacts': 1000},
+    'medium': {'tasks': 100000, 'contacts': 100000},
+    'large': {'tasks': 1000000, 'contacts': 100000},
+}
+PREFIXES = ['api/auth/', 'api/contacts/', 'api/board-tasks/']
+PASSWORD = 'benchmark-password'
+ARCHIVED_TASKS = 100
+
+
+class Route:
+    """
+    One benchmarked request.
+    `path` and `body` may be callables taking the benchmark context; `prepare(context)`
+    runs untimed before every request (e.g. to create the row a DELETE removes) and
+    its return value is passed to `path` / `body` as `context['prepared']`.
+    `route` is the URL name (prefixed with its include) used for the coverage report.
+    """
+    def __init__(self, name, route, method, path, body=None, prepare=None, repeat_cap=None, auth='user'):
+        self.name = name
+        self.route = route
+        self.method = method
+        self.path = path
+        self.body = body
+        self.prepare = prepare
+        self.repeat_cap = repeat_cap
+        self.auth = auth
+
+
+def value(item, context):
+    return item(context) if callable(item) else item
+
+
+def task_payload(context, **overrides):
+    payload = {
+        'title': 'Benchmark task',
+        'description': 'Created by benchmark_api',
+        'dueDate': '2026-06-01T00:00:00Z',
+        'priority': 'medium',
+        'category': 'User Story',
+        'status': 'todo',
+        'assignedTo': [str(pk) for pk in context['contact_ids'][:2]],
+        'subtasks': [{'id': '1', 'title': 'Step 1', 'completed': False}],
+        'createdAt': '2026-01-01T00:00:00Z',
+        'isPrivate': False,
+        'ownerId': '1',
+    }
+    payload.update(overrides)
+    return payload
+
+
+def create_task(context):
+    return Task.objects.create(title='To delete', priority='low', category='User Story', createdAt=context['now']).pk
+
+
+def archive_task(context):
+    task = Task.objects.create(title='To restore', priority='low', category='User Story', status='done', createdAt=context['now'])
+    ArchivedTask.objects.archive(Task.objects.filter(pk=task.pk))
+    return task.pk
+
+
+def create_contact(context):
+    return Contact.objects.create(firstname='To', lastname='Delete', email='delete@example.com', phone='1').pk
+
+
+def create_board_settings(context):
+    return BoardSettings.objects.create(userId=f'bench-{next(context["counter"])}').userId
+
+
+ROUTES = [
+    Route('auth.registration', 'api/auth/:registration', 'post', '/api/auth/registration/',
+          body=lambda context: {
+              'name': 'Bench User', 'email': f'bench{next(context["counter"])}@example.com',
+              'password': PASSWORD, 'confirmPassword': PASSWORD, 'acceptPrivacyPolicy': True,
+          }, repeat_cap=10, auth=None),
+    Route('auth.login', 'api/auth/:login', 'post', '/api/auth/login/',
+          body={'email': 'benchmark@example.com', 'password': PASSWORD}, repeat_cap=10, auth=None),
+    Route('auth.guest-login', 'api/auth/:guest_login', 'post', '/api/auth/guest-login/', auth=None),
+    Route('auth.token-cache', 'api/auth/:token_cache_stats', 'get', '/api/auth/token-cache/', auth='staff'),
+
+    Route('contacts.root', 'api/contacts/:api-root', 'get', '/api/contacts/'),
+    Route('contacts.create', 'api/contacts/:contact-list', 'post', '/api/contacts/',
+          body=lambda context: {'firstname': 'Bench', 'lastname': 'Mark', 'email': 'bench@example.com', 'phone': '1'}),
+    Route('contacts.retrieve', 'api/contacts/:contact-detail', 'get', lambda context: f'/api/contacts/{context["contact_ids"][0]}/'),
+    Route('contacts.update', 'api/contacts/:contact-detail', 'put', lambda context: f'/api/contacts/{context["contact_ids"][1]}/',
+          body={'firstname': 'Put', 'lastname': 'Contact', 'email': 'put@example.com', 'phone': '2'}),
+    Route('contacts.partial-update', 'api/contacts/:contact-detail', 'patch', lambda context: f'/api/contacts/{context["contact_ids"][1]}/',
+          body={'phone': '3'}),
+    Route('contacts.destroy', 'api/contacts/:contact-detail', 'delete', lambda context: f'/api/contacts/{context["prepared"]}/',
+          prepare=create_contact),
+    Route('contacts.search', 'api/contacts/:contact-search', 'get', '/api/contacts/search/?q=anna%20we'),
+    Route('contacts.groups', 'api/contacts/:contact-groups', 'get', '/api/contacts/groups/'),
+    Route('contacts.group', 'api/contacts/:contact-group', 'get', '/api/contacts/groups/A/?page=2&pageSize=50'),
+    Route('contacts.export', 'api/contacts/:contact-export', 'get', '/api/contacts/export/'),
+    Route('contacts.changes', 'api/contacts/:contact-changes', 'get', lambda context: f'/api/contacts/changes/?since={context["since"]["contacts"]}'),
+
+    Route('board.root', 'api/board-tasks/:api-root', 'get', '/api/board-tasks/'),
+    Route('tasks.list-public', 'api/board-tasks/:tasks-list', 'get', '/api/board-tasks/tasks/?viewMode=public'),
+    Route('tasks.list-private', 'api/board-tasks/:tasks-list', 'get', '/api/board-tasks/tasks/?viewMode=private&userId=1'),
+    Route('tasks.list-fields', 'api/board-tasks/:tasks-list', 'get', '/api/board-tasks/tasks/?viewMode=public&fields=title,status,priority,rank'),
+    Route('tasks.search', 'api/board-tasks/:tasks-search', 'get', '/api/board-tasks/tasks/search/?q=landing%20des&viewMode=public'),
+    Route('tasks.summary', 'api/board-tasks/:board-summary', 'get', '/api/board-tasks/summary/?viewMode=private&userId=1'),
+    Route('tasks.list-counts', 'api/board-tasks/:tasks-list', 'get', '/api/board-tasks/tasks/?viewMode=public&subtasks=counts'),
+    Route('tasks.list-page', 'api/board-tasks/:tasks-list', 'get', '/api/board-tasks/tasks/?viewMode=public&pageSize=100'),
+    Route('tasks.list-assignee', 'api/board-tasks/:tasks-list', 'get', lambda context: f'/api/board-tasks/tasks/?viewMode=public&assignee={context["contact_ids"][0]}'),
+    Route('tasks.list-due-range', 'api/board-tasks/:tasks-list', 'get', '/api/board-tasks/tasks/?viewMode=public&dueAfter=2026-03-01&dueBefore=2026-03-08&ordering=dueDate'),
+    Route('tasks.create', 'api/board-tasks/:tasks-list', 'post', '/api/board-tasks/tasks/', body=task_payload),
+    Route('tasks.retrieve', 'api/board-tasks/:tasks-detail', 'get', lambda context: f'/api/board-tasks/tasks/{context["task_ids"][0]}/'),
+    Route('tasks.update', 'api/board-tasks/:tasks-detail', 'put', lambda context: f'/api/board-tasks/tasks/{context["task_ids"][1]}/',
+          body=task_payload),
+    Route('tasks.partial-update', 'api/board-tasks/:tasks-detail', 'patch', lambda context: f'/api/board-tasks/tasks/{context["task_ids"][1]}/',
+          body={'status': 'inprogress', 'priority': 'low'}),
+    Route('tasks.destroy', 'api/board-tasks/:tasks-detail', 'delete', lambda context: f'/api/board-tasks/tasks/{context["prepared"]}/',
+          prepare=create_task),
+    Route('tasks.bulk-update', 'api/board-tasks/:tasks-bulk', 'post', '/api/board-tasks/tasks/bulk/',
+          body=lambda context: {'operations': [
+              {'op': 'update', 'id': pk, 'data': {'priority': 'medium'}} for pk in context['task_ids'][:50]
+          ]}),
+    Route('tasks.move', 'api/board-tasks/:tasks-move', 'post', lambda context: f'/api/board-tasks/tasks/{context["move"]["task"]}/move/',
+          body=lambda context: {'after': context['move']['after'], 'before': context['move']['before']}),
+    Route('tasks.subtask-update', 'api/board-tasks/:tasks-update-subtask', 'patch',
+          lambda context: f'/api/board-tasks/tasks/{context["subtask_task_id"]}/subtasks/1/', body={'title': 'Renamed'}),
+    Route('tasks.subtask-toggle', 'api/board-tasks/:tasks-toggle-subtask', 'post',
+          lambda context: f'/api/board-tasks/tasks/{context["subtask_task_id"]}/subtasks/1/toggle/'),
+    Route('tasks.changes', 'api/board-tasks/:tasks-changes', 'get', lambda context: f'/api/board-tasks/tasks/changes/?since={context["since"]["tasks"]}'),
+    Route('tasks.export', 'api/board-tasks/:tasks-export', 'get', '/api/board-tasks/tasks/export/?viewMode=public'),
+    Route('tasks.stream', 'api/board-tasks/:tasks-stream', 'stream', '/api/board-tasks/tasks/stream/?viewMode=public'),
+    Route('archived-tasks.list', 'api/board-tasks/:archived-tasks-list', 'get', '/api/board-tasks/archived-tasks/?viewMode=public'),
+    Route('archived-tasks.retrieve', 'api/board-tasks/:archived-tasks-detail', 'get',
+          lambda context: f'/api/board-tasks/archived-tasks/{context["archived_ids"][0]}/'),
+    Route('archived-tasks.restore', 'api/board-tasks/:archived-tasks-restore', 'post',
+          lambda context: f'/api/board-tasks/archived-tasks/{context["prepared"]}/restore/', prepare=archive_task),
+    Route('board-settings.list', 'api/board-tasks/:board-settings-list', 'get', '/api/board-tasks/board-settings/'),
+    Route('board-settings.export', 'api/board-tasks/:board-settings-export', 'get', '/api/board-tasks/board-settings/export/'),
+    Route('board-settings.create', 'api/board-tasks/:board-settings-list', 'post', '/api/board-tasks/board-settings/',
+          body=lambda context: {'userId': f'bench-{next(context["counter"])}', 'viewMode': 'public'}),
+    Route('board-settings.retrieve', 'api/board-tasks/:board-settings-detail', 'get', '/api/board-tasks/board-settings/1/'),
+    Route('board-settings.update', 'api/board-tasks/:board-settings-detail', 'put', '/api/board-tasks/board-settings/1/',
+          body={'userId': '1', 'viewMode': 'private'}),
+    Route('board-settings.partial-update', 'api/board-tasks/:board-settings-detail', 'patch', '/api/board-tasks/board-settings/1/',
+          body={'viewMode': 'public'}),
+    Route('board-settings.destroy', 'api/board-tasks/:board-settings-detail', 'delete',
+          lambda context: f'/api/board-tasks/board-settings/{context["prepared"]}/', prepare=create_board_settings),
+]
+
+
+def api_route_names():
+    """Returns '<include prefix>:<url name>' for every URL pattern under PREFIXES."""
+    names = set()
+
+    def walk(patterns, prefix):
+        for pattern in patterns:
+            if hasattr(pattern, 'url_patterns'):
+                walk(pattern.url_patterns, prefix + str(pattern.pattern))
+            elif pattern.name:
+                for include_prefix in PREFIXES:
+                    if prefix.startswith(include_prefix):
+                        names.add(f'{include_prefix}:{pattern.name}')
+
+    walk(get_resolver().url_patterns, '')
+    return names
+
+
+class Command(BaseCommand):
+    """
+    Seeds a deterministic dataset into a temporary database and drives every route under
+    api/auth/, api/contacts/ and api/board-tasks/ through the Django test client
+    (the full middleware and authentication stack).
+
+    Prints (or writes with --output) JSON with throughput, p50/p95/p99 latency and
+    queries per request for each route, so runs of two commits can be diffed.
+    The server-side response cache is bypassed unless --response-cache is given,
+    so repeated GETs measure the real query and serialization work.
+    """
+    help = 'Benchmarks every API route on a seeded temporary database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile', choices=sorted(PROFILES), default='small')
+        parser.add_argument('--tasks', type=int, help='Overrides the task count of the profile.')
+        parser.add_argument('--contacts', type=int, help='Overrides the contact count of the profile.')
+        parser.add_argument('--requests', type=int, default=50, help='Timed requests per route.')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--only', help='Comma-separated route name prefixes, e.g. tasks.,contacts.list')
+        parser.add_argument('--response-cache', action='store_true', help='Keep the server-side response cache enabled.')
+        parser.add_argument('--output', help='Write the JSON report to this file instead of stdout.')
+
+    def handle(self, *args, **options):
+        dataset = dict(PROFILES[options['profile']])
+        for name in ['tasks', 'contacts']:
+            if options[name] is not None:
+                dataset[name] = options[name]
+        routes = ROUTES
+        if options['only']:
+            prefixes = [prefix.strip() for prefix in options['only'].split(',') if prefix.strip()]
+            routes = [route for route in ROUTES if route.name.startswith(tuple(prefixes))]
+
+        overrides = {}
+        if not options['response_cache']:
+            overrides['API_RESPONSE_CACHE'] = {'ALIAS': 'benchmark-dummy'}
+            overrides['CACHES'] = {
+                'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+                'benchmark-dummy': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+            }
+
+        with temporary_database(), override_settings(**overrides):
+            started = time.perf_counter()
+            context = self.seed(dataset, options['seed'])
+            seed_seconds = round(time.perf_counter() - started, 2)
+            results = {}
+            for route in routes:
+                results[route.name] = self.run_route(route, context, options['requests'])
+                if options['verbosity'] > 1:
+                    self.stderr.write(f'{route.name}: {results[route.name]["p50_ms"]} ms p50')
+
+        covered = {route.route for route in ROUTES}
+        report = {
+            'meta': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+                'profile': options['profile'],
+                'dataset': dataset,
+                'seed': options['seed'],
+                'requestsPerRoute': options['requests'],
+                'responseCache': options['response_cache'],
+                'seedSeconds': seed_seconds,
+            },
+            'routes': results,
+            'uncoveredRoutes': sorted(api_route_names() - covered),
+        }
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as handle:
+                handle.write(output + '\n')
+        else:
+            self.stdout.write(output)
+
+    def seed(self, dataset, seed):
+        seed_dataset(tasks=dataset['tasks'], contacts=dataset['contacts'], seed=seed)
+        user = User.objects.create_user('benchmark@example.com', 'Benchmark', PASSWORD)
+        staff = User.objects.create_user('benchmark-staff@example.com', 'Staff', PASSWORD, is_staff=True)
+        BoardSettings.objects.get_or_create(userId='1')
+        ArchivedTask.objects.archive(Task.objects.filter(status='done', isPrivate=False).order_by('-id')[:ARCHIVED_TASKS])
+        task_ids = list(Task.objects.filter(isPrivate=False).order_by('id').values_list('id', flat=True)[:100])
+        subtask_task_id = Task.objects.filter(subtasks__key='1').order_by('id').values_list('id', flat=True).first()
+        column = list(Task.objects.column((False, ''), 'todo').order_by('rank', 'id').values_list('id', flat=True)[:3])
+        archived_ids = list(ArchivedTask.objects.order_by('id').values_list('id', flat=True)[:1])
+        if not task_ids or subtask_task_id is None or len(column) < 3 or not archived_ids:
+            raise CommandError('The dataset needs public tasks with subtasks, in "todo" and "done"; increase --tasks.')
+        return {
+            'tokens': {
+                'user': Token.objects.create(user=user).key,
+                'staff': Token.objects.create(user=staff).key,
+            },
+            'task_ids': task_ids,
+            'subtask_task_id': subtask_task_id,
+            'archived_ids': archived_ids,
+            # Moves the third task of a column between the first two, over and over.
+            'move': {'task': column[2], 'after': column[0], 'before': column[1]},
+            'contact_ids': list(Contact.objects.order_by('id').values_list('id', flat=True)[:100]),
+            'since': {
+                'tasks': CollectionVersion.objects.sequence(CollectionVersion.TASKS)[0],
+                'contacts': CollectionVersion.objects.sequence(CollectionVersion.CONTACTS)[0],
+            },
+            'counter': itertools.count(),
+            'now': timezone.now(),
+        }
+
+    def run_route(self, route, context, requests):
+        repeat = min(requests, route.repeat_cap or requests)
+        if route.method == 'stream':
+            return self.run_stream(route, context, repeat)
+        client = Client()
+        headers = {}
+        if route.auth:
+            headers['HTTP_AUTHORIZATION'] = f'Token {context["tokens"][route.auth]}'
+
+        def request():
+            context['prepared'] = route.prepare(context) if route.prepare else None
+            path = value(route.path, context)
+            body = value(route.body, context)
+            if body is None:
+                return lambda: getattr(client, route.method)(path, **headers)
+            return lambda: getattr(client, route.method)(path, data=json.dumps(body), content_type='application/json', **headers)
+
+        request()()  # warm-up (token cache, query plans)
+        durations, queries, statuses = [], [], set()
+        for _ in range(repeat):
+            send = request()
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = send()
+                if response.streaming:
+                    # Exports render while streaming: the body is part of the request.
+                    for _ in response.streaming_content:
+                        pass
+                durations.append(time.perf_counter() - started)
+            queries.append(len(captured.captured_queries))
+            statuses.add(response.status_code)
+        return {
+            'method': route.method.upper(),
+            'path': value(route.path, dict(context, prepared='<id>')),
+            'status': sorted(statuses),
+            **summarize(durations),
+            'queries_per_request': round(sum(queries) / len(queries), 2),
+        }
+
+    def run_stream(self, route, context, repeat):
+        """
+        Measures the time until the stream delivered its handshake (retry + cursor).
+        """
+        async def connect():
+            client = AsyncClient()
+            response = await client.get(
+                route.path, headers={'Authorization': f'Token {context["tokens"][route.auth]}'}
+            )
+            chunks = response.streaming_content.__aiter__()
+            await chunks.__anext__()
+            await chunks.__anext__()
+            await chunks.aclose()
+            return response.status_code
+
+        durations, statuses = [], set()
+        asyncio.run(connect())
+        for _ in range(repeat):
+            started = time.perf_counter()
+            statuses.add(asyncio.run(connect()))
+            durations.append(time.perf_counter() - started)
+        return {
+            'method': 'GET',
+            'path': route.path,
+            'status': sorted(statuses),
+            **summarize(durations),
+            'queries_per_request': None,
+        }
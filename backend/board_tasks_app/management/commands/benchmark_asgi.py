@@ -0,0 +1,192 @@
+import asyncio
+import json
+import os
+import platform
+import tempfile
+import threading
+import time
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncClient, Client, override_settings
+from rest_framework.authtoken.models import Token
+from board_tasks_app.models import Task, BoardSettings
+from contacts_app.models import Contact
+from core.benchmark import seed_dataset, summarize, temporary_database
+from user_auth_app.models import User
+from .stress_writes import apply_profile
+
+# How each mode serves the API: the WSGI handler with the sync viewsets (one thread per
+# client, like a threaded WSGI server), or the ASGI handler on one event loop with the
+# sync viewsets (run through sync_to_async) or the async viewsets (core/urls_async.py).
+MODES = {
+    'wsgi': 'core.urls',
+    'asgi-sync-views': 'core.urls',
+    'asgi': 'core.urls_async',
+}
+# The request mix every client cycles through (reads; the async viewsets run writes
+# through the sync implementation).
+MIX = [
+    lambda context: '/api/board-tasks/tasks/?viewMode=public&pageSize=50',
+    lambda context: f'/api/board-tasks/tasks/{context["task_ids"][0]}/',
+    lambda context: '/api/board-tasks/tasks/?viewMode=private&userId=1&fields=title,status,priority,rank',
+    lambda context: f'/api/contacts/{context["contact_ids"][0]}/',
+    lambda context: '/api/contacts/',
+    lambda context: '/api/board-tasks/board-settings/1/',
+]
+
+
+class WsgiClient(threading.Thread):
+    """One client thread with its own Client and database connection."""
+    def __init__(self, paths, token):
+        super().__init__()
+        self.paths = paths
+        self.headers = {'HTTP_AUTHORIZATION': f'Token {token}'}
+        self.durations = []
+        self.errors = []
+
+    def run(self):
+        client = Client()
+        try:
+            for path in self.paths:
+                started = time.perf_counter()
+                response = client.get(path, **self.headers)
+                self.durations.append(time.perf_counter() - started)
+                if response.status_code >= 400:
+                    self.errors.append(f'{response.status_code} {path}')
+        finally:
+            connections.close_all()
+
+
+async def asgi_client(paths, token, durations, errors):
+    """One client coroutine; all of them share the event loop."""
+    client = AsyncClient()
+    headers = {'Authorization': f'Token {token}'}
+    for path in paths:
+        started = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        durations.append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            errors.append(f'{response.status_code} {path}')
+
+
+class Command(BaseCommand):
+    """
+    Side-by-side benchmark of the API under WSGI and ASGI at high concurrency:
+    `--concurrency` clients each send `--requests` GETs (a mix of task, contact and
+    board settings reads) against a seeded temporary on-disk database, once per mode:
+
+    - wsgi: the WSGI handler and the sync viewsets, one thread per client;
+    - asgi-sync-views: the ASGI handler with the sync viewsets, all clients on one event loop;
+    - asgi: the ASGI handler with the async viewsets (core/urls_async.py).
+
+    Requests go through the full handler, middleware and authentication stack of each
+    interface (Django's test clients; no network or server process, so the numbers
+    compare the application side only). Reports wall-clock throughput and p50/p95/p99
+    latency per mode as JSON; exits with status 1 if any request failed.
+    The server-side response cache is bypassed unless --response-cache is given.
+    """
+    help = 'Benchmarks the API under WSGI and ASGI with many concurrent clients.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=64, help='Concurrent clients.')
+        parser.add_argument('--requests', type=int, default=30, help='Requests per client.')
+        parser.add_argument('--tasks', type=int, default=1000)
+        parser.add_argument('--contacts', type=int, default=200)
+        parser.add_argument('--modes', default=','.join(MODES), help=f'Comma-separated, from: {", ".join(MODES)}.')
+        parser.add_argument('--response-cache', action='store_true', help='Keep the server-side response cache enabled.')
+
+    def handle(self, *args, **options):
+        if connections['default'].vendor != 'sqlite':
+            raise CommandError('benchmark_asgi only supports SQLite databases.')
+        modes = [mode.strip() for mode in options['modes'].split(',') if mode.strip()]
+        unknown = sorted(set(modes) - set(MODES))
+        if unknown:
+            raise CommandError(f'Unknown modes: {", ".join(unknown)}.')
+        overrides = {'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}}
+        if not options['response_cache']:
+            overrides['API_RESPONSE_CACHE'] = {'ALIAS': 'benchmark-dummy'}
+            overrides['CACHES']['benchmark-dummy'] = {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+
+        results = {}
+        with tempfile.TemporaryDirectory() as directory:
+            name = os.path.join(directory, 'benchmark.sqlite3')
+            apply_profile('production', name)
+            with temporary_database(name=name), override_settings(**overrides):
+                context = self.seed(options['tasks'], options['contacts'])
+                connections.close_all()
+                for mode in modes:
+                    with override_settings(ROOT_URLCONF=MODES[mode]):
+                        results[mode] = self.run_mode(mode, context, options['concurrency'], options['requests'])
+                    if options['verbosity'] > 1:
+                        self.stderr.write(f'{mode}: {results[mode]["wall_rps"]} req/s, {results[mode]["p99_ms"]} ms p99')
+
+        report = {
+            'meta': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'dataset': {'tasks': options['tasks'], 'contacts': options['contacts']},
+                'concurrency': options['concurrency'],
+                'requestsPerClient': options['requests'],
+                'responseCache': options['response_cache'],
+            },
+            'modes': results,
+        }
+        errors = []
+        for result in results.values():
+            result['failedRequests'] = len(result['errors'])
+            errors += result.pop('errors')
+        self.stdout.write(json.dumps(report, indent=2))
+        if errors:
+            raise CommandError(f'{len(errors)} failed requests ({", ".join(sorted(set(errors))[:5])}).')
+
+    def seed(self, tasks, contacts):
+        seed_dataset(tasks=tasks, contacts=contacts)
+        BoardSettings.objects.get_or_create(userId='1')
+        user = User.objects.create_user('benchmark@example.com', 'Benchmark', 'benchmark-password')
+        return {
+            'token': Token.objects.create(user=user).key,
+            'task_ids': list(Task.objects.filter(isPrivate=False).order_by('id').values_list('id', flat=True)[:1]),
+            'contact_ids': list(Contact.objects.order_by('id').values_list('id', flat=True)[:1]),
+        }
+
+    def client_paths(self, context, client, requests):
+        paths = [path(context) for path in MIX]
+        return [paths[(client + index) % len(paths)] for index in range(requests)]
+
+    def run_mode(self, mode, context, concurrency, requests):
+        plans = [self.client_paths(context, client, requests) for client in range(concurrency)]
+        # Warm-up (token cache, URL resolver, query plans), untimed.
+        warmup = self.client_paths(context, 0, len(MIX))
+        if mode == 'wsgi':
+            WsgiClient(warmup, context['token']).run()
+            clients = [WsgiClient(paths, context['token']) for paths in plans]
+            started = time.perf_counter()
+            for client in clients:
+                client.start()
+            for client in clients:
+                client.join()
+            elapsed = time.perf_counter() - started
+            durations = [duration for client in clients for duration in client.durations]
+            errors = [error for client in clients for error in client.errors]
+        else:
+            durations, errors = [], []
+
+            async def run():
+                await asgi_client(warmup, context['token'], [], errors)
+                started = time.perf_counter()
+                await asyncio.gather(*(asgi_client(paths, context['token'], durations, errors) for paths in plans))
+                return time.perf_counter() - started
+
+            elapsed = asyncio.run(run())
+            connections.close_all()
+        latency = summarize(durations)
+        # Latencies overlap, so throughput is requests per wall-clock second.
+        del latency['throughput_rps']
+        return {
+            'seconds': round(elapsed, 2),
+            'wall_rps': round(len(durations) / elapsed, 2),
+            **latency,
+            'errors': errors,
+        }
@@ -0,0 +1,86 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+from board_tasks_app.api.views import TaskViewSet
+from contacts_app.api.views import ContactViewSet
+from core.benchmark import measure, seed_dataset, summarize, temporary_database
+from user_auth_app.models import User
+
+CASES = [
+    ('tasks-public', TaskViewSet, '/api/board-tasks/tasks/', {'viewMode': 'public'}),
+    ('tasks-private', TaskViewSet, '/api/board-tasks/tasks/', {'viewMode': 'private', 'userId': '1'}),
+    ('tasks-fields', TaskViewSet, '/api/board-tasks/tasks/', {'fields': 'title,status,priority,rank,dueDate'}),
+    ('tasks-counts', TaskViewSet, '/api/board-tasks/tasks/', {'subtasks': 'counts'}),
+    ('tasks-page', TaskViewSet, '/api/board-tasks/tasks/', {'pageSize': '500'}),
+    ('contacts', ContactViewSet, '/api/contacts/', {}),
+]
+
+
+def legacy_viewset(viewset):
+    """
+    Returns the viewset as it was before the values() read path: serializer-based list,
+    stdlib JSON renderer, no server-side response cache.
+    """
+    return type(f'Legacy{viewset.__name__}', (viewset,), {
+        'list_reader_class': None,
+        'renderer_classes': [JSONRenderer],
+        'cached_actions': [],
+    })
+
+
+def fast_viewset(viewset):
+    return type(f'Fast{viewset.__name__}', (viewset,), {'cached_actions': []})
+
+
+class Command(BaseCommand):
+    """
+    Compares the serializer-based list path with the values() read path
+    (ValuesListReader + FastJSONRenderer) on a seeded temporary database.
+    Fails when a response differs by a single byte; prints JSON timings otherwise.
+    """
+    help = 'Benchmarks the task/contact list read path against the serializer path.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=5000)
+        parser.add_argument('--contacts', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=10)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        with temporary_database():
+            seed_dataset(tasks=options['tasks'], contacts=options['contacts'], seed=options['seed'])
+            user = User.objects.create_user('benchmark@example.com', 'Benchmark', 'benchmark')
+            results = {
+                'dataset': {'tasks': options['tasks'], 'contacts': options['contacts'], 'seed': options['seed']},
+                'cases': {},
+            }
+            for name, viewset, path, params in CASES:
+                results['cases'][name] = self.run_case(viewset, path, params, user, options['repeat'])
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def run_case(self, viewset, path, params, user, repeat):
+        factory = APIRequestFactory()
+
+        def call(view):
+            request = factory.get(path, params, HTTP_ACCEPT='application/json')
+            force_authenticate(request, user=user)
+            response = view(request)
+            response.render()
+            return response.content
+
+        legacy = legacy_viewset(viewset).as_view({'get': 'list'})
+        fast = fast_viewset(viewset).as_view({'get': 'list'})
+        legacy_body, fast_body = call(legacy), call(fast)
+        if legacy_body != fast_body:
+            raise CommandError(f'{path}?{params}: read path output differs from the serializer output')
+        legacy_stats = summarize(measure(lambda: call(legacy), repeat))
+        fast_stats = summarize(measure(lambda: call(fast), repeat))
+        return {
+            'bytes': len(fast_body),
+            'identical': True,
+            'serializer': legacy_stats,
+            'values': fast_stats,
+            'speedup_p50': round(legacy_stats['p50_ms'] / fast_stats['p50_ms'], 2) if fast_stats['p50_ms'] else None,
+        }
@@ -0,0 +1,101 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from board_tasks_app.models import BoardSettings
+from core.benchmark import seed_dataset, temporary_database
+from .export_ndjson import export_collection
+from .import_ndjson import IMPORTERS
+
+# Contacts first: the task import drops assignees that do not exist (yet).
+ORDER = ['contacts', 'tasks', 'board-settings']
+
+
+class Command(BaseCommand):
+    """
+    Round trip of the NDJSON export / import on seeded temporary databases: exports
+    every collection to files, imports them into a second, empty database and exports
+    that again. Fails unless both exports are byte-identical and the board summary of
+    the imported tasks is consistent; prints JSON timings (records per second) otherwise.
+
+    --trace-memory reports the peak Python allocation of each phase (tracemalloc, which
+    slows the run down), to check that memory stays flat as the dataset grows.
+    """
+    help = 'Benchmarks the NDJSON export and import of tasks, contacts and board settings.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=100000)
+        parser.add_argument('--contacts', type=int, default=1000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--chunk-size', type=int, help='Records written per import transaction.')
+        parser.add_argument('--trace-memory', action='store_true', help='Report peak allocations (tracemalloc).')
+
+    def handle(self, *args, **options):
+        results = {
+            'dataset': {'tasks': options['tasks'], 'contacts': options['contacts'], 'seed': options['seed']},
+            'export': {},
+            'import': {},
+            'reexport': {},
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            paths = {name: os.path.join(directory, f'{name}.ndjson') for name in ORDER}
+            with temporary_database():
+                owner_ids = seed_dataset(tasks=options['tasks'], contacts=options['contacts'], seed=options['seed'])
+                BoardSettings.objects.bulk_create([BoardSettings(userId=owner_id) for owner_id in owner_ids])
+                for name in ORDER:
+                    results['export'][name] = self.measure(options, lambda: self.export(name, paths[name]))
+            with temporary_database():
+                for name in ORDER:
+                    results['import'][name] = self.measure(options, lambda: self.load(name, paths[name], options))
+                for name in ORDER:
+                    results['reexport'][name] = self.measure(options, lambda: self.export(name, paths[name] + '.2'))
+                call_command('rebuild_board_summary', '--check', stdout=io.StringIO())
+            for name in ORDER:
+                results['export'][name]['sha256'] = digest(paths[name])
+                results['export'][name]['bytes'] = os.path.getsize(paths[name])
+                results['reexport'][name]['sha256'] = digest(paths[name] + '.2')
+        self.stdout.write(json.dumps(results, indent=2))
+        differing = [name for name in ORDER if results['export'][name]['sha256'] != results['reexport'][name]['sha256']]
+        if differing:
+            raise CommandError(f'Round trip changed {", ".join(differing)}.')
+
+    def export(self, name, path):
+        with open(path, 'wb') as stream:
+            return export_collection(name, stream)
+
+    def load(self, name, path, options):
+        with open(path, 'rb') as lines:
+            report = IMPORTERS[name](chunk_size=options['chunk_size']).run(lines).get_report()
+        if report['skipped']:
+            raise CommandError(f'Import of {name} skipped {report["skipped"]} line(s): {report["errors"][:3]}')
+        return report['imported']
+
+    def measure(self, options, func):
+        if options['trace_memory']:
+            tracemalloc.start()
+        started = time.perf_counter()
+        count = func()
+        elapsed = time.perf_counter() - started
+        result = {
+            'records': count,
+            'seconds': round(elapsed, 2),
+            'records_per_second': round(count / elapsed) if elapsed else None,
+        }
+        if options['trace_memory']:
+            result['peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 1)
+            tracemalloc.stop()
+        return result
+
+
+def digest(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as stream:
+        for block in iter(lambda: stream.read(2 ** 20), b''):
+            sha.update(block)
+    return sha.hexdigest()
@@ -0,0 +1,53 @@
+import contextlib
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+from board_tasks_app.api.readers import BoardSettingsExportReader, TaskExportReader
+from board_tasks_app.models import BoardSettings, Task
+from contacts_app.api.readers import ContactExportReader
+from contacts_app.models import Contact
+from core.ndjson import export_lines, export_records
+
+COLLECTIONS = {
+    'tasks': (Task, TaskExportReader),
+    'contacts': (Contact, ContactExportReader),
+    'board-settings': (BoardSettings, BoardSettingsExportReader),
+}
+
+
+def export_collection(name, stream, chunk_size=2000):
+    """Writes every record of the collection to the binary `stream`; returns the record count."""
+    model, reader_class = COLLECTIONS[name]
+    count = 0
+    for line in export_lines(export_records(reader_class(), model.objects.order_by('pk'), chunk_size=chunk_size)):
+        stream.write(line)
+        count += 1
+    return count
+
+
+class Command(BaseCommand):
+    """
+    Exports all tasks, contacts or board settings as NDJSON (one record per line, in id
+    order, the same lines as GET .../export/ without the view mode filter). Rows are read
+    with QuerySet.iterator() in chunks of --chunk-size, so memory stays flat for any table
+    size. Archived tasks are not exported. Restore with import_ndjson.
+    """
+    help = 'Streams a collection as NDJSON to a file or stdout.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('collection', choices=list(COLLECTIONS))
+        parser.add_argument('-o', '--output', help='File to write (default: stdout).')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows fetched per query.')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        with contextlib.ExitStack() as stack:
+            if options['output']:
+                stream = stack.enter_context(open(options['output'], 'wb'))
+            else:
+                self.stdout.flush()
+                stream = sys.stdout.buffer
+            count = export_collection(options['collection'], stream, chunk_size=options['chunk_size'])
+            stream.flush()
+        self.stderr.write(f'Exported {count} {options["collection"]} record(s) in {time.perf_counter() - started:.2f} s.')
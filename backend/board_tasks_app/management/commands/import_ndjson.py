@@ -0,0 +1,45 @@
+import contextlib
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from board_tasks_app.api.importers import BoardSettingsImporter, TaskImporter
+from contacts_app.api.importers import ContactImporter
+
+IMPORTERS = {
+    'tasks': TaskImporter,
+    'contacts': ContactImporter,
+    'board-settings': BoardSettingsImporter,
+}
+
+
+class Command(BaseCommand):
+    """
+    Imports an NDJSON export (export_ndjson or GET .../export/) of tasks, contacts or
+    board settings. Every line is validated with the collection's API serializer; valid
+    records are written with bulk INSERTs in one transaction per --chunk-size records,
+    so memory stays flat for any file size. Ids (and task ranks) are kept: import the
+    contacts before the tasks that are assigned to them.
+
+    Invalid lines and records whose id already exists are skipped; prints a JSON report
+    and exits with status 1 if any line was skipped.
+    """
+    help = 'Imports a collection from an NDJSON file (or - for stdin).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('collection', choices=list(IMPORTERS))
+        parser.add_argument('path', help='NDJSON file to read, - for stdin.')
+        parser.add_argument('--chunk-size', type=int, help='Records written per transaction.')
+
+    def handle(self, *args, **options):
+        importer = IMPORTERS[options['collection']](chunk_size=options['chunk_size'])
+        with contextlib.ExitStack() as stack:
+            if options['path'] == '-':
+                lines = sys.stdin.buffer
+            else:
+                lines = stack.enter_context(open(options['path'], 'rb'))
+            importer.run(lines)
+        report = importer.get_report()
+        self.stdout.write(json.dumps(report, indent=2))
+        if report['skipped']:
+            raise CommandError(f'Skipped {report["skipped"]} line(s).')
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db.models.functions import Length
+from board_tasks_app.models import RANK_REBALANCE_LENGTH, Task
+
+
+class Command(BaseCommand):
+    """
+    Rewrites the rank keys of every column holding a key longer than --max-length
+    (or of all columns with --all) evenly spaced, keeping the order. Moves already
+    rebalance their column in the background; this catches up after bulk writes or
+    restarts and can run periodically.
+    """
+    help = 'Rebalances the rank keys of task columns.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-length', type=int, default=RANK_REBALANCE_LENGTH,
+                            help='Rebalance columns with a key longer than this.')
+        parser.add_argument('--all', action='store_true', help='Rebalance every column.')
+
+    def handle(self, *args, **options):
+        tasks = Task.objects.all()
+        if not options['all']:
+            tasks = tasks.annotate(rank_length=Length('rank')).filter(rank_length__gt=options['max_length'])
+        columns = set()
+        for is_private, owner_id, status in tasks.values_list('isPrivate', 'ownerId', 'status').distinct():
+            board = (True, owner_id or '') if is_private else (False, '')
+            columns.add((board, status))
+        for board, status in sorted(columns):
+            count = Task.objects.rebalance(board, status)
+            if options['verbosity'] > 1:
+                self.stdout.write(f'{board} {status}: {count} tasks')
+        self.stdout.write(f'Rebalanced {len(columns)} column(s).')
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from board_tasks_app.models import BoardSummary
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the board summary counters (BoardSummary) from the task table, e.g. after
+    writes that bypassed the model signals (raw SQL, fixtures, restored backups).
+    Lists the boards whose stored counters differed; --check only reports them.
+    """
+    help = 'Recomputes the board summary counters from the tasks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help='Only report drift; exit with status 1 if there is any.')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            expected = BoardSummary.objects.compute()
+            stored = {(summary.isPrivate, summary.ownerId): summary for summary in BoardSummary.objects.all()}
+            drifted = sorted(board for board in expected.keys() | stored.keys()
+                             if self.describe(expected.get(board)) != self.describe(stored.get(board)))
+            for board in drifted:
+                self.stdout.write(
+                    f'{self.board_label(board)}: stored {self.describe(stored.get(board))}, '
+                    f'expected {self.describe(expected.get(board))}'
+                )
+            if options['check']:
+                if drifted:
+                    self.stderr.write(f'{len(drifted)} of {len(expected)} boards drifted.')
+                    raise SystemExit(1)
+                self.stdout.write(self.style.SUCCESS(f'{len(expected)} boards up to date.'))
+                return
+            count = BoardSummary.objects.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {count} boards ({len(drifted)} had drifted).'))
+
+    def describe(self, summary):
+        """Comparable counters; a missing row counts as an empty board."""
+        if summary is None:
+            summary = BoardSummary()
+        return {
+            **{name: getattr(summary, name) for name in BoardSummary.objects.COUNTERS},
+            'nextDeadline': summary.nextDeadline.isoformat() if summary.nextDeadline else None,
+        }
+
+    def board_label(self, board):
+        is_private, owner_id = board
+        return f'private board of {owner_id!r}' if is_private else 'public board'
@@ -0,0 +1,183 @@
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections
+from django.test import Client, override_settings
+from rest_framework.authtoken.models import Token
+from board_tasks_app.models import Task
+from core.benchmark import summarize, temporary_database
+from core.sqlite import sqlite_database
+from user_auth_app.models import User
+
+TASKS_URL = '/api/board-tasks/tasks/'
+
+
+def apply_profile(profile, name):
+    """
+    Switches the default connection to the given SQLite profile (core.sqlite) for the
+    rest of the process; connections opened afterwards, in any thread, use it.
+    """
+    database = connections.settings['default']
+    configured = sqlite_database(name, profile=profile)
+    database['OPTIONS'] = configured.get('OPTIONS', {})
+    database['CONN_MAX_AGE'] = configured.get('CONN_MAX_AGE', 0)
+    database['CONN_HEALTH_CHECKS'] = configured.get('CONN_HEALTH_CHECKS', False)
+    connections['default'].close()
+
+
+@contextlib.contextmanager
+def silenced_logger(name):
+    """Disables the logger `name` for the block."""
+    logger = logging.getLogger(name)
+    disabled, logger.disabled = logger.disabled, True
+    try:
+        yield
+    finally:
+        logger.disabled = disabled
+
+
+class Worker(threading.Thread):
+    """
+    One client thread with its own Client and database connection. Writers create,
+    update and delete tasks; readers list the public board.
+    """
+    def __init__(self, token, requests, write):
+        super().__init__()
+        self.headers = {'HTTP_AUTHORIZATION': f'Token {token}'}
+        self.requests = requests
+        self.write = write
+        self.durations = []
+        self.locked = 0
+        self.errors = []
+
+    def run(self):
+        client = Client()
+        try:
+            for index in range(self.requests):
+                if self.write:
+                    self.write_cycle(client, index)
+                else:
+                    self.send(client.get, f'{TASKS_URL}?viewMode=public&pageSize=50')
+        finally:
+            connections.close_all()
+
+    def write_cycle(self, client, index):
+        payload = {
+            'title': f'Stress {self.name} {index}',
+            'description': 'Created by stress_writes',
+            'dueDate': '2026-06-01T00:00:00Z',
+            'createdAt': '2026-01-01T00:00:00Z',
+            'priority': 'urgent' if index % 3 == 0 else 'medium',
+            'category': 'Technical Task',
+            'status': 'todo',
+            'subtasks': [{'id': '1', 'title': 'Step 1', 'completed': False}],
+            'isPrivate': False,
+        }
+        response = self.send(client.post, TASKS_URL, payload)
+        if response is None or response.status_code != 201:
+            return
+        # The create response carries no id; look it up (untimed) by the unique title.
+        task_id = Task.objects.filter(title=payload['title']).values_list('id', flat=True).get()
+        detail = f'{TASKS_URL}{task_id}/'
+        self.send(client.patch, detail, {'status': 'inprogress', 'priority': 'low'})
+        self.send(client.delete, detail)
+
+    def send(self, method, path, body=None):
+        kwargs = dict(self.headers)
+        if body is not None:
+            kwargs.update(data=json.dumps(body), content_type='application/json')
+        started = time.perf_counter()
+        try:
+            response = method(path, **kwargs)
+        except OperationalError as error:
+            if 'locked' not in str(error):
+                raise
+            self.locked += 1
+            return None
+        finally:
+            self.durations.append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.errors.append(f'{response.status_code} {path}')
+        return response
+
+
+class Command(BaseCommand):
+    """
+    Concurrency stress test for the SQLite profiles: parallel writer threads drive
+    TaskViewSet create / partial_update / destroy (plus optional reader threads listing
+    the board) through the full middleware stack against a temporary on-disk database.
+
+    Reports "database is locked" errors, failed (4xx/5xx) responses and latency
+    percentiles as JSON; exits with status 1 if any request failed. Compare e.g.
+    `--profile development` with `--profile production [--serialized-writes]`.
+    """
+    help = 'Runs parallel TaskViewSet writers against a temporary SQLite database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile', choices=['development', 'production'], default='production')
+        parser.add_argument('--writers', type=int, default=8, help='Writer threads.')
+        parser.add_argument('--readers', type=int, default=2, help='Reader threads.')
+        parser.add_argument('--requests', type=int, default=25, help='Write cycles (or list requests) per thread.')
+        parser.add_argument('--serialized-writes', action='store_true',
+                            help='Enable SerializedWriteMiddleware (DATABASE_WRITE_QUEUE).')
+
+    def handle(self, *args, **options):
+        if connections['default'].vendor != 'sqlite':
+            raise CommandError('stress_writes only supports SQLite databases.')
+        overrides = {
+            'DATABASE_WRITE_QUEUE': {'ENABLED': options['serialized_writes'], 'QUEUE_SIZE': 256, 'RETRY_AFTER_SECONDS': 1},
+            'API_RESPONSE_CACHE': {'ALIAS': 'stress-dummy'},
+            'CACHES': {
+                'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+                'stress-dummy': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+            },
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            name = os.path.join(directory, 'stress.sqlite3')
+            apply_profile(options['profile'], name)
+            # Failed requests are counted in the report; their logged tracebacks (e.g. the
+            # 500s of the development profile) would bury it.
+            with temporary_database(name=name), override_settings(**overrides), silenced_logger('django.request'):
+                token = Token.objects.create(user=User.objects.create_user('stress@example.com', 'Stress', 'stress-password')).key
+                connections.close_all()
+                workers = (
+                    [Worker(token, options['requests'], write=True) for _ in range(options['writers'])]
+                    + [Worker(token, options['requests'], write=False) for _ in range(options['readers'])]
+                )
+                started = time.perf_counter()
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+                elapsed = time.perf_counter() - started
+                journal_mode = connections['default'].cursor().execute('PRAGMA journal_mode').fetchone()[0]
+
+        writers = [worker for worker in workers if worker.write]
+        readers = [worker for worker in workers if not worker.write]
+        locked = sum(worker.locked for worker in workers)
+        errors = [error for worker in workers for error in worker.errors]
+        report = {
+            'meta': {
+                'profile': options['profile'],
+                'journalMode': journal_mode,
+                'serializedWrites': options['serialized_writes'],
+                'writers': options['writers'],
+                'readers': options['readers'],
+                'requestsPerThread': options['requests'],
+                'seconds': round(elapsed, 2),
+            },
+            'databaseLocked': locked,
+            'failedRequests': len(errors),
+            'writes': summarize([duration for worker in writers for duration in worker.durations]),
+        }
+        if readers:
+            report['reads'] = summarize([duration for worker in readers for duration in worker.durations])
+        self.stdout.write(json.dumps(report, indent=2))
+        if locked or errors:
+            raise CommandError(f'{locked} "database is locked" errors, {len(errors)} failed requests ({", ".join(sorted(set(errors))[:5])}).')
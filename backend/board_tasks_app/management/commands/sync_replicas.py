@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from core.routers import get_replicas
+from core.sqlite import copy_database
+
+
+class Command(BaseCommand):
+    """
+    Copies the primary SQLite database into every read replica
+    (DATABASE_REPLICATION['REPLICAS']). Stands in for real replication on single-host
+    deployments and in the local primary/replica setup; --interval keeps it running.
+    """
+    help = 'Copies the primary database into the read replicas.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, help='Repeat every INTERVAL seconds until interrupted.')
+
+    def handle(self, *args, **options):
+        replicas = get_replicas()
+        if not replicas:
+            raise CommandError('No replicas configured (DATABASE_REPLICAS).')
+        while True:
+            for alias in replicas:
+                started = time.perf_counter()
+                copy_database('default', alias)
+                if options['verbosity'] > 1:
+                    self.stdout.write(f'{alias}: {(time.perf_counter() - started) * 1000:.1f} ms')
+            connections.close_all()
+            if options['interval'] is None:
+                break
+            time.sleep(options['interval'])
+        self.stdout.write(f'Synced {len(replicas)} replica(s).')
@@ -0,0 +1,195 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:00
+
+import datetime
+import sys
+
+from django.db import migrations, models
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+LEGACY_DATE_FORMATS = ['%d/%m/%Y', '%d.%m.%Y', '%Y/%m/%d', '%m/%d/%Y']
+
+
+def parse_legacy_datetime(value):
+    """
+    Parses the string values stored before the datetime migration.
+    Accepts ISO datetimes (with or without offset / "Z"), ISO dates and the
+    DD/MM/YYYY style used by the add-task form. Returns None for anything else.
+    """
+    value = (value or '').strip()
+    if not value:
+        return None
+    parsed = None
+    try:
+        parsed = parse_datetime(value)
+    except ValueError:
+        pass
+    if parsed is None:
+        try:
+            date = parse_date(value)
+        except ValueError:
+            date = None
+        if date is None:
+            for fmt in LEGACY_DATE_FORMATS:
+                try:
+                    date = datetime.datetime.strptime(value, fmt).date()
+                    break
+                except ValueError:
+                    continue
+        if date is None:
+            return None
+        parsed = datetime.datetime.combine(date, datetime.time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, datetime.timezone.utc)
+    return parsed
+
+
+def backfill_datetimes(apps, schema_editor):
+    """
+    Converts the string columns. Values that cannot be parsed fall back (dueDate and
+    updatedAt to NULL, createdAt to the migration time); every affected task is written
+    to stdout with its raw values, so the dates can be fixed by hand.
+    """
+    Task = apps.get_model('board_tasks_app', 'Task')
+    now = timezone.now()
+    fallbacks = []
+    batch = []
+    for task in Task.objects.only('dueDate', 'createdAt', 'updatedAt').iterator(chunk_size=2000):
+        task.dueDateValue = parse_legacy_datetime(task.dueDate)
+        task.createdAtValue = parse_legacy_datetime(task.createdAt)
+        task.updatedAtValue = parse_legacy_datetime(task.updatedAt)
+        failed = {
+            name: getattr(task, name)
+            for name in ['dueDate', 'createdAt', 'updatedAt']
+            if getattr(task, f'{name}Value') is None and (getattr(task, name) or '').strip()
+        }
+        if task.createdAtValue is None:
+            task.createdAtValue = now
+            failed.setdefault('createdAt', task.createdAt)
+        if failed:
+            fallbacks.append((task.pk, failed))
+        batch.append(task)
+        if len(batch) >= 2000:
+            Task.objects.bulk_update(batch, ['dueDateValue', 'createdAtValue', 'updatedAtValue'])
+            batch = []
+    if batch:
+        Task.objects.bulk_update(batch, ['dueDateValue', 'createdAtValue', 'updatedAtValue'])
+    if fallbacks:
+        sys.stdout.write(
+            f'\n  {len(fallbacks)} task(s) with unparseable dates (dueDate/updatedAt set to NULL, '
+            f'createdAt to {now.isoformat()}):\n'
+        )
+        for pk, failed in fallbacks:
+            values = ', '.join(f'{name}={value!r}' for name, value in failed.items())
+            sys.stdout.write(f'    task {pk}: {values}\n')
+
+
+def format_legacy_datetime(value, date_only=False):
+    """The string stored before the migration: an ISO date, or an ISO timestamp as sent by the frontend."""
+    if value is None:
+        return None
+    value = value.astimezone(datetime.timezone.utc)
+    if date_only and value.time() == datetime.time.min:
+        return value.date().isoformat()
+    return value.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def restore_strings(apps, schema_editor):
+    Task = apps.get_model('board_tasks_app', 'Task')
+    batch = []
+    for task in Task.objects.only('dueDateValue', 'createdAtValue', 'updatedAtValue').iterator(chunk_size=2000):
+        task.dueDate = format_legacy_datetime(task.dueDateValue, date_only=True) or ''
+        task.createdAt = format_legacy_datetime(task.createdAtValue) or ''
+        task.updatedAt = format_legacy_datetime(task.updatedAtValue)
+        batch.append(task)
+        if len(batch) >= 2000:
+            Task.objects.bulk_update(batch, ['dueDate', 'createdAt', 'updatedAt'])
+            batch = []
+    if batch:
+        Task.objects.bulk_update(batch, ['dueDate', 'createdAt', 'updatedAt'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_tasks_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='dueDateValue',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='createdAtValue',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='updatedAtValue',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_datetimes, restore_strings),
+        # Defaults for the string columns, so migrating back can re-add them to existing
+        # rows (filled by restore_strings right after).
+        migrations.AlterField(
+            model_name='task',
+            name='dueDate',
+            field=models.CharField(default='', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='createdAt',
+            field=models.CharField(default='', max_length=50),
+        ),
+        migrations.RemoveField(
+            model_name='task',
+            name='dueDate',
+        ),
+        migrations.RemoveField(
+            model_name='task',
+            name='createdAt',
+        ),
+        migrations.RemoveField(
+            model_name='task',
+            name='updatedAt',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='dueDateValue',
+            new_name='dueDate',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='createdAtValue',
+            new_name='createdAt',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='updatedAtValue',
+            new_name='updatedAt',
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='createdAt',
+            field=models.DateTimeField(),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['isPrivate', 'ownerId', 'status', 'order'], name='task_private_board_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['isPrivate', 'status', 'order'], name='task_public_board_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['isPrivate', 'ownerId', 'dueDate'], name='task_private_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['isPrivate', 'dueDate'], name='task_public_due_idx'),
+        ),
+    ]
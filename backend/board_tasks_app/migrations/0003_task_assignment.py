@@ -0,0 +1,86 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_assigned_to(apps, schema_editor):
+    """
+    Copies the assignedTo JSON lists into TaskAssignment rows.
+    Entries that are not contact ids of existing contacts are dropped.
+    """
+    Task = apps.get_model('board_tasks_app', 'Task')
+    Contact = apps.get_model('contacts_app', 'Contact')
+    TaskAssignment = apps.get_model('board_tasks_app', 'TaskAssignment')
+    contact_ids = set(Contact.objects.values_list('id', flat=True))
+    rows = []
+    for task_id, assigned_to in Task.objects.values_list('id', 'assignedTo').iterator(chunk_size=2000):
+        seen = set()
+        for value in assigned_to or []:
+            try:
+                contact_id = int(value)
+            except (TypeError, ValueError):
+                continue
+            if contact_id in contact_ids and contact_id not in seen:
+                seen.add(contact_id)
+                rows.append(TaskAssignment(task_id=task_id, contact_id=contact_id, position=len(seen) - 1))
+        if len(rows) >= 2000:
+            TaskAssignment.objects.bulk_create(rows)
+            rows = []
+    TaskAssignment.objects.bulk_create(rows)
+
+
+def restore_assigned_to(apps, schema_editor):
+    """Writes the assignments back into the assignedTo JSON lists: contact ids as strings, in position order."""
+    Task = apps.get_model('board_tasks_app', 'Task')
+    TaskAssignment = apps.get_model('board_tasks_app', 'TaskAssignment')
+    assigned_to = {}
+    rows = TaskAssignment.objects.order_by('task_id', 'position', 'id').values_list('task_id', 'contact_id')
+    for task_id, contact_id in rows.iterator(chunk_size=2000):
+        assigned_to.setdefault(task_id, []).append(str(contact_id))
+    batch = []
+    for task in Task.objects.only('id').iterator(chunk_size=2000):
+        task.assignedTo = assigned_to.get(task.id, [])
+        batch.append(task)
+        if len(batch) >= 2000:
+            Task.objects.bulk_update(batch, ['assignedTo'])
+            batch = []
+    Task.objects.bulk_update(batch, ['assignedTo'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_tasks_app', '0002_task_datetime_fields_and_indexes'),
+        ('contacts_app', '0002_remove_contact_name_contact_firstname_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskAssignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('contact', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_assignments', to='contacts_app.contact')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignments', to='board_tasks_app.task')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='assignees',
+            field=models.ManyToManyField(blank=True, related_name='tasks', through='board_tasks_app.TaskAssignment', to='contacts_app.contact'),
+        ),
+        migrations.AddIndex(
+            model_name='taskassignment',
+            index=models.Index(fields=['contact', 'task'], name='task_assignment_contact_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='taskassignment',
+            constraint=models.UniqueConstraint(fields=('task', 'contact'), name='task_assignment_unique'),
+        ),
+        migrations.RunPython(copy_assigned_to, restore_assigned_to),
+        migrations.RemoveField(
+            model_name='task',
+            name='assignedTo',
+        ),
+    ]
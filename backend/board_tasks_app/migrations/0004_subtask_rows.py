@@ -0,0 +1,106 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_subtasks(apps, schema_editor):
+    """
+    Copies the subtasks JSON lists into Subtask rows and fills the progress counters.
+    Missing or duplicate client ids are replaced by a position-based id.
+    """
+    Task = apps.get_model('board_tasks_app', 'Task')
+    Subtask = apps.get_model('board_tasks_app', 'Subtask')
+    rows, counted = [], []
+    for task in Task.objects.only('id', 'subtasks').iterator(chunk_size=2000):
+        keys = set()
+        done = 0
+        items = [item for item in (task.subtasks or []) if isinstance(item, dict)]
+        for position, item in enumerate(items):
+            key = str(item.get('id') or '')[:100]
+            suffix = 0
+            while not key or key in keys:
+                key = f'{position}-{suffix}'
+                suffix += 1
+            keys.add(key)
+            completed = bool(item.get('completed'))
+            done += completed
+            rows.append(Subtask(
+                task_id=task.id,
+                key=key,
+                title=str(item.get('title') or '')[:255],
+                completed=completed,
+                position=position
+            ))
+        task.subtasksTotal = len(items)
+        task.subtasksDone = done
+        counted.append(task)
+        if len(rows) >= 2000 or len(counted) >= 2000:
+            Subtask.objects.bulk_create(rows)
+            Task.objects.bulk_update(counted, ['subtasksTotal', 'subtasksDone'])
+            rows, counted = [], []
+    Subtask.objects.bulk_create(rows)
+    Task.objects.bulk_update(counted, ['subtasksTotal', 'subtasksDone'])
+
+
+def restore_subtasks(apps, schema_editor):
+    """Rebuilds the subtasks JSON lists ({id, title, completed}, id being the key) from the Subtask rows in position order."""
+    Task = apps.get_model('board_tasks_app', 'Task')
+    Subtask = apps.get_model('board_tasks_app', 'Subtask')
+    subtasks = {}
+    rows = Subtask.objects.order_by('task_id', 'position', 'id').values_list('task_id', 'key', 'title', 'completed')
+    for task_id, key, title, completed in rows.iterator(chunk_size=2000):
+        subtasks.setdefault(task_id, []).append({'id': key, 'title': title, 'completed': completed})
+    batch = []
+    for task in Task.objects.only('id').iterator(chunk_size=2000):
+        task.subtasks = subtasks.get(task.id, [])
+        batch.append(task)
+        if len(batch) >= 2000:
+            Task.objects.bulk_update(batch, ['subtasks'])
+            batch = []
+    Task.objects.bulk_update(batch, ['subtasks'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_tasks_app', '0003_task_assignment'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='subtasksDone',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='subtasksTotal',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='Subtask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100)),
+                ('title', models.CharField(max_length=255)),
+                ('completed', models.BooleanField(default=False)),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='board_tasks_app.task')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['task', 'position'], name='subtask_task_position_idx')],
+                'constraints': [models.UniqueConstraint(fields=('task', 'key'), name='subtask_task_key_unique')],
+            },
+        ),
+        migrations.RunPython(copy_subtasks, restore_subtasks),
+        migrations.RemoveField(
+            model_name='task',
+            name='subtasks',
+        ),
+        migrations.AlterField(
+            model_name='subtask',
+            name='task',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='subtasks', to='board_tasks_app.task'),
+        ),
+    ]
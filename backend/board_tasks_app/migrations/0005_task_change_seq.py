@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_tasks_app', '0004_subtask_rows'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='changeSeq',
+            field=models.BigIntegerField(db_index=True, default=0),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-18 15:10
+
+from django.db import migrations
+from board_tasks_app.search import task_index
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Creates the FTS5 index of task titles, descriptions and subtask titles on SQLite
+    (SQL in TaskSearchIndex). Other databases, and SQLite builds without FTS5, search
+    with substring filters instead.
+    """
+    task_index.create(schema_editor.connection)
+
+
+def drop_search_index(apps, schema_editor):
+    task_index.drop(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_tasks_app', '0005_task_change_seq'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 6.0.1 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+def fill_board_summary(apps, schema_editor):
+    """Counts the existing tasks per board (see BoardSummaryManager.compute())."""
+    Task = apps.get_model('board_tasks_app', 'Task')
+    BoardSummary = apps.get_model('board_tasks_app', 'BoardSummary')
+    open_urgent = models.Q(priority='urgent', dueDate__isnull=False) & ~models.Q(status='done')
+    rows = Task.objects.order_by().values('isPrivate', 'ownerId').annotate(
+        total=models.Count('id'),
+        todo=models.Count('id', filter=models.Q(status='todo')),
+        inprogress=models.Count('id', filter=models.Q(status='inprogress')),
+        awaitfeedback=models.Count('id', filter=models.Q(status='awaitfeedback')),
+        done=models.Count('id', filter=models.Q(status='done')),
+        urgent=models.Count('id', filter=models.Q(priority='urgent')),
+        deadline=models.Min('dueDate', filter=open_urgent)
+    )
+    boards = {}
+    for row in rows:
+        board = (True, row['ownerId'] or '') if row['isPrivate'] else (False, '')
+        summary = boards.setdefault(board, BoardSummary(isPrivate=board[0], ownerId=board[1]))
+        for name in ['total', 'todo', 'inprogress', 'awaitfeedback', 'done', 'urgent']:
+            setattr(summary, name, getattr(summary, name) + row[name])
+        if row['deadline'] is not None and (summary.nextDeadline is None or row['deadline'] < summary.nextDeadline):
+            summary.nextDeadline = row['deadline']
+    BoardSummary.objects.bulk_create(boards.values())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_tasks_app', '0006_task_search'),
+        ('contacts_app', '0005_contact_sort_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('isPrivate', models.BooleanField(default=False)),
+                ('ownerId', models.CharField(blank=True, default='', max_length=100)),
+                ('total', models.IntegerField(default=0)),
+                ('todo', models.IntegerField(default=0)),
+                ('inprogress', models.IntegerField(default=0)),
+                ('awaitfeedback', models.IntegerField(default=0)),
+                ('done', models.IntegerField(default=0)),
+                ('urgent', models.IntegerField(default=0)),
+                ('nextDeadline', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('dueDate__isnull', False), ('priority', 'urgent'), models.Q(('status', 'done'), _negated=True)), fields=['isPrivate', 'ownerId', 'dueDate'], name='task_private_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('dueDate__isnull', False), ('priority', 'urgent'), models.Q(('status', 'done'), _negated=True)), fields=['isPrivate', 'dueDate'], name='task_public_deadline_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='boardsummary',
+            constraint=models.UniqueConstraint(fields=('isPrivate', 'ownerId'), name='board_summary_board_unique'),
+        ),
+        migrations.RunPython(fill_board_summary, migrations.RunPython.noop),
+    ]
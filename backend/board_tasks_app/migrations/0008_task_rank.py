@@ -0,0 +1,92 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:40
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+
+
+def spread_ranks(count):
+    """`count` ascending rank keys spread evenly (see core.ranking.spread_ranks())."""
+    width = 1
+    while len(DIGITS) ** width <= count:
+        width += 1
+    step = len(DIGITS) ** width // (count + 1)
+    ranks = []
+    for index in range(1, count + 1):
+        value, digits = step * index, []
+        for _ in range(width):
+            value, digit = divmod(value, len(DIGITS))
+            digits.append(DIGITS[digit])
+        ranks.append(''.join(reversed(digits)).rstrip(DIGITS[0]))
+    return ranks
+
+
+def group_columns(tasks):
+    """Groups tasks (in their current order) by column: board and status."""
+    columns = defaultdict(list)
+    for task in tasks:
+        board = (True, task.ownerId or '') if task.isPrivate else (False, '')
+        columns[board, task.status].append(task)
+    return columns.values()
+
+
+def fill_task_ranks(apps, schema_editor):
+    """Ranks every column in its current order: `order` (empty first), then id."""
+    Task = apps.get_model('board_tasks_app', 'Task')
+    tasks = Task.objects.order_by(models.F('order').asc(nulls_first=True), 'id').only('id', 'isPrivate', 'ownerId', 'status')
+    updated = []
+    for column in group_columns(tasks):
+        for task, rank in zip(column, spread_ranks(len(column))):
+            task.rank = rank
+            updated.append(task)
+    Task.objects.bulk_update(updated, ['rank'], batch_size=1000)
+
+
+def fill_task_orders(apps, schema_editor):
+    Task = apps.get_model('board_tasks_app', 'Task')
+    tasks = Task.objects.order_by('rank', 'id').only('id', 'isPrivate', 'ownerId', 'status')
+    updated = []
+    for column in group_columns(tasks):
+        for index, task in enumerate(column):
+            task.order = index
+            updated.append(task)
+    Task.objects.bulk_update(updated, ['order'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_tasks_app', '0007_board_summary'),
+        ('contacts_app', '0005_contact_sort_key'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_private_board_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_public_board_idx',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='rank',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.RunPython(fill_task_ranks, fill_task_orders),
+        migrations.RemoveField(
+            model_name='task',
+            name='order',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['isPrivate', 'ownerId', 'status', 'rank'], name='task_private_board_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['isPrivate', 'status', 'rank'], name='task_public_board_idx'),
+        ),
+    ]
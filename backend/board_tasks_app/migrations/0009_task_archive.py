@@ -0,0 +1,59 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:25
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def fill_completed_at(apps, schema_editor):
+    """Done tasks count as completed at their last update (or their creation)."""
+    Task = apps.get_model('board_tasks_app', 'Task')
+    Task.objects.filter(status='done').update(completedAt=Coalesce('updatedAt', 'createdAt'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_tasks_app', '0008_task_rank'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedTask',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, default='')),
+                ('dueDate', models.DateTimeField(blank=True, null=True)),
+                ('priority', models.CharField(choices=[('urgent', 'Urgent'), ('medium', 'Medium'), ('low', 'Low')], max_length=10)),
+                ('category', models.CharField(max_length=100)),
+                ('status', models.CharField(choices=[('todo', 'To do'), ('inprogress', 'In progress'), ('awaitfeedback', 'Await feedback'), ('done', 'Done')], default='done', max_length=20)),
+                ('assignedTo', models.JSONField(blank=True, default=list)),
+                ('subtasks', models.JSONField(blank=True, default=list)),
+                ('createdAt', models.DateTimeField()),
+                ('updatedAt', models.DateTimeField(blank=True, null=True)),
+                ('completedAt', models.DateTimeField(blank=True, null=True)),
+                ('isPrivate', models.BooleanField(default=False)),
+                ('ownerId', models.CharField(blank=True, max_length=100, null=True)),
+                ('archivedAt', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='completedAt',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(fill_completed_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status', 'done')), fields=['completedAt'], name='task_done_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedtask',
+            index=models.Index(fields=['isPrivate', 'ownerId', 'archivedAt', 'id'], name='archived_private_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedtask',
+            index=models.Index(fields=['isPrivate', 'archivedAt', 'id'], name='archived_public_idx'),
+        ),
+    ]
@@ -1,4 +1,82 @@
-from django.db import models
+from collections import Counter, defaultdict
+
+from django.db import IntegrityError, models, router, transaction
+from django.db.models import Count, F, Min, Prefetch, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from core.ranking import rank_between, spread_ranks
+from sync_app.models import CollectionVersion, Tombstone
+from sync_app.tracking import suppress_tracking, tracking_enabled
+
+# Rank keys longer than this get their column rebalanced in the background.
+RANK_REBALANCE_LENGTH = 12
+
+class TaskQuerySet(models.QuerySet):
+    def board(self, board):
+        """Tasks of `board` ((True, ownerId) for a private, (False, '') for the public board)."""
+        is_private, owner_id = board
+        tasks = self.filter(isPrivate__in=[is_private])
+        if is_private:
+            tasks = tasks.filter(Q(ownerId=owner_id) if owner_id else Q(ownerId='') | Q(ownerId__isnull=True))
+        return tasks
+
+    def column(self, board, status):
+        return self.board(board).filter(status=status)
+
+class TaskManager(models.Manager.from_queryset(TaskQuerySet)):
+    """
+    TaskManager
+    Custom manager for Task model.
+
+    Methods:
+    - assign_ranks: Appends tasks without a rank key to the end of their columns.
+    - rank_for_move: Returns the rank key that places a task between two others.
+    - rebalance: Rewrites the rank keys of one column evenly spaced.
+    """
+    def assign_ranks(self, tasks):
+        """
+        Gives every task without a rank key one after the last task of its column, in
+        list order. One indexed lookup per column.
+        """
+        last = {}
+        for task in tasks:
+            if task.rank:
+                continue
+            column = (task.get_board(), task.status)
+            if column not in last:
+                last[column] = self.column(*column).order_by('-rank').values_list('rank', flat=True).first()
+            task.rank = last[column] = rank_between(last[column], None)
+
+    def rank_for_move(self, task, after=None, before=None):
+        """
+        Returns the rank key that places `task` between the tasks `after` and `before` of
+        its column. With one neighbour the task goes right next to it, with none to the end
+        of the column; that takes one indexed lookup. Raises ValueError if `after` does
+        not sort before `before`.
+        """
+        column = self.column(task.get_board(), task.status).exclude(pk=task.pk)
+        lower = after.rank if after is not None else None
+        upper = before.rank if before is not None else None
+        if after is not None and before is None:
+            upper = column.filter(rank__gt=lower).order_by('rank').values_list('rank', flat=True).first()
+        elif before is not None and after is None:
+            lower = column.filter(rank__lt=upper).order_by('-rank').values_list('rank', flat=True).first()
+        elif after is None:
+            lower = column.order_by('-rank').values_list('rank', flat=True).first()
+        return rank_between(lower, upper)
+
+    def rebalance(self, board, status):
+        """
+        Rewrites the rank keys of one column evenly spaced, keeping the order. The tasks
+        share one change sequence number. Returns the number of tasks.
+        """
+        with transaction.atomic(using=self.db):
+            tasks = list(self.column(board, status).order_by('rank', 'id').only('id', 'rank'))
+            seq = CollectionVersion.objects.bump(CollectionVersion.TASKS)
+            for task, rank in zip(tasks, spread_ranks(len(tasks))):
+                task.rank, task.changeSeq = rank, seq
+            self.bulk_update(tasks, ['rank', 'changeSeq'], batch_size=1000)
+        return len(tasks)
 
 class Task(models.Model):
     """
@@ -20,20 +98,237 @@ class Task(models.Model):
 
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True, default='')
-    dueDate = models.CharField(max_length=50) 
+    dueDate = models.DateTimeField(blank=True, null=True)
     priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES)
     category = models.CharField(max_length=100)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='todo')
 
-    assignedTo = models.JSONField(default=list) 
-    subtasks = models.JSONField(default=list)  
+    assignees = models.ManyToManyField(
+        'contacts_app.Contact',
+        through='TaskAssignment',
+        related_name='tasks',
+        blank=True
+    )
+    subtasksTotal = models.PositiveIntegerField(default=0)
+    subtasksDone = models.PositiveIntegerField(default=0)
 
-    createdAt = models.CharField(max_length=50)
-    updatedAt = models.CharField(max_length=50, blank=True, null=True)
+    createdAt = models.DateTimeField()
+    updatedAt = models.DateTimeField(blank=True, null=True)
+    # Set by the server when the task enters the done column; archive_tasks moves
+    # tasks done for longer than TASK_ARCHIVE['AFTER_DAYS'] into ArchivedTask.
+    completedAt = models.DateTimeField(blank=True, null=True)
 
-    order = models.IntegerField(blank=True, null=True)
+    # Fractional rank key (core.ranking) ordering the tasks of a column (board and status).
+    # The keys only sort correctly by code point ('Z' < 'a'), so the column needs a binary
+    # collation: SQLite's default BINARY, "C" on PostgreSQL, a *_bin collation on MySQL.
+    rank = models.CharField(max_length=64, blank=True, default='')
     isPrivate = models.BooleanField(default=False)
     ownerId = models.CharField(max_length=100, blank=True, null=True)
+    changeSeq = models.BigIntegerField(default=0, db_index=True)
+
+    objects = TaskManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['isPrivate', 'ownerId', 'status', 'rank'], name='task_private_board_idx'),
+            models.Index(fields=['isPrivate', 'status', 'rank'], name='task_public_board_idx'),
+            models.Index(fields=['isPrivate', 'ownerId', 'dueDate'], name='task_private_due_idx'),
+            models.Index(fields=['isPrivate', 'dueDate'], name='task_public_due_idx'),
+            # Only urgent open tasks with a due date: the next deadline of a board
+            # (BoardSummary.nextDeadline) is the first entry of one of these.
+            models.Index(
+                fields=['isPrivate', 'ownerId', 'dueDate'],
+                condition=Q(priority='urgent', dueDate__isnull=False) & ~Q(status='done'),
+                name='task_private_deadline_idx'
+            ),
+            models.Index(
+                fields=['isPrivate', 'dueDate'],
+                condition=Q(priority='urgent', dueDate__isnull=False) & ~Q(status='done'),
+                name='task_public_deadline_idx'
+            ),
+            # Only done tasks: the archive job walks this one oldest first.
+            models.Index(fields=['completedAt'], condition=Q(status='done'), name='task_done_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # The save signals update the board summary; keep both in one transaction.
+        # A task without a rank key (new, or moved to another column) goes to the end.
+        using = kwargs.get('using') or router.db_for_write(Task, instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            changed = []
+            if not self.rank:
+                Task.objects.db_manager(using).assign_ranks([self])
+                changed.append('rank')
+            if self.track_completion():
+                changed.append('completedAt')
+            if changed and kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], *changed}
+            super().save(*args, **kwargs)
+
+    @staticmethod
+    def subtask_counters(items):
+        """The subtasksTotal/subtasksDone values for the subtask dicts `items`."""
+        return {'subtasksTotal': len(items), 'subtasksDone': sum(1 for item in items if item['completed'])}
+
+    def track_completion(self):
+        """
+        Stamps completedAt when the task is done and clears it when it is not (any more).
+        Returns whether completedAt changed.
+        """
+        if (self.status == 'done') == (self.completedAt is not None):
+            return False
+        self.completedAt = timezone.now() if self.status == 'done' else None
+        return True
+
+    def is_visible(self, view_mode, user_id):
+        """
+        Returns whether the task belongs to the board of `view_mode` / `user_id`,
+        following the same rules as the task list filter.
+        """
+        if view_mode == 'private' and user_id:
+            return self.isPrivate and self.ownerId == user_id
+        if view_mode == 'public':
+            return not self.isPrivate
+        return True
+
+    def leaves_column(self, changes):
+        """Returns whether setting the field values `changes` moves the task to another column."""
+        moved = Task(**{name: changes.get(name, getattr(self, name)) for name in ['isPrivate', 'ownerId', 'status']})
+        return (moved.get_board(), moved.status) != (self.get_board(), self.status)
+
+    def get_board(self):
+        """(True, ownerId) for private tasks, (False, '') for public ones."""
+        return (True, self.ownerId or '') if self.isPrivate else (False, '')
+
+    def get_summary_state(self):
+        """
+        Returns what the board summary counts of this task: (board, status, is urgent,
+        deadline), with board being (True, ownerId) for private and (False, '') for public
+        tasks and deadline the due date of urgent open tasks (None otherwise).
+        """
+        urgent = self.priority == 'urgent'
+        deadline = self.dueDate if urgent and self.status != 'done' else None
+        return self.get_board(), self.status, urgent, deadline
+
+class TaskAssignmentManager(models.Manager):
+    """
+    TaskAssignmentManager
+    Custom manager for TaskAssignment model.
+
+    Methods:
+    - replace: Replaces the assignees of several tasks with three queries in total.
+    """
+    def replace(self, assignments):
+        """
+        Replaces the assignees of the given tasks.
+        `assignments` maps task ids to ordered lists of contact ids; contact ids that
+        do not exist (e.g. deleted contacts still referenced by a client) are skipped.
+        """
+        if not assignments:
+            return
+        requested = {contact_id for contact_ids in assignments.values() for contact_id in contact_ids}
+        existing = set(
+            self.model._meta.get_field('contact').related_model.objects
+            .filter(id__in=requested).values_list('id', flat=True)
+        )
+        rows = []
+        for task_id, contact_ids in assignments.items():
+            for position, contact_id in enumerate(dict.fromkeys(contact_ids)):
+                if contact_id in existing:
+                    rows.append(self.model(task_id=task_id, contact_id=contact_id, position=position))
+        with transaction.atomic(using=self.db):
+            self.filter(task_id__in=assignments.keys()).delete()
+            self.bulk_create(rows)
+            if tracking_enabled():
+                seq = CollectionVersion.objects.bump(CollectionVersion.TASKS)
+                Task.objects.filter(pk__in=assignments.keys()).update(changeSeq=seq)
+
+class TaskAssignment(models.Model):
+    """
+    TaskAssignment model.
+    Links a task to an assigned contact. Replaces the former assignedTo JSON list
+    so "tasks of contact X" is an indexed lookup and deleting a contact unassigns it.
+    """
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='assignments')
+    contact = models.ForeignKey('contacts_app.Contact', on_delete=models.CASCADE, related_name='task_assignments')
+    position = models.PositiveIntegerField(default=0)
+
+    objects = TaskAssignmentManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['task', 'contact'], name='task_assignment_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['contact', 'task'], name='task_assignment_contact_idx'),
+        ]
+
+class SubtaskManager(models.Manager):
+    """
+    SubtaskManager
+    Custom manager for Subtask model.
+
+    Methods:
+    - replace: Replaces the subtasks of several tasks and refreshes their progress counters
+      and search index text.
+    """
+    def replace(self, subtasks, save_counters=True):
+        """
+        Replaces the subtasks of the given tasks.
+        `subtasks` maps Task instances to ordered lists of {'key', 'title', 'completed'} dicts.
+        The subtasksTotal/subtasksDone counters of the tasks are updated in the same pass,
+        unless `save_counters` is False: then the caller saves them with the task itself
+        (see Task.subtask_counters()).
+        """
+        if not subtasks:
+            return
+        rows = []
+        for task, items in subtasks.items():
+            for position, item in enumerate(items):
+                rows.append(self.model(
+                    task=task,
+                    key=item['key'],
+                    title=item['title'],
+                    completed=item['completed'],
+                    position=position
+                ))
+            for name, value in Task.subtask_counters(items).items():
+                setattr(task, name, value)
+        with transaction.atomic(using=self.db):
+            fields = ['subtasksTotal', 'subtasksDone'] if save_counters else []
+            if tracking_enabled():
+                seq = CollectionVersion.objects.bump(CollectionVersion.TASKS)
+                for task in subtasks:
+                    task.changeSeq = seq
+                fields.append('changeSeq')
+            self.filter(task__in=list(subtasks)).delete()
+            self.bulk_create(rows)
+            if fields:
+                Task.objects.bulk_update(list(subtasks), fields)
+            from .search import task_index
+            task_index.refresh([task.pk for task in subtasks], using=self.db)
+
+class Subtask(models.Model):
+    """
+    Subtask model.
+    A checklist entry of a task, stored as its own row so a single subtask can be
+    toggled without rewriting the task. `key` is the client-side subtask id.
+    """
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='subtasks')
+    key = models.CharField(max_length=100)
+    title = models.CharField(max_length=255)
+    completed = models.BooleanField(default=False)
+    position = models.PositiveIntegerField(default=0)
+
+    objects = SubtaskManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['task', 'key'], name='subtask_task_key_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['task', 'position'], name='subtask_task_position_idx'),
+        ]
 
 class BoardSettings(models.Model):
     """
@@ -42,4 +337,269 @@ class BoardSettings(models.Model):
     """
     userId = models.CharField(max_length=100, unique=True)
     viewMode = models.CharField(max_length=10, default='public')
-    lastChanged = models.CharField(max_length=50, blank=True, null=True)
\ No newline at end of file
+    lastChanged = models.CharField(max_length=50, blank=True, null=True)
+
+class BoardSummaryManager(models.Manager):
+    """
+    BoardSummaryManager
+    Custom manager for BoardSummary model.
+
+    Methods:
+    - apply: Applies task changes to the counters of the affected boards.
+    - compute / rebuild: Recompute all counters from the task table.
+    - get_summary: Returns the counters for a view mode, like the task list filter.
+    """
+    COUNTERS = ['total', 'todo', 'inprogress', 'awaitfeedback', 'done', 'urgent']
+
+    def apply(self, changes):
+        """
+        Applies task changes to the counters. `changes` is a list of (before, after)
+        Task.get_summary_state() pairs, None for created or deleted tasks. Must run after
+        the tasks were written (the next deadline is read back from the task table through
+        the partial deadline indexes) and inside the transaction that wrote them.
+        One UPDATE per affected board, plus one indexed lookup if its deadline may have moved.
+        """
+        deltas = defaultdict(Counter)
+        deadline_boards = set()
+        for before, after in changes:
+            if before == after:
+                continue
+            for state, sign in [(before, -1), (after, 1)]:
+                if state is None:
+                    continue
+                board, status, urgent, deadline = state
+                deltas[board]['total'] += sign
+                deltas[board][status] += sign
+                if urgent:
+                    deltas[board]['urgent'] += sign
+                if deadline is not None:
+                    deadline_boards.add(board)
+        with transaction.atomic(using=self.db):
+            # Sorted, so concurrent writers lock the rows in the same order.
+            for board in sorted(deltas):
+                updates = {name: F(name) + delta for name, delta in deltas[board].items() if delta}
+                if board in deadline_boards:
+                    updates['nextDeadline'] = self.next_deadline(board)
+                if updates:
+                    self.update_board(board, updates, deltas[board])
+
+    def update_board(self, board, updates, deltas):
+        is_private, owner_id = board
+        # `isPrivate__in` keeps the (isPrivate, ownerId) unique index usable on SQLite.
+        if self.filter(isPrivate__in=[is_private], ownerId=owner_id).update(**updates):
+            return
+        # First task of the board: create the row, unless a concurrent writer just did.
+        try:
+            with transaction.atomic(using=self.db):
+                self.create(
+                    isPrivate=is_private,
+                    ownerId=owner_id,
+                    nextDeadline=updates.get('nextDeadline'),
+                    **{name: delta for name, delta in deltas.items() if delta}
+                )
+        except IntegrityError:
+            self.filter(isPrivate__in=[is_private], ownerId=owner_id).update(**updates)
+
+    def next_deadline(self, board):
+        # The condition matches the partial deadline indexes.
+        tasks = Task.objects.using(self.db).board(board).filter(
+            Q(priority='urgent', dueDate__isnull=False) & ~Q(status='done')
+        )
+        return tasks.order_by('dueDate').values_list('dueDate', flat=True).first()
+
+    def compute(self):
+        """
+        Counts every board from the task table in one aggregate query.
+        Returns {board: unsaved BoardSummary}.
+        """
+        open_urgent = Q(priority='urgent', dueDate__isnull=False) & ~Q(status='done')
+        rows = Task.objects.using(self.db).order_by().values('isPrivate', 'ownerId').annotate(
+            total=Count('id'),
+            todo=Count('id', filter=Q(status='todo')),
+            inprogress=Count('id', filter=Q(status='inprogress')),
+            awaitfeedback=Count('id', filter=Q(status='awaitfeedback')),
+            done=Count('id', filter=Q(status='done')),
+            urgent=Count('id', filter=Q(priority='urgent')),
+            deadline=Min('dueDate', filter=open_urgent)
+        )
+        boards = {}
+        for row in rows:
+            board = (True, row['ownerId'] or '') if row['isPrivate'] else (False, '')
+            summary = boards.setdefault(board, self.model(isPrivate=board[0], ownerId=board[1]))
+            for name in self.COUNTERS:
+                setattr(summary, name, getattr(summary, name) + row[name])
+            if row['deadline'] is not None and (summary.nextDeadline is None or row['deadline'] < summary.nextDeadline):
+                summary.nextDeadline = row['deadline']
+        return boards
+
+    def rebuild(self):
+        """Replaces the stored rows with freshly computed ones; returns the number of boards."""
+        with transaction.atomic(using=self.db):
+            boards = self.compute()
+            self.all().delete()
+            self.bulk_create(boards.values())
+        return len(boards)
+
+    def get_summary(self, view_mode, user_id):
+        """
+        Returns the counters of the board the task list shows for `view_mode` / `user_id`:
+        the private board of the user, the public board, or (any other view mode) all
+        tasks summed over the boards. Boards without tasks have no row and count zero.
+        """
+        if view_mode == 'private' and user_id:
+            return self.filter(isPrivate__in=[True], ownerId=user_id).first() or self.model()
+        if view_mode == 'public':
+            return self.filter(isPrivate__in=[False], ownerId='').first() or self.model()
+        return self.aggregate(
+            **{name: Coalesce(Sum(name), 0) for name in self.COUNTERS},
+            nextDeadline=Min('nextDeadline')
+        )
+
+class BoardSummary(models.Model):
+    """
+    BoardSummary model.
+    Task counters of one board (the public board, or the private board of one owner),
+    so the summary page does not have to load every task. Kept up to date in the
+    transaction of every task write: by the task signals, and explicitly by bulk paths
+    that bypass them. `manage.py rebuild_board_summary` recomputes them from scratch.
+    """
+    isPrivate = models.BooleanField(default=False)
+    ownerId = models.CharField(max_length=100, blank=True, default='')
+    total = models.IntegerField(default=0)
+    todo = models.IntegerField(default=0)
+    inprogress = models.IntegerField(default=0)
+    awaitfeedback = models.IntegerField(default=0)
+    done = models.IntegerField(default=0)
+    urgent = models.IntegerField(default=0)
+    nextDeadline = models.DateTimeField(blank=True, null=True)
+
+    objects = BoardSummaryManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['isPrivate', 'ownerId'], name='board_summary_board_unique'),
+        ]
+
+class ArchivedTaskManager(models.Manager):
+    """
+    ArchivedTaskManager
+    Custom manager for ArchivedTask model.
+
+    Methods:
+    - archive: Moves tasks from the task table into the archive.
+    - archive_completed: Archives the tasks done before a point in time, in batches.
+    - restore: Moves an archived task back onto its board.
+    """
+    TASK_FIELDS = [
+        'title', 'description', 'dueDate', 'priority', 'category', 'status',
+        'createdAt', 'updatedAt', 'completedAt', 'isPrivate', 'ownerId',
+    ]
+
+    def archive(self, tasks):
+        """
+        Moves the tasks of the Task queryset `tasks` into the archive in one transaction:
+        one INSERT of the archive rows and one DELETE of the tasks (their assignments,
+        subtasks and search index rows go with them), tombstones so delta-sync clients
+        drop them and one board summary update. Returns the number of archived tasks.
+        """
+        assignments = TaskAssignment.objects.only('task_id', 'contact_id').order_by('position')
+        subtasks = Subtask.objects.order_by('position')
+        with transaction.atomic(using=self.db), suppress_tracking():
+            tasks = list(tasks.prefetch_related(
+                Prefetch('assignments', queryset=assignments),
+                Prefetch('subtasks', queryset=subtasks)
+            ))
+            if not tasks:
+                return 0
+            archived_at = timezone.now()
+            self.bulk_create([
+                self.model(
+                    id=task.pk,
+                    assignedTo=[assignment.contact_id for assignment in task.assignments.all()],
+                    subtasks=[
+                        {'id': subtask.key, 'title': subtask.title, 'completed': subtask.completed}
+                        for subtask in task.subtasks.all()
+                    ],
+                    archivedAt=archived_at,
+                    **{name: getattr(task, name) for name in self.TASK_FIELDS}
+                )
+                for task in tasks
+            ])
+            task_ids = [task.pk for task in tasks]
+            Task.objects.using(self.db).filter(pk__in=task_ids).delete()
+            seq = CollectionVersion.objects.bump(CollectionVersion.TASKS)
+            Tombstone.objects.record(CollectionVersion.TASKS, task_ids, seq)
+            BoardSummary.objects.apply([(task.get_summary_state(), None) for task in tasks])
+        return len(tasks)
+
+    def archive_completed(self, before, batch_size=500):
+        """
+        Archives the tasks that were done before `before`, oldest first and `batch_size`
+        per transaction, so concurrent writers are only blocked for one batch at a time.
+        Returns the number of archived tasks.
+        """
+        total = 0
+        while True:
+            batch = (
+                Task.objects.using(self.db)
+                .filter(status='done', completedAt__lt=before)
+                .order_by('completedAt', 'id')[:batch_size]
+            )
+            count = self.archive(batch)
+            total += count
+            if count < batch_size:
+                return total
+
+    def restore(self, archived):
+        """
+        Moves an archived task back onto its board, under its old id and at the end of its
+        column; it counts as completed now, so the next archive run keeps it. Assignees
+        whose contact was deleted meanwhile are dropped. The task signals record it
+        (change sequence, board summary) and the tombstones of its archiving are removed,
+        so delta-sync clients just see it change. Returns the Task.
+        """
+        with transaction.atomic(using=self.db):
+            task = Task(id=archived.pk, **{name: getattr(archived, name) for name in self.TASK_FIELDS})
+            task.completedAt = None
+            task.save(force_insert=True, using=self.db)
+            TaskAssignment.objects.db_manager(self.db).replace({task.pk: archived.assignedTo})
+            Subtask.objects.db_manager(self.db).replace({task: [
+                {'key': item['id'], 'title': item['title'], 'completed': item['completed']}
+                for item in archived.subtasks
+            ]})
+            Tombstone.objects.using(self.db).filter(collection=CollectionVersion.TASKS, objectId=task.pk).delete()
+            archived.delete()
+        return task
+
+class ArchivedTask(models.Model):
+    """
+    ArchivedTask model.
+    A done task moved out of the task table (`manage.py archive_tasks`), so board loads,
+    the task indexes and the board summary only cover active work. One row per task:
+    the assignees (contact ids) and subtasks are kept inline as JSON. `id` is the id
+    of the task, which it gets back when restored.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=255)
+    description = models.TextField(blank=True, default='')
+    dueDate = models.DateTimeField(blank=True, null=True)
+    priority = models.CharField(max_length=10, choices=Task.PRIORITY_CHOICES)
+    category = models.CharField(max_length=100)
+    status = models.CharField(max_length=20, choices=Task.STATUS_CHOICES, default='done')
+    assignedTo = models.JSONField(default=list, blank=True)
+    subtasks = models.JSONField(default=list, blank=True)
+    createdAt = models.DateTimeField()
+    updatedAt = models.DateTimeField(blank=True, null=True)
+    completedAt = models.DateTimeField(blank=True, null=True)
+    isPrivate = models.BooleanField(default=False)
+    ownerId = models.CharField(max_length=100, blank=True, null=True)
+    archivedAt = models.DateTimeField(default=timezone.now)
+
+    objects = ArchivedTaskManager()
+
+    class Meta:
+        indexes = [
+            # Newest first per board, the order of the archive list (keyset on archivedAt, id).
+            models.Index(fields=['isPrivate', 'ownerId', 'archivedAt', 'id'], name='archived_private_idx'),
+            models.Index(fields=['isPrivate', 'archivedAt', 'id'], name='archived_public_idx'),
+        ]
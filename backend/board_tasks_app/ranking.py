@@ -0,0 +1,41 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections, transaction
+from .models import Task
+
+logger = logging.getLogger('board_tasks_app.ranking')
+
+_executor = ThreadPoolExecutor(1, thread_name_prefix='rank-rebalance')
+_pending = set()
+_pending_lock = threading.Lock()
+
+
+def schedule_rebalance(board, status):
+    """
+    Rebalances the rank keys of a column on a background thread once the current
+    transaction commits (nothing happens if it rolls back). A column that is already
+    waiting is not queued again.
+    """
+    def submit():
+        with _pending_lock:
+            if (board, status) in _pending:
+                return
+            _pending.add((board, status))
+        _executor.submit(rebalance, board, status)
+
+    transaction.on_commit(submit)
+
+
+def rebalance(board, status):
+    close_old_connections()
+    try:
+        count = Task.objects.rebalance(board, status)
+        logger.info('Rebalanced %d rank keys of column %s %s', count, board, status)
+    except Exception:
+        logger.exception('Rebalancing column %s %s failed', board, status)
+    finally:
+        with _pending_lock:
+            _pending.discard((board, status))
+        close_old_connections()
@@ -0,0 +1,119 @@
+from django.db import connections
+from django.db.models import Exists, OuterRef, Q
+from core.search import FullTextIndex
+from core.text import highlight
+from .models import Subtask, Task
+
+SNIPPET_LENGTH = 160
+
+
+class TaskSearchIndex(FullTextIndex):
+    """
+    TaskSearchIndex
+    Full-text index of task titles, descriptions and subtask titles. Subtasks live in
+    their own table, so unlike the contact index the FTS table keeps its own copy of
+    the text: one row per task (rowid = task id) with the subtask titles joined into
+    the `subtasks` column. Triggers on the task table keep title and description in
+    sync; the subtask text is recomputed by refresh() once per task after its subtasks
+    are written (Subtask.objects.replace(), single subtask saves, the importer), as
+    per-row subtask triggers would rebuild it once per inserted subtask.
+    """
+    subtask_table = Subtask._meta.db_table
+
+    def get_table_sql(self):
+        return (
+            f"CREATE VIRTUAL TABLE {self.table} USING fts5({', '.join(self.columns)}, "
+            f"tokenize='{self.tokenizer}', prefix='{self.prefixes}')"
+        )
+
+    def subtask_text(self, task_id):
+        return f"(SELECT group_concat(title, ' ') FROM {self.subtask_table} WHERE task_id = {task_id})"
+
+    def get_trigger_sql(self):
+        table = self.table
+        source = self.model._meta.db_table
+        return {
+            f'{table}_insert': (
+                f'CREATE TRIGGER {table}_insert AFTER INSERT ON {source} BEGIN '
+                f'INSERT INTO {table}(rowid, title, description, subtasks) '
+                f'VALUES (new.id, new.title, new.description, {self.subtask_text("new.id")}); END'
+            ),
+            f'{table}_delete': (
+                f'CREATE TRIGGER {table}_delete AFTER DELETE ON {source} BEGIN '
+                f'DELETE FROM {table} WHERE rowid = old.id; END'
+            ),
+            f'{table}_update': (
+                f'CREATE TRIGGER {table}_update AFTER UPDATE OF title, description ON {source} BEGIN '
+                f'UPDATE {table} SET title = new.title, description = new.description WHERE rowid = new.id; END'
+            ),
+        }
+
+    def get_rebuild_sql(self):
+        source = self.model._meta.db_table
+        return [
+            f'DELETE FROM {self.table}',
+            f'INSERT INTO {self.table}(rowid, title, description, subtasks) '
+            f'SELECT id, title, description, {self.subtask_text(f"{source}.id")} FROM {source}',
+        ]
+
+    def refresh(self, task_ids, using='default'):
+        """Recomputes the subtask text of the given tasks, one UPDATE per 500 tasks."""
+        task_ids = list(task_ids)
+        if not task_ids or not self.is_available(using):
+            return
+        with connections[using].cursor() as cursor:
+            for start in range(0, len(task_ids), 500):
+                chunk = task_ids[start:start + 500]
+                cursor.execute(
+                    f'UPDATE {self.table} SET subtasks = {self.subtask_text(f"{self.table}.rowid")} '
+                    f'WHERE rowid IN ({", ".join(["%s"] * len(chunk))})',
+                    chunk
+                )
+
+
+def search_tasks_fallback(queryset, terms):
+    """
+    Every term must occur in the title, the description or a subtask title.
+    Substring matching without an index; only used where FTS5 is not available.
+    """
+    for term in terms:
+        queryset = queryset.filter(
+            Q(title__icontains=term)
+            | Q(description__icontains=term)
+            | Exists(Subtask.objects.filter(task_id=OuterRef('pk'), title__icontains=term))
+        )
+    return queryset.order_by('-createdAt', '-pk')
+
+
+def get_highlights(task, terms):
+    """
+    HTML snippets of the fields of `task` that match `terms`, e.g.
+    {"title": "<mark>Land</mark>ing page", "subtasks": [{"id": "a", "title": "..."}]}.
+    Expects the subtasks to be prefetched.
+    """
+    highlights = {}
+    title = highlight(task.title, terms)
+    if title is not None:
+        highlights['title'] = title
+    description = highlight(task.description, terms, SNIPPET_LENGTH)
+    if description is not None:
+        highlights['description'] = description
+    subtasks = []
+    for subtask in task.subtasks.all():
+        subtask_title = highlight(subtask.title, terms)
+        if subtask_title is not None:
+            subtasks.append({'id': subtask.key, 'title': subtask_title})
+    if subtasks:
+        highlights['subtasks'] = subtasks
+    return highlights
+
+
+# Title matches rank above subtask matches, subtask matches above description matches.
+task_index = TaskSearchIndex(
+    Task,
+    table='board_tasks_app_task_fts',
+    columns=['title', 'description', 'subtasks'],
+    weights=[10.0, 2.0, 4.0],
+    fallback=search_tasks_fallback,
+    migration=('board_tasks_app', '0006_task_search')
+)
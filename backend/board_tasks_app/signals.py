@@ -0,0 +1,74 @@
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+from contacts_app.models import Contact
+from sync_app.models import CollectionVersion, Tombstone
+from sync_app.tracking import tracking_enabled
+from .models import Task, TaskAssignment, Subtask, BoardSettings, BoardSummary
+from .search import task_index
+
+SUMMARY_FIELDS = {'isPrivate', 'ownerId', 'status', 'priority', 'dueDate'}
+
+
+@receiver(pre_save, sender=Task)
+def stamp_task_change(sender, instance, **kwargs):
+    """
+    Bumps the task collection and stamps the new sequence number on the saved row,
+    so delta-sync clients pick it up with GET tasks/changes/?since=.
+    """
+    if tracking_enabled():
+        instance.changeSeq = CollectionVersion.objects.bump(CollectionVersion.TASKS)
+
+
+@receiver(pre_save, sender=Task)
+def load_task_summary_state(sender, instance, update_fields=None, **kwargs):
+    """
+    Remembers the stored summary state of an updated task (one primary key lookup),
+    so update_task_summary() can move it between the board counters.
+    """
+    instance._summary_before = None
+    if not tracking_enabled() or instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None and not SUMMARY_FIELDS.intersection(update_fields):
+        instance._summary_before = instance.get_summary_state()
+        return
+    stored = Task.objects.using(kwargs.get('using')).filter(pk=instance.pk).only(*SUMMARY_FIELDS).first()
+    if stored is not None:
+        instance._summary_before = stored.get_summary_state()
+
+
+@receiver(post_save, sender=Task)
+def update_task_summary(sender, instance, **kwargs):
+    if tracking_enabled():
+        BoardSummary.objects.apply([(getattr(instance, '_summary_before', None), instance.get_summary_state())])
+
+
+@receiver(post_delete, sender=Task)
+def record_task_delete(sender, instance, **kwargs):
+    if tracking_enabled():
+        seq = CollectionVersion.objects.bump(CollectionVersion.TASKS)
+        Tombstone.objects.record(CollectionVersion.TASKS, [instance.pk], seq)
+        BoardSummary.objects.apply([(instance.get_summary_state(), None)])
+
+
+@receiver(post_save, sender=Subtask)
+def refresh_subtask_search_text(sender, instance, update_fields=None, **kwargs):
+    """Single subtask saves (rename, admin); bulk writes call task_index.refresh() themselves."""
+    if update_fields is None or 'title' in update_fields:
+        task_index.refresh([instance.task_id], using=kwargs.get('using'))
+
+
+@receiver(pre_delete, sender=Contact)
+def stamp_tasks_on_contact_delete(sender, instance, **kwargs):
+    """
+    Deleting a contact also removes its task assignments, so the affected tasks change too.
+    """
+    if tracking_enabled():
+        task_ids = TaskAssignment.objects.filter(contact=instance).values('task_id')
+        seq = CollectionVersion.objects.bump(CollectionVersion.TASKS)
+        Task.objects.filter(pk__in=task_ids).update(changeSeq=seq)
+
+
+@receiver([post_save, post_delete], sender=BoardSettings)
+def bump_board_settings_version(sender, **kwargs):
+    if tracking_enabled():
+        CollectionVersion.objects.bump(CollectionVersion.BOARD_SETTINGS)
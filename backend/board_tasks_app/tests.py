@@ -1,3 +1,964 @@
-from django.test import TestCase
+import base64
+import contextlib
+import datetime
+import io
+import json
+import os
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection, connections
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from board_tasks_app.api.importers import TaskImporter
+from board_tasks_app.api.serializers import BoardSummarySerializer, TaskBulkSerializer, TaskSerializer
+from board_tasks_app.management.commands.stress_writes import Worker
+from board_tasks_app.models import RANK_REBALANCE_LENGTH, ArchivedTask, BoardSummary, Subtask, Task
+from board_tasks_app.search import SNIPPET_LENGTH, task_index
+from contacts_app.models import Contact
+from core.ranking import is_rank
+from core.sqlite import sqlite_database
+from sync_app.models import CollectionVersion, Tombstone
+from user_auth_app.models import User
+
+
+def task_payload(**overrides):
+    payload = {
+        'title': 'Task',
+        'description': 'Description',
+        'dueDate': '2026-06-01T00:00:00Z',
+        'priority': 'medium',
+        'category': 'User Story',
+        'status': 'todo',
+        'assignedTo': [],
+        'subtasks': [],
+        'createdAt': '2026-01-01T00:00:00Z',
+        'isPrivate': False,
+        'ownerId': '',
+    }
+    payload.update(overrides)
+    return payload
+
+
+class TaskAPITestCase(APITestCase):
+    """Authenticated client plus helpers shared by the task API tests."""
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user('tester@example.com', 'Tester', 'test-password')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=user).key}')
+
+    def create_task(self, **fields):
+        values = {
+            'title': 'Task',
+            'priority': 'medium',
+            'category': 'User Story',
+            'createdAt': timezone.now(),
+            'dueDate': timezone.now() + datetime.timedelta(days=7),
+        }
+        values.update(fields)
+        return Task.objects.create(**values)
+
+    def assertBoardSummaryConsistent(self):
+        """The stored board counters equal BoardSummaryManager.compute()."""
+        output = io.StringIO()
+        try:
+            call_command('rebuild_board_summary', '--check', stdout=output, stderr=output)
+        except SystemExit:
+            self.fail(f'Board summary drifted:\n{output.getvalue()}')
+
+
+class TaskListTests(TaskAPITestCase):
+    """List pagination and sparse fieldsets; without parameters the plain list is kept."""
+    url = reverse('tasks-list')
+
+    def setUp(self):
+        super().setUp()
+        self.tasks = [self.create_task(title=f'Task {index}', status=['todo', 'done'][index % 2]) for index in range(7)]
+        # Ties in (status, rank): the id decides.
+        Task.objects.filter(pk__in=[task.pk for task in self.tasks[:5]]).update(rank='V')
+        Subtask.objects.replace({self.tasks[0]: [
+            {'key': '1', 'title': 'Step 1', 'completed': True},
+            {'key': '2', 'title': 'Step 2', 'completed': False},
+        ]})
+
+    def test_default_is_the_plain_list(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tasks = response.json()
+        self.assertIsInstance(tasks, list)
+        self.assertEqual(len(tasks), 7)
+        optional = TaskSerializer.Meta.optional_fields
+        self.assertEqual(set(tasks[0]), {name for name in TaskSerializer.Meta.fields if name not in optional})
+
+    def test_cursor_pages_follow_the_key_order(self):
+        expected = list(Task.objects.order_by('status', 'rank', 'id').values_list('title', flat=True))
+        titles, url, pages = [], f'{self.url}?pageSize=2', 0
+
+        while url:
+            response = self.client.get(url)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            titles += [task['title'] for task in response.json()['results']]
+            url = response.json()['next']
+            pages += 1
+
+        self.assertEqual(titles, expected)
+        self.assertEqual(pages, 4)
+
+    def test_invalid_cursor_is_rejected(self):
+        def encode(value):
+            return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip('=')
+
+        for cursor in ['not a cursor', encode({'status': 'todo'}), encode(['todo', 'V', '1']), encode(['todo', 'V'])]:
+            response = self.client.get(self.url, {'cursor': cursor})
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, cursor)
+            self.assertIn('cursor', response.json())
+
+    def test_sparse_fields(self):
+        response = self.client.get(self.url, {'fields': 'title,status'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({tuple(sorted(task)) for task in response.json()}, {('status', 'title')})
+        response = self.client.get(reverse('tasks-detail', args=[self.tasks[0].pk]), {'fields': 'title'})
+        self.assertEqual(response.json(), {'title': 'Task 0'})
+
+        response = self.client.get(self.url, {'fields': 'title,secret,id'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['fields'], ['Unknown field: secret', 'Unknown field: id'])
+
+    def test_subtask_counts_replace_the_list(self):
+        response = self.client.get(self.url, {'subtasks': 'counts'})
+
+        tasks = {task['title']: task for task in response.json()}
+        self.assertNotIn('subtasks', tasks['Task 0'])
+        self.assertEqual((tasks['Task 0']['subtasksTotal'], tasks['Task 0']['subtasksDone']), (2, 1))
+        self.assertEqual((tasks['Task 1']['subtasksTotal'], tasks['Task 1']['subtasksDone']), (0, 0))
+
+        response = self.client.get(self.url, {'subtasks': 'counts', 'fields': 'title,subtasks'})
+
+        self.assertEqual(set(response.json()[0]), {'title', 'subtasksTotal', 'subtasksDone'})
+
+
+class TaskFilterTests(TaskAPITestCase):
+    """Due date range and ordering of the list, and the required dueDate."""
+    url = reverse('tasks-list')
+
+    def setUp(self):
+        super().setUp()
+        for title, due in [('March', '2026-03-01T00:00:00Z'), ('April', '2026-04-01T12:00:00Z'), ('May', '2026-05-01T00:00:00Z')]:
+            self.create_task(title=title, dueDate=datetime.datetime.fromisoformat(due))
+
+    def titles(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task['title'] for task in response.json()]
+
+    def test_due_range(self):
+        self.assertEqual(sorted(self.titles(dueAfter='2026-03-01')), ['April', 'March', 'May'])
+        self.assertEqual(sorted(self.titles(dueAfter='2026-03-01T00:00:01Z')), ['April', 'May'])
+        self.assertEqual(self.titles(dueBefore='2026-04-01'), ['March'])
+        self.assertEqual(self.titles(dueAfter='2026-04-01', dueBefore='2026-05-01T00:00:00Z'), ['April'])
+        self.assertEqual(self.titles(dueAfter='2026-04-01T14:00:00+02:00', dueBefore='2026-04-02'), ['April'])
+
+    def test_ordering(self):
+        self.assertEqual(self.titles(ordering='-dueDate'), ['May', 'April', 'March'])
+        self.assertEqual(self.titles(ordering='title'), ['April', 'March', 'May'])
+        self.create_task(title='Also March', dueDate=datetime.datetime(2026, 3, 1, tzinfo=datetime.timezone.utc))
+        self.assertEqual(self.titles(ordering='dueDate,-title')[:2], ['March', 'Also March'])
+
+    def test_invalid_parameters_are_rejected(self):
+        for params, field in [
+            ({'dueAfter': '01/03/2026'}, 'dueAfter'),
+            ({'dueBefore': '2026-13-01'}, 'dueBefore'),
+            ({'ordering': 'dueDate,password'}, 'ordering'),
+            ({'assignee': 'anna'}, 'assignee'),
+        ]:
+            response = self.client.get(self.url, params)
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+            self.assertIn(field, response.json())
+
+    def test_due_date_is_required(self):
+        payload = task_payload()
+        del payload['dueDate']
+        for body in [payload, task_payload(dueDate=None), task_payload(dueDate='soon')]:
+            response = self.client.post(self.url, body, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('dueDate', response.json())
+
+        response = self.client.post(self.url, task_payload(dueDate='2026-06-01'), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Task.objects.get(title='Task').dueDate, datetime.datetime(2026, 6, 1, tzinfo=datetime.timezone.utc))
+
+
+class TaskSearchTests(TaskAPITestCase):
+    """
+    search/ ranks the FTS5 matches (title before subtasks before description), highlights
+    them and falls back to substring filters where the index is missing.
+    """
+    url = reverse('tasks-search')
+
+    def setUp(self):
+        super().setUp()
+        self.landing = self.create_task(title='Landing page', description='Hero <b>image</b>')
+        self.copy = self.create_task(title='Copy', description=f'{"Filler words " * 20}then the landing copy{" and more" * 20}')
+        self.review = self.create_task(title='Review')
+        Subtask.objects.replace({self.review: [{'key': 'a', 'title': 'Check landing links', 'completed': False}]})
+        self.create_task(title='Private landing', isPrivate=True, ownerId='7')
+
+    def search(self, query, **params):
+        response = self.client.get(self.url, {'q': query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()['results']
+
+    def titles(self, query, **params):
+        return [result['title'] for result in self.search(query, **params)]
+
+    def test_matches_are_ranked_and_scoped(self):
+        self.assertEqual(self.titles('land'), ['Landing page', 'Review', 'Copy'])
+        self.assertEqual(self.titles('LAND pag'), ['Landing page'])
+        self.assertEqual(self.titles('anding'), [])
+        self.assertEqual(self.titles('land', viewMode='private', userId='7'), ['Private landing'])
+
+    def test_highlights_mark_the_matched_prefixes(self):
+        highlights = {result['id']: result['highlights'] for result in self.search('land')}
+
+        self.assertEqual(highlights[self.landing.pk], {'title': '<mark>Land</mark>ing page'})
+        self.assertEqual(highlights[self.review.pk], {'subtasks': [{'id': 'a', 'title': 'Check <mark>land</mark>ing links'}]})
+        snippet = highlights[self.copy.pk]['description']
+        self.assertIn('then the <mark>land</mark>ing copy', snippet)
+        self.assertTrue(snippet.startswith('…') and snippet.endswith('…'))
+        self.assertLess(len(snippet.replace('<mark>', '').replace('</mark>', '')), SNIPPET_LENGTH + 20)
+        self.assertEqual(
+            self.search('hero imag')[0]['highlights'],
+            {'description': '<mark>Hero</mark> &lt;b&gt;<mark>imag</mark>e&lt;/b&gt;'}
+        )
+
+    def test_subtask_writes_refresh_the_index_once_per_task(self):
+        subtasks = [{'id': str(index), 'title': f'Deploy step {index}', 'completed': False} for index in range(50)]
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.patch(reverse('tasks-detail', args=[self.copy.pk]), {'subtasks': subtasks}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        refreshes = [query['sql'] for query in captured if query['sql'].startswith(f'UPDATE {task_index.table}')]
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(self.titles('deploy'), ['Copy'])
+
+        response = self.client.patch(
+            reverse('tasks-update-subtask', args=[self.copy.pk, '3']), {'title': 'Release notes'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.titles('release'), ['Copy'])
+
+        response = self.client.patch(reverse('tasks-detail', args=[self.copy.pk]), {'subtasks': []}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.titles('deploy'), [])
+        self.assertEqual(self.titles('release'), [])
+
+    def test_ensure_replaces_outdated_triggers(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TRIGGER {task_index.table}_subtask_insert AFTER INSERT ON {Subtask._meta.db_table} '
+                f'BEGIN SELECT 1; END'
+            )
+            cursor.execute(f'DROP TRIGGER {task_index.table}_update')
+
+        self.assertTrue(task_index.ensure())
+
+        with connection.cursor() as cursor:
+            self.assertEqual(task_index.get_existing_triggers(cursor), set(task_index.get_trigger_sql()))
+        self.assertFalse(task_index.ensure())
+        self.assertEqual(self.titles('land'), ['Landing page', 'Review', 'Copy'])
+
+    def test_fallback_without_the_index_matches_substrings(self):
+        with mock.patch.object(task_index, 'is_available', return_value=False), \
+                CaptureQueriesContext(connection) as captured:
+            newest_first = self.titles('andin')
+            both_terms = self.titles('land links')
+            private = self.titles('LANDING', viewMode='private', userId='7')
+
+        self.assertEqual(newest_first, ['Review', 'Copy', 'Landing page'])
+        self.assertEqual(both_terms, ['Review'])
+        self.assertEqual(private, ['Private landing'])
+        self.assertFalse([query for query in captured if task_index.table in query['sql']])
+
+
+class MigrationTestCase(TransactionTestCase):
+    """Starts at migrate_from and migrates back to the latest state afterwards."""
+    migrate_from = []
+    migrate_to = []
+
+    def setUp(self):
+        self.executor = MigrationExecutor(connection)
+        self.executor.migrate(self.migrate_from)
+        self.addCleanup(self.migrate_to_latest)
+
+    def migrate_to_latest(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def migrate(self, targets):
+        """Migrates to targets and returns the historical apps of that state."""
+        self.executor = MigrationExecutor(connection)
+        self.executor.migrate(targets)
+        return self.executor.loader.project_state(targets).apps
+
+
+class TaskDatetimeMigrationTests(MigrationTestCase):
+    """Migration 0002 converts the legacy date strings and reports what it could not parse."""
+    migrate_from = [('board_tasks_app', '0001_initial')]
+    migrate_to = [('board_tasks_app', '0002_task_datetime_fields_and_indexes')]
+
+    def test_legacy_formats_are_converted(self):
+        Task = self.executor.loader.project_state(self.migrate_from).apps.get_model('board_tasks_app', 'Task')
+        values = {
+            'iso': ('2026-02-10T08:30:00.000Z', '2026-02-03T12:00:00Z', '2026-02-04T08:00:00+02:00'),
+            'date': ('2026-02-10', '2026-02-03', None),
+            'form': ('10/02/2026', '03.02.2026', ''),
+            'broken': ('someday', 'garbage', 'never'),
+        }
+        ids = {
+            title: Task.objects.create(
+                title=title, priority='low', category='User Story', dueDate=due, createdAt=created, updatedAt=updated
+            ).pk
+            for title, (due, created, updated) in values.items()
+        }
+        output = io.StringIO()
+
+        with contextlib.redirect_stdout(output):
+            self.executor = MigrationExecutor(connection)
+            self.executor.migrate(self.migrate_to)
+
+        Task = self.executor.loader.project_state(self.migrate_to).apps.get_model('board_tasks_app', 'Task')
+        rows = {task.title: task for task in Task.objects.all()}
+        utc = datetime.timezone.utc
+        self.assertEqual(rows['iso'].dueDate, datetime.datetime(2026, 2, 10, 8, 30, tzinfo=utc))
+        self.assertEqual(rows['iso'].updatedAt, datetime.datetime(2026, 2, 4, 6, 0, tzinfo=utc))
+        self.assertEqual(rows['date'].dueDate, datetime.datetime(2026, 2, 10, tzinfo=utc))
+        self.assertIsNone(rows['date'].updatedAt)
+        self.assertEqual(rows['form'].dueDate, datetime.datetime(2026, 2, 10, tzinfo=utc))
+        self.assertEqual(rows['form'].createdAt, datetime.datetime(2026, 2, 3, tzinfo=utc))
+        self.assertIsNone(rows['broken'].dueDate)
+        self.assertIsNone(rows['broken'].updatedAt)
+        self.assertIsNotNone(rows['broken'].createdAt)
+        report = output.getvalue()
+        self.assertIn('1 task(s) with unparseable dates', report)
+        self.assertIn(f"task {ids['broken']}: dueDate='someday', createdAt='garbage', updatedAt='never'", report)
+
+
+class TaskAssignmentMigrationTests(MigrationTestCase):
+    """Migration 0003 moves assignedTo into TaskAssignment rows and back."""
+    migrate_from = [
+        ('board_tasks_app', '0002_task_datetime_fields_and_indexes'),
+        ('contacts_app', '0002_remove_contact_name_contact_firstname_and_more'),
+    ]
+    migrate_to = [('board_tasks_app', '0003_task_assignment')]
+
+    def test_assigned_to_round_trip(self):
+        apps = self.executor.loader.project_state(self.migrate_from).apps
+        Contact = apps.get_model('contacts_app', 'Contact')
+        Task = apps.get_model('board_tasks_app', 'Task')
+        first, second = [
+            Contact.objects.create(firstname='Anna', lastname=name, email=f'{name}@example.com', phone='1').pk
+            for name in ['Ahn', 'Berg']
+        ]
+        values = {'priority': 'low', 'category': 'User Story', 'createdAt': timezone.now()}
+        assigned = Task.objects.create(title='Assigned', assignedTo=[str(second), first, 'gone', str(second)], **values)
+        unassigned = Task.objects.create(title='Unassigned', assignedTo=[], **values)
+
+        apps = self.migrate(self.migrate_to)
+
+        TaskAssignment = apps.get_model('board_tasks_app', 'TaskAssignment')
+        rows = TaskAssignment.objects.order_by('position').values_list('task_id', 'contact_id', 'position')
+        self.assertEqual(list(rows), [(assigned.pk, second, 0), (assigned.pk, first, 1)])
+
+        apps = self.migrate(self.migrate_from)
+
+        Task = apps.get_model('board_tasks_app', 'Task')
+        self.assertEqual(Task.objects.get(pk=assigned.pk).assignedTo, [str(second), str(first)])
+        self.assertEqual(Task.objects.get(pk=unassigned.pk).assignedTo, [])
+
+
+class SubtaskMigrationTests(MigrationTestCase):
+    """Migration 0004 moves the subtasks JSON lists into Subtask rows and back."""
+    migrate_from = [('board_tasks_app', '0003_task_assignment')]
+    migrate_to = [('board_tasks_app', '0004_subtask_rows')]
+
+    def test_subtasks_round_trip(self):
+        Task = self.executor.loader.project_state(self.migrate_from).apps.get_model('board_tasks_app', 'Task')
+        values = {'priority': 'low', 'category': 'User Story', 'createdAt': timezone.now()}
+        task = Task.objects.create(title='Checklist', subtasks=[
+            {'id': 'b', 'title': 'Second', 'completed': True},
+            {'id': 'a', 'title': 'First', 'completed': False},
+            {'title': 'No id'},
+            'not a subtask',
+        ], **values)
+        empty = Task.objects.create(title='Empty', subtasks=[], **values)
+
+        apps = self.migrate(self.migrate_to)
+
+        Subtask = apps.get_model('board_tasks_app', 'Subtask')
+        rows = Subtask.objects.order_by('position').values_list('key', 'title', 'completed', 'position')
+        self.assertEqual(list(rows), [('b', 'Second', True, 0), ('a', 'First', False, 1), ('2-0', 'No id', False, 2)])
+        counters = apps.get_model('board_tasks_app', 'Task').objects.values_list('subtasksTotal', 'subtasksDone')
+        self.assertEqual(counters.get(pk=task.pk), (3, 1))
+
+        apps = self.migrate(self.migrate_from)
+
+        Task = apps.get_model('board_tasks_app', 'Task')
+        self.assertEqual(Task.objects.get(pk=task.pk).subtasks, [
+            {'id': 'b', 'title': 'Second', 'completed': True},
+            {'id': 'a', 'title': 'First', 'completed': False},
+            {'id': '2-0', 'title': 'No id', 'completed': False},
+        ])
+        self.assertEqual(Task.objects.get(pk=empty.pk).subtasks, [])
+
+
+class TaskWriteTests(TaskAPITestCase):
+    """A task write, relations included, is one change: one sequence number, one bump."""
+
+    def setUp(self):
+        super().setUp()
+        self.contacts = [
+            Contact.objects.create(firstname='Anna', lastname=name, email=f'{name}@example.com', phone='1').pk
+            for name in ['Ahn', 'Berg']
+        ]
+        self.payload = task_payload(
+            assignedTo=[str(pk) for pk in self.contacts],
+            subtasks=[{'id': '1', 'title': 'Step 1', 'completed': True}, {'id': '2', 'title': 'Step 2', 'completed': False}],
+        )
+
+    def sequence(self):
+        return CollectionVersion.objects.sequence(CollectionVersion.TASKS)[0]
+
+    def assertOneChange(self, before, task_id):
+        self.assertEqual(self.sequence(), before + 1)
+        self.assertEqual(Task.objects.get(pk=task_id).changeSeq, before + 1)
+
+    def test_create_with_relations_is_one_change(self):
+        before = self.sequence()
+
+        response = self.client.post(reverse('tasks-list'), self.payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        task = Task.objects.get()
+        self.assertOneChange(before, task.pk)
+        self.assertEqual(list(task.assignments.order_by('position').values_list('contact_id', flat=True)), self.contacts)
+        self.assertEqual(list(task.subtasks.order_by('position').values_list('key', flat=True)), ['1', '2'])
+
+    def test_update_with_relations_is_one_change(self):
+        task_id = self.create_task().pk
+        for payload in [self.payload, {'assignedTo': [str(self.contacts[1])]}, {'subtasks': []}]:
+            before = self.sequence()
+
+            response = self.client.patch(reverse('tasks-detail', args=[task_id]), payload, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertOneChange(before, task_id)
+        task = Task.objects.get(pk=task_id)
+        self.assertEqual(list(task.assignments.values_list('contact_id', flat=True)), [self.contacts[1]])
+        self.assertFalse(task.subtasks.exists())
+
+    def test_subtask_counters_are_written_with_the_task(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(reverse('tasks-list'), self.payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        task_updates = [query['sql'] for query in captured if query['sql'].startswith('UPDATE "board_tasks_app_task"')]
+        self.assertEqual(task_updates, [])
+        task = Task.objects.get()
+        self.assertEqual((task.subtasksTotal, task.subtasksDone), (2, 1))
+
+        subtasks = [{'id': '3', 'title': 'Step 3', 'completed': True}]
+        response = self.client.patch(reverse('tasks-detail', args=[task.pk]), {'subtasks': subtasks}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        task.refresh_from_db()
+        self.assertEqual((task.subtasksTotal, task.subtasksDone), (1, 1))
+
+
+class TaskBulkTests(TaskAPITestCase):
+    url = reverse('tasks-bulk')
+
+    def setUp(self):
+        super().setUp()
+        self.public = self.create_task(title='Public')
+        self.private = self.create_task(title='Private', isPrivate=True, ownerId='7', priority='urgent')
+        self.doomed = self.create_task(title='Doomed', status='inprogress')
+
+    def state(self):
+        return (
+            list(Task.objects.order_by('id').values_list('id', 'title', 'status', 'priority', 'changeSeq')),
+            list(BoardSummary.objects.order_by('id').values()),
+            CollectionVersion.objects.sequence(CollectionVersion.TASKS),
+            Tombstone.objects.count(),
+        )
+
+    def test_create_update_delete_keep_board_summary(self):
+        response = self.client.post(self.url, {'operations': [
+            {'op': 'create', 'data': task_payload(title='New public')},
+            {'op': 'create', 'data': task_payload(title='New private', isPrivate=True, ownerId='7', priority='urgent')},
+            {'op': 'update', 'id': self.public.pk, 'data': {'status': 'done'}},
+            {'op': 'update', 'id': self.private.pk, 'data': {'isPrivate': False, 'ownerId': ''}},
+            {'op': 'delete', 'id': self.doomed.pk},
+        ]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()['results']
+        self.assertEqual([result['index'] for result in results], [0, 1, 2, 3, 4])
+        self.assertFalse(any('errors' in result for result in results))
+        created = Task.objects.filter(pk__in=[results[0]['id'], results[1]['id']])
+        self.assertEqual(sorted(created.values_list('title', flat=True)), ['New private', 'New public'])
+        self.assertEqual(Task.objects.get(pk=self.public.pk).status, 'done')
+        self.assertFalse(Task.objects.get(pk=self.private.pk).isPrivate)
+        self.assertFalse(Task.objects.filter(pk=self.doomed.pk).exists())
+        self.assertBoardSummaryConsistent()
+
+        seq = CollectionVersion.objects.sequence(CollectionVersion.TASKS)[0]
+        written = Task.objects.filter(pk__in=[results[0]['id'], results[1]['id'], self.public.pk, self.private.pk])
+        self.assertEqual(set(written.values_list('changeSeq', flat=True)), {seq})
+        self.assertTrue(Tombstone.objects.filter(collection=CollectionVersion.TASKS, objectId=self.doomed.pk, seq=seq).exists())
+
+    def test_one_invalid_operation_rolls_back_the_batch(self):
+        before = self.state()
+
+        response = self.client.post(self.url, {'operations': [
+            {'op': 'create', 'data': task_payload(title='Never created')},
+            {'op': 'update', 'id': self.public.pk, 'data': {'status': 'done'}},
+            {'op': 'delete', 'id': self.doomed.pk},
+            {'op': 'update', 'id': self.private.pk, 'data': {'priority': 'whenever'}},
+        ]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.state(), before)
+        self.assertBoardSummaryConsistent()
+
+    def test_errors_are_reported_per_operation(self):
+        response = self.client.post(self.url, {'operations': [
+            {'op': 'update', 'id': self.public.pk, 'data': {'priority': 'low'}},
+            {'op': 'update', 'id': 999999, 'data': {'priority': 'low'}},
+            {'op': 'archive', 'id': self.public.pk},
+            {'op': 'delete', 'id': self.public.pk},
+            {'op': 'create'},
+            {'op': 'create', 'data': task_payload(title='')},
+        ]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        results = response.json()['results']
+        self.assertEqual([result['index'] for result in results], [0, 1, 2, 3, 4, 5])
+        self.assertNotIn('errors', results[0])
+        self.assertEqual(results[1]['errors'], {'id': ['Task not found.']})
+        self.assertIn('op', results[2]['errors'])
+        self.assertEqual(results[3]['errors'], {'id': ['Task is referenced by more than one operation.']})
+        self.assertIn('data', results[4]['errors'])
+        self.assertIn('title', results[5]['errors'])
+        self.assertEqual(Task.objects.get(pk=self.public.pk).priority, 'medium')
+
+    def test_operation_count_is_capped(self):
+        operations = [{'op': 'create', 'data': task_payload()}] * (TaskBulkSerializer.MAX_OPERATIONS + 1)
+
+        response = self.client.post(self.url, {'operations': operations}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('operations', response.json())
+        self.assertEqual(Task.objects.count(), 3)
+
+    def test_empty_batch_is_rejected(self):
+        response = self.client.post(self.url, {'operations': []}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('operations', response.json())
+
+
+class TaskMoveTests(TaskAPITestCase):
+    """The move action rewrites the moved task's rank only; rebalance keeps the order."""
+    public = (False, '')
+
+    def setUp(self):
+        super().setUp()
+        self.a, self.b, self.c = [self.create_task(title=title) for title in 'ABC']
+        self.d = self.create_task(title='D', status='done')
+
+    def column(self, status='todo'):
+        return list(Task.objects.column(self.public, status).order_by('rank', 'id').values_list('title', flat=True))
+
+    def move(self, task, **data):
+        return self.client.post(reverse('tasks-move', args=[task.pk]), data, format='json')
+
+    def test_move_between_neighbours_writes_one_task(self):
+        before = list(Task.objects.exclude(pk=self.c.pk).order_by('id').values_list('rank', 'changeSeq'))
+        seq = CollectionVersion.objects.sequence(CollectionVersion.TASKS)[0]
+
+        response = self.move(self.c, after=self.a.pk, before=self.b.pk)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['id'], self.c.pk)
+        self.assertEqual(self.column(), ['A', 'C', 'B'])
+        self.assertEqual(list(Task.objects.exclude(pk=self.c.pk).order_by('id').values_list('rank', 'changeSeq')), before)
+        self.assertEqual(CollectionVersion.objects.sequence(CollectionVersion.TASKS)[0], seq + 1)
+        self.assertEqual(Task.objects.get(pk=self.c.pk).changeSeq, seq + 1)
+
+    def test_move_next_to_one_neighbour_or_to_the_end(self):
+        self.assertEqual(self.move(self.c, before=self.a.pk).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.column(), ['C', 'A', 'B'])
+
+        self.assertEqual(self.move(self.b, after=self.c.pk).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.column(), ['C', 'B', 'A'])
+
+        self.assertEqual(self.move(self.c).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.column(), ['B', 'A', 'C'])
+
+    def test_move_to_another_column(self):
+        response = self.move(self.a, status='done', before=self.d.pk)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.column(), ['B', 'C'])
+        self.assertEqual(self.column('done'), ['A', 'D'])
+        self.assertBoardSummaryConsistent()
+
+    def test_invalid_neighbours_are_rejected(self):
+        private = self.create_task(title='Private', isPrivate=True, ownerId='7')
+        for data in [
+            {'after': self.d.pk},
+            {'after': private.pk},
+            {'before': self.c.pk},
+            {'after': 999999},
+            {'after': self.b.pk, 'before': self.a.pk},
+        ]:
+            response = self.move(self.c, **data)
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, data)
+        self.assertEqual(self.column(), ['A', 'B', 'C'])
+
+    def test_database_orders_rank_keys_by_code_point(self):
+        ranks = ['a', 'Z', 'b0', '9', 'B', 'Zz', 'a0']
+        tasks = [self.create_task(title=rank, status='inprogress') for rank in ranks]
+        for task, rank in zip(tasks, ranks):
+            Task.objects.filter(pk=task.pk).update(rank=rank)
+
+        self.assertEqual(self.column('inprogress'), sorted(ranks))
+
+    def test_tied_neighbours_rebalance_the_column(self):
+        Task.objects.filter(pk__in=[self.a.pk, self.b.pk]).update(rank=self.a.rank)
+
+        response = self.move(self.c, after=self.a.pk, before=self.b.pk)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.column(), ['A', 'C', 'B'])
+        ranks = list(Task.objects.column(self.public, 'todo').values_list('rank', flat=True))
+        self.assertEqual(len(set(ranks)), 3)
+
+    def test_repeated_moves_to_one_spot_schedule_a_rebalance(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            for _ in range(60):
+                first, second = self.column()[:2]
+                task = Task.objects.get(title=self.column()[-1])
+                response = self.move(
+                    task,
+                    after=Task.objects.get(title=first).pk,
+                    before=Task.objects.get(title=second).pk,
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                if len(Task.objects.get(pk=task.pk).rank) > RANK_REBALANCE_LENGTH:
+                    break
+
+        self.assertTrue(callbacks)
+        order = self.column()
+        ranks = list(Task.objects.column(self.public, 'todo').order_by('rank', 'id').values_list('rank', flat=True))
+        self.assertEqual(len(set(ranks)), len(ranks))
+        self.assertTrue(all(is_rank(rank) for rank in ranks))
+
+        seq = CollectionVersion.objects.sequence(CollectionVersion.TASKS)[0]
+        self.assertEqual(Task.objects.rebalance(self.public, 'todo'), 3)
+
+        self.assertEqual(self.column(), order)
+        tasks = Task.objects.column(self.public, 'todo')
+        self.assertTrue(all(len(rank) <= 2 for rank in tasks.values_list('rank', flat=True)))
+        self.assertEqual(set(tasks.values_list('changeSeq', flat=True)), {seq + 1})
+
+
+class TaskArchiveTests(TaskAPITestCase):
+    """Archiving moves done tasks out of the board; restoring brings them back."""
+
+    def setUp(self):
+        super().setUp()
+        self.contacts = [
+            Contact.objects.create(firstname='Anna', lastname=name, email=f'{name}@example.com', phone='1')
+            for name in ['Ahn', 'Berg']
+        ]
+        self.old = self.create_task(title='Old', status='done')
+        self.old.assignees.set(self.contacts)
+        self.old.subtasks.create(key='1', title='Step 1', completed=True, position=0)
+        self.recent = self.create_task(title='Recent', status='done')
+        self.private = self.create_task(title='Private', status='done', isPrivate=True, ownerId='7')
+        self.todo = self.create_task(title='Todo')
+        Task.objects.filter(pk__in=[self.old.pk, self.private.pk]).update(completedAt=timezone.now() - datetime.timedelta(days=40))
+
+    def archive(self, **options):
+        output = io.StringIO()
+        call_command('archive_tasks', stdout=output, **options)
+        return output.getvalue()
+
+    def test_archive_moves_old_done_tasks(self):
+        since = CollectionVersion.objects.sequence(CollectionVersion.TASKS)[0]
+
+        output = self.archive(after_days=30, batch_size=1)
+
+        self.assertIn('Archived 2 task(s)', output)
+        self.assertEqual(sorted(Task.objects.values_list('title', flat=True)), ['Recent', 'Todo'])
+        archived = ArchivedTask.objects.get(pk=self.old.pk)
+        self.assertEqual(archived.assignedTo, [contact.pk for contact in self.contacts])
+        self.assertEqual(archived.subtasks, [{'id': '1', 'title': 'Step 1', 'completed': True}])
+        self.assertLess(archived.completedAt, timezone.now() - datetime.timedelta(days=30))
+        self.assertTrue(ArchivedTask.objects.filter(pk=self.private.pk).exists())
+        deleted = Tombstone.objects.filter(collection=CollectionVersion.TASKS, seq__gt=since).values_list('objectId', flat=True)
+        self.assertEqual(sorted(deleted), sorted([self.old.pk, self.private.pk]))
+        self.assertBoardSummaryConsistent()
+
+    def test_archive_list_follows_the_view_mode(self):
+        self.archive(after_days=30)
+        url = reverse('archived-tasks-list')
+
+        public = self.client.get(url, {'viewMode': 'public'}).json()['results']
+        private = self.client.get(url, {'viewMode': 'private', 'userId': '7'}).json()['results']
+
+        self.assertEqual([task['title'] for task in public], ['Old'])
+        self.assertEqual([task['title'] for task in private], ['Private'])
+
+    def test_restore_puts_the_task_back(self):
+        self.archive(after_days=30)
+        self.contacts[1].delete()
+
+        response = self.client.post(reverse('archived-tasks-restore', args=[self.old.pk]))
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['id'], self.old.pk)
+        self.assertFalse(ArchivedTask.objects.filter(pk=self.old.pk).exists())
+        task = Task.objects.get(pk=self.old.pk)
+        self.assertEqual(task.title, 'Old')
+        self.assertEqual(list(task.assignments.values_list('contact_id', flat=True)), [self.contacts[0].pk])
+        self.assertEqual(list(task.subtasks.values_list('key', 'completed')), [('1', True)])
+        self.assertGreater(task.completedAt, timezone.now() - datetime.timedelta(minutes=1))
+        self.assertGreater(task.rank, self.recent.rank)
+        self.assertFalse(Tombstone.objects.filter(collection=CollectionVersion.TASKS, objectId=task.pk).exists())
+        self.assertBoardSummaryConsistent()
+
+        self.assertIn('Archived 0 task(s)', self.archive(after_days=30))
+
+    def test_restore_of_unknown_task_is_404(self):
+        response = self.client.post(reverse('archived-tasks-restore', args=[999999]))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TaskImportTests(TaskAPITestCase):
+    """NDJSON task imports keep ids and ranks and report every skipped line."""
+
+    def setUp(self):
+        super().setUp()
+        self.existing = self.create_task(title='Existing')
+
+    def record(self, **overrides):
+        return json.dumps(task_payload(**overrides))
+
+    def test_skipped_lines_are_reported_with_their_numbers(self):
+        lines = [
+            self.record(id=100, title='First'),
+            '',
+            'not json',
+            '[1]',
+            self.record(id=101, title=''),
+            self.record(id=self.existing.pk, title='Taken'),
+            self.record(id=100, title='Repeated'),
+            self.record(id='102', title='Text id'),
+            self.record(title='Without id', status='done', completedAt='yesterday'),
+            self.record(title='Without id', status='done'),
+        ]
+
+        importer = TaskImporter(chunk_size=3).run(lines)
+
+        self.assertEqual((importer.imported, importer.skipped), (2, 7))
+        errors = dict(importer.errors)
+        self.assertEqual(sorted(errors), [3, 4, 5, 6, 7, 8, 9])
+        self.assertIn('title', errors[5])
+        self.assertEqual(errors[6], {'non_field_errors': [f'Task {self.existing.pk} already exists.']})
+        self.assertEqual(errors[7], {'non_field_errors': ['Task 100 already exists.']})
+        self.assertIn('id', errors[8])
+        self.assertIn('completedAt', errors[9])
+        self.assertEqual(Task.objects.get(pk=100).title, 'First')
+        self.assertEqual(Task.objects.get(title='Without id').status, 'done')
+        self.assertBoardSummaryConsistent()
+
+    def test_export_round_trip_keeps_ids_ranks_and_completion(self):
+        self.create_task(title='Done', status='done')
+        fields = ['id', 'title', 'status', 'rank', 'completedAt', 'subtasksTotal']
+        before = list(Task.objects.order_by('id').values_list(*fields))
+        response = self.client.get(reverse('tasks-export'), HTTP_ACCEPT='application/x-ndjson')
+        lines = b''.join(response.streaming_content).splitlines()
+        Task.objects.all().delete()
+
+        importer = TaskImporter().run(lines)
+
+        self.assertEqual((importer.imported, importer.skipped), (2, 0))
+        self.assertEqual(list(Task.objects.order_by('id').values_list(*fields)), before)
+        self.assertBoardSummaryConsistent()
+
+    def test_command_fails_when_lines_were_skipped(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.ndjson', delete=False) as file:
+            file.write(self.record(id=100, title='First') + '\n{\n')
+        self.addCleanup(os.remove, file.name)
+        output = io.StringIO()
+
+        with self.assertRaisesMessage(CommandError, 'Skipped 1 line(s).'):
+            call_command('import_ndjson', 'tasks', file.name, stdout=output)
+
+        report = json.loads(output.getvalue())
+        self.assertEqual((report['imported'], report['skipped']), (1, 1))
+        self.assertEqual([error['line'] for error in report['errors']], [2])
+
+
+class BoardSummaryEndpointTests(TaskAPITestCase):
+    """GET summary/ (the incrementally kept BoardSummary rows) equals BoardSummary.objects.compute() after every write path."""
+    url = reverse('board-summary')
+    boards = [
+        {'viewMode': 'public'},
+        {'viewMode': 'private', 'userId': '7'},
+        {'viewMode': 'private', 'userId': '8'},
+        {'viewMode': 'all'},
+    ]
+
+    def expected(self, params):
+        boards = BoardSummary.objects.compute()
+        if params['viewMode'] == 'all':
+            summary = {name: sum(getattr(board, name) for board in boards.values()) for name in BoardSummary.objects.COUNTERS}
+            deadlines = [board.nextDeadline for board in boards.values() if board.nextDeadline is not None]
+            summary['nextDeadline'] = min(deadlines, default=None)
+        else:
+            board = (True, params['userId']) if params['viewMode'] == 'private' else (False, '')
+            summary = boards.get(board) or BoardSummary()
+        return BoardSummarySerializer(summary).data
+
+    def assertSummaryMatches(self, step):
+        for params in self.boards:
+            with self.subTest(step=step, **params):
+                response = self.client.get(self.url, params)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.json(), self.expected(params))
+
+    def create(self, **overrides):
+        response = self.client.post(reverse('tasks-list'), task_payload(**overrides), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Task.objects.get(title=overrides['title'])
+
+    def test_every_write_path_keeps_the_summary(self):
+        urgent = self.create(title='Urgent', priority='urgent', dueDate='2026-03-01T00:00:00Z')
+        private = self.create(title='Private', isPrivate=True, ownerId='7', priority='urgent', dueDate='2026-02-01T00:00:00Z')
+        self.create(title='Plain')
+        self.assertSummaryMatches('create')
+
+        response = self.client.patch(reverse('tasks-detail', args=[urgent.pk]), {'dueDate': '2026-01-15T00:00:00Z'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.patch(reverse('tasks-detail', args=[private.pk]), {'ownerId': '8'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertSummaryMatches('update')
+
+        response = self.client.post(reverse('tasks-move', args=[urgent.pk]), {'status': 'done'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.patch(reverse('tasks-detail', args=[private.pk]), {'status': 'inprogress'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.post(reverse('tasks-bulk'), {'operations': [
+            {'op': 'update', 'id': private.pk, 'data': {'status': 'awaitfeedback', 'isPrivate': False, 'ownerId': ''}},
+            {'op': 'create', 'data': task_payload(title='Bulk', status='done', isPrivate=True, ownerId='7')},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertSummaryMatches('status change')
+
+        response = self.client.delete(reverse('tasks-detail', args=[Task.objects.get(title='Plain').pk]))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertSummaryMatches('delete')
+
+        Task.objects.filter(status='done').update(completedAt=timezone.now() - datetime.timedelta(days=40))
+        call_command('archive_tasks', after_days=30, stdout=io.StringIO())
+        self.assertFalse(Task.objects.filter(status='done').exists())
+        self.assertSummaryMatches('archive')
+
+        response = self.client.post(reverse('archived-tasks-restore', args=[urgent.pk]))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertSummaryMatches('restore')
+
+        importer = TaskImporter().run([
+            json.dumps(task_payload(title='Imported', priority='urgent', dueDate='2026-01-01T00:00:00Z')),
+            json.dumps(task_payload(title='Imported private', isPrivate=True, ownerId='8', status='done')),
+        ])
+        self.assertEqual(importer.imported, 2)
+        self.assertSummaryMatches('import')
+
+
+@override_settings(
+    API_RESPONSE_CACHE={'ALIAS': 'stress-dummy'},
+    CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'stress-dummy': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+    },
+)
+class StressWritesTests(TransactionTestCase):
+    """
+    Reduced stress_writes run: parallel TaskViewSet writers against an on-disk database
+    with the production SQLite profile never hit "database is locked" or a 5xx.
+    """
+    writers = 4
+    requests = 10
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        # Every thread opens its own connection from the settings: point them at a fresh
+        # file database and keep the test database's connection for the teardown.
+        original_settings, original_connection = connections.settings['default'], connections['default']
+        connections.settings['default'] = {
+            **original_settings,
+            **sqlite_database(os.path.join(directory.name, 'stress.sqlite3'), profile='production'),
+        }
+        connections['default'] = connections.create_connection('default')
+        self.addCleanup(self.restore_connection, original_settings, original_connection)
+        call_command('migrate', verbosity=0)
+        user = User.objects.create_user('stress@example.com', 'Stress', 'stress-password')
+        self.token = Token.objects.create(user=user).key
+
+    def restore_connection(self, original_settings, original_connection):
+        connections['default'].close()
+        connections.settings['default'] = original_settings
+        connections['default'] = original_connection
+
+    def test_parallel_writers_never_lock_or_fail(self):
+        workers = [Worker(self.token, self.requests, write=True) for _ in range(self.writers)]
+
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(sum(worker.locked for worker in workers), 0)
+        self.assertEqual([error for worker in workers for error in worker.errors], [])
+        self.assertEqual(sum(len(worker.durations) for worker in workers), self.writers * self.requests * 3)
+        self.assertEqual(connection.cursor().execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        self.assertFalse(Task.objects.exists())
@@ -0,0 +1,11 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from .async_views import AsyncContactViewSet
+
+# Same routes and names as urls.py, with the async viewset (served by core/asgi.py).
+router = DefaultRouter()
+router.register(r'', AsyncContactViewSet, basename='contact')
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
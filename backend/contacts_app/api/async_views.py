@@ -0,0 +1,13 @@
+from core.async_views import AsyncViewSetMixin
+from sync_app.api.mixins import AsyncConditionalGetMixin
+from .views import ContactViewSet
+
+
+class AsyncContactViewSet(AsyncConditionalGetMixin, AsyncViewSetMixin, ContactViewSet):
+    """
+    Async equivalent of ContactViewSet, served under ASGI (core/urls_async.py).
+    List (through ContactListReader) and retrieve read through the async ORM, with
+    ETag / 304 handling and the response cache awaited on the event loop. Writes and
+    the custom actions run the sync implementation through sync_to_async.
+    Responses are identical to ContactViewSet.
+    """
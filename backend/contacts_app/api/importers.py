@@ -0,0 +1,32 @@
+from contacts_app.models import Contact
+from core.ndjson import NdjsonImporter
+from sync_app.models import CollectionVersion
+from .serializers import ContactSerializer
+
+
+class ContactImporter(NdjsonImporter):
+    """
+    ContactImporter
+    Imports contacts exported as NDJSON (ContactExportReader lines), keeping their ids
+    so the assignees of tasks imported afterwards still match; records with an id that
+    already exists are skipped. One bulk INSERT and one change sequence number per chunk.
+    """
+    serializer_class = ContactSerializer
+
+    def build(self, record, data):
+        contact = Contact(id=self.parse_id(record), **data)
+        contact.update_sort_key()
+        return contact
+
+    def write(self, items):
+        ids = [contact.pk for _, contact in items if contact.pk is not None]
+        existing = Contact.objects.filter(pk__in=ids).values_list('pk', flat=True)
+        items = self.reject_existing(items, existing, lambda contact: contact.pk, 'Contact {} already exists.')
+        if not items:
+            return 0
+        contacts = [contact for _, contact in items]
+        seq = CollectionVersion.objects.bump(CollectionVersion.CONTACTS)
+        for contact in contacts:
+            contact.changeSeq = seq
+        Contact.objects.bulk_create(contacts)
+        return len(contacts)
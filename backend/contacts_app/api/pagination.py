@@ -0,0 +1,11 @@
+from rest_framework.pagination import PageNumberPagination
+
+
+class ContactGroupPagination(PageNumberPagination):
+    """
+    Pages inside one letter bucket: `?page=<n>&pageSize=<size>` (default 100),
+    returns `{"count", "next", "previous", "results"}`.
+    """
+    page_size = 100
+    page_size_query_param = 'pageSize'
+    max_page_size = 1000
@@ -0,0 +1,18 @@
+from core.readers import ValuesListReader
+from .serializers import ContactSerializer, ContactChangeSerializer
+
+
+class ContactListReader(ValuesListReader):
+    """
+    ContactListReader
+    Read path of the contact list: the contact columns via values().
+    """
+    serializer_class = ContactSerializer
+
+
+class ContactExportReader(ContactListReader):
+    """
+    ContactExportReader
+    Contacts as exported to NDJSON: the list representation plus `id`.
+    """
+    serializer_class = ContactChangeSerializer
@@ -1,10 +1,18 @@
 from rest_framework import serializers
 from contacts_app.models import Contact
+from core.serializers import ProfiledSerializerMixin
 
-class ContactSerializer(serializers.ModelSerializer):
+class ContactSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
     """Serializer for Contact model.
     Serializes and deserializes Contact instances for API requests and responses.
     """
     class Meta:
         model = Contact
-        fields = ['firstname', 'lastname', 'email', 'phone']
\ No newline at end of file
+        fields = ['firstname', 'lastname', 'email', 'phone']
+
+class ContactChangeSerializer(ContactSerializer):
+    """Serializer for the contact delta-sync feed.
+    Same representation as ContactSerializer plus the `id` clients need to merge rows.
+    """
+    class Meta(ContactSerializer.Meta):
+        fields = ['id', *ContactSerializer.Meta.fields]
@@ -1,9 +1,23 @@
+from django.db.models import Count
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from contacts_app.models import Contact
-from .serializers import ContactSerializer
+from contacts_app.search import contact_index
+from .serializers import ContactSerializer, ContactChangeSerializer
+from .readers import ContactExportReader, ContactListReader
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
+from core.ndjson import export_records, streaming_response
+from core.readers import ValuesListMixin
+from core.renderers import FastJSONRenderer, NdjsonRenderer
+from core.search import SearchPagination, parse_terms
+from core.text import sort_letter
+from .pagination import ContactGroupPagination
+from sync_app.api.mixins import CachedResponseMixin, ChangeFeedMixin
+from sync_app.models import CollectionVersion
 
-class ContactViewSet(viewsets.ModelViewSet):
+class ContactViewSet(ChangeFeedMixin, CachedResponseMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet for Contact model.
     Provides CRUD operations for contacts.
@@ -11,7 +25,80 @@ class ContactViewSet(viewsets.ModelViewSet):
     - Only authenticated users can access and manage contacts.
     - Uses ContactSerializer for serialization.
     - Returns all contact entries in the system.
+    - List and retrieve responses carry ETag / Last-Modified and answer 304 when unchanged.
+    - Rendered list responses are cached server-side (see CachedResponseMixin).
+    - The list is built from values() rows (ContactListReader) and rendered with orjson when available.
+    - Delta sync via GET contacts/changes/?since=<cursor> (see ChangeFeedMixin).
+    - Typeahead search via GET contacts/search/?q=<text> (see search()).
+    - Alphabetical grouping via GET contacts/groups/ and contacts/groups/<letter>/.
+    - Streaming NDJSON export via GET contacts/export/ (see export()).
     """
     queryset = Contact.objects.all()
     serializer_class = ContactSerializer
-    permission_classes = [IsAuthenticated]
\ No newline at end of file
+    permission_classes = [IsAuthenticated]
+    list_reader_class = ContactListReader
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    version_collections = [CollectionVersion.CONTACTS]
+    cached_actions = ['list', 'search', 'groups', 'group']
+    change_collection = CollectionVersion.CONTACTS
+    change_serializer_class = ContactChangeSerializer
+
+    @action(detail=False, methods=['get'], url_path='search')
+    def search(self, request):
+        """
+        Ranked prefix search over first name, last name and email: every word of `q`
+        must start a word of one of them (`?q=ann sch` finds "Anna Schmidt").
+        Served from the FTS5 index on SQLite (bm25, name matches first) and from the
+        Lower() indexes elsewhere. Paginated with `page` / `pageSize` (default 20);
+        results include the contact `id`. Conditional GET and the response cache apply.
+        """
+        return self.conditional_response(self.search_response, request)
+
+    def search_response(self, request):
+        queryset = contact_index.filter(self.get_queryset(), parse_terms(request.query_params.get('q')))
+        paginator = SearchPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = ContactChangeSerializer(page, many=True, context=self.get_serializer_context())
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['get'], url_path='export', renderer_classes=[FastJSONRenderer, NdjsonRenderer])
+    def export(self, request):
+        """
+        Streams all contacts as NDJSON, one record (with `id`) per line in id order,
+        read in chunks with QuerySet.iterator(). Import them with `import_ndjson contacts`.
+        """
+        queryset = self.get_queryset().order_by('pk')
+        return streaming_response(export_records(ContactExportReader(), queryset), 'contacts.ndjson')
+
+    @action(detail=False, methods=['get'], url_path='groups')
+    def groups(self, request):
+        """
+        Letter buckets of the contact list with their sizes, e.g.
+        `{"total": 3, "groups": [{"letter": "A", "count": 2}, {"letter": "#", "count": 1}]}`.
+        Counted from the (sortLetter, sortKey) index; `#` holds names not starting with a letter.
+        """
+        return self.conditional_response(self.groups_response, request)
+
+    def groups_response(self, request):
+        rows = self.get_queryset().order_by().values('sortLetter').annotate(count=Count('id'))
+        groups = sorted(
+            ({'letter': row['sortLetter'], 'count': row['count']} for row in rows),
+            key=lambda group: (group['letter'] == '#', group['letter'])
+        )
+        return Response({'total': sum(group['count'] for group in groups), 'groups': groups})
+
+    @action(detail=False, methods=['get'], url_path=r'groups/(?P<letter>[^/]+)')
+    def group(self, request, letter=None):
+        """
+        Contacts of one letter bucket, ordered by name (sortKey), paginated with
+        `page` / `pageSize` (default 100). One indexed range query per page. The letter
+        is folded like sortLetter, so `groups/é/` is the `E` bucket; `%23` is `#`.
+        """
+        return self.conditional_response(self.group_response, request, letter=letter)
+
+    def group_response(self, request, letter=None):
+        queryset = self.get_queryset().filter(sortLetter=sort_letter(letter)).order_by('sortKey', 'id')
+        paginator = ContactGroupPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = ContactChangeSerializer(page, many=True, context=self.get_serializer_context())
+        return paginator.get_paginated_response(serializer.data)
@@ -1,5 +1,16 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class ContactsAppConfig(AppConfig):
     name = 'contacts_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        post_migrate.connect(ensure_search_index, sender=self)
+
+
+def ensure_search_index(using, **kwargs):
+    """Recreates the contact FTS5 triggers after migrations that rebuilt the table."""
+    from .search import contact_index
+    contact_index.ensure(using)
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts_app', '0002_remove_contact_name_contact_firstname_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='changeSeq',
+            field=models.BigIntegerField(db_index=True, default=0),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:00
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from contacts_app.search import contact_index
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Creates the FTS5 index of contact names and emails on SQLite (SQL in FullTextIndex),
+    kept in sync by triggers, so bulk_create and raw SQL writes are indexed too. Other
+    databases, and SQLite builds without FTS5, search through the Lower() indexes instead.
+    """
+    contact_index.create(schema_editor.connection)
+
+
+def drop_search_index(apps, schema_editor):
+    contact_index.drop(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts_app', '0003_contact_change_seq'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(django.db.models.functions.text.Lower('firstname'), name='contact_firstname_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(django.db.models.functions.text.Lower('lastname'), name='contact_lastname_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(django.db.models.functions.text.Lower('email'), name='contact_email_lower_idx'),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:00
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+def fold(text):
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+
+def fill_sort_keys(apps, schema_editor):
+    """Derives sortKey / sortLetter of existing contacts like Contact.update_sort_key()."""
+    Contact = apps.get_model('contacts_app', 'Contact')
+    batch = []
+    for contact in Contact.objects.only('id', 'firstname', 'lastname').iterator(chunk_size=2000):
+        contact.sortKey = fold(f'{contact.firstname} {contact.lastname}').strip()[:255]
+        initial = contact.sortKey[:1]
+        contact.sortLetter = initial.upper() if initial.isalpha() else '#'
+        batch.append(contact)
+        if len(batch) >= 2000:
+            Contact.objects.bulk_update(batch, ['sortKey', 'sortLetter'])
+            batch = []
+    Contact.objects.bulk_update(batch, ['sortKey', 'sortLetter'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts_app', '0004_contact_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='sortKey',
+            field=models.CharField(default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='sortLetter',
+            field=models.CharField(default='#', editable=False, max_length=1),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['sortLetter', 'sortKey', 'id'], name='contact_letter_sort_idx'),
+        ),
+        migrations.RunPython(fill_sort_keys, migrations.RunPython.noop),
+    ]
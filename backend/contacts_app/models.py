@@ -1,13 +1,37 @@
 from django.db import models
+from django.db.models.functions import Lower
+from core.text import fold, sort_letter
 
 class Contact(models.Model):
     """Contact model.
     Represents a contact entry in the system.  
+
+    `sortKey` (case- and accent-folded "firstname lastname") and `sortLetter` (its
+    initial, `#` for non-letters) back the alphabetical grouping; they are derived
+    in update_sort_key(), called before every save (signals.py) and by bulk inserts.
     """
     firstname = models.CharField(max_length=100, default='')
     lastname = models.CharField(max_length=100, blank=True, default='')
     email = models.EmailField()
     phone = models.CharField(max_length=20)
+    changeSeq = models.BigIntegerField(default=0, db_index=True)
+    sortKey = models.CharField(max_length=255, default='', editable=False)
+    sortLetter = models.CharField(max_length=1, default='#', editable=False)
+
+    class Meta:
+        # The Lower() indexes serve contact search on databases without FTS5 (on SQLite
+        # it uses the FTS5 table created in migration 0004); the letter/sort index
+        # serves the grouped list.
+        indexes = [
+            models.Index(Lower('firstname'), name='contact_firstname_lower_idx'),
+            models.Index(Lower('lastname'), name='contact_lastname_lower_idx'),
+            models.Index(Lower('email'), name='contact_email_lower_idx'),
+            models.Index(fields=['sortLetter', 'sortKey', 'id'], name='contact_letter_sort_idx'),
+        ]
+
+    def update_sort_key(self):
+        self.sortKey = fold(f'{self.firstname} {self.lastname}').strip()[:255]
+        self.sortLetter = sort_letter(self.sortKey)
 
     def __str__(self):
         return f"{self.firstname} {self.lastname}".strip()
\ No newline at end of file
@@ -0,0 +1,26 @@
+from django.db.models.functions import Lower
+from core.search import FullTextIndex, prefix_filter
+from .models import Contact
+
+
+def search_contacts_fallback(queryset, terms):
+    """Every term must start the first name, last name or email (Lower() indexes)."""
+    queryset = queryset.annotate(
+        firstname_lower=Lower('firstname'),
+        lastname_lower=Lower('lastname'),
+        email_lower=Lower('email')
+    )
+    return queryset.filter(
+        prefix_filter(['firstname_lower', 'lastname_lower', 'email_lower'], terms)
+    ).order_by('lastname_lower', 'firstname_lower', 'pk')
+
+
+# Name matches rank above email matches.
+contact_index = FullTextIndex(
+    Contact,
+    table='contacts_app_contact_fts',
+    columns=['firstname', 'lastname', 'email'],
+    weights=[10.0, 10.0, 2.0],
+    fallback=search_contacts_fallback,
+    migration=('contacts_app', '0004_contact_search')
+)
@@ -0,0 +1,23 @@
+from django.db.models.signals import pre_save, post_delete
+from django.dispatch import receiver
+from sync_app.models import CollectionVersion, Tombstone
+from sync_app.tracking import tracking_enabled
+from .models import Contact
+
+
+@receiver(pre_save, sender=Contact)
+def set_contact_sort_key(sender, instance, **kwargs):
+    instance.update_sort_key()
+
+
+@receiver(pre_save, sender=Contact)
+def stamp_contact_change(sender, instance, **kwargs):
+    if tracking_enabled():
+        instance.changeSeq = CollectionVersion.objects.bump(CollectionVersion.CONTACTS)
+
+
+@receiver(post_delete, sender=Contact)
+def record_contact_delete(sender, instance, **kwargs):
+    if tracking_enabled():
+        seq = CollectionVersion.objects.bump(CollectionVersion.CONTACTS)
+        Tombstone.objects.record(CollectionVersion.CONTACTS, [instance.pk], seq)
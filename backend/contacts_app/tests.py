@@ -1,3 +1,138 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from contacts_app.models import Contact
+from contacts_app.search import contact_index
+from user_auth_app.models import User
+
+
+class ContactTestCase(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user('tester@example.com', 'Tester', 'test-password')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=user).key}')
+
+    def create_contacts(self, *names):
+        return [
+            Contact.objects.create(firstname=first, lastname=last, email=email, phone='+49 1')
+            for first, last, email in names
+        ]
+
+    def names(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [f"{contact['firstname']} {contact['lastname']}".strip() for contact in response.json()['results']]
+
+
+class ContactGroupTests(ContactTestCase):
+    """groups/ counts the letter buckets, groups/<letter>/ pages through one of them."""
+
+    def setUp(self):
+        super().setUp()
+        self.create_contacts(
+            ('Émile', 'Zoë', 'emile@example.com'),
+            ('Ørjan', '', 'orjan@example.com'),
+            ('anton', 'Berg', 'anton@example.com'),
+            ('Anna', 'Ahn', 'anna@example.com'),
+            ('42', 'Labs', 'labs@example.com'),
+            ('_Team', '', 'team@example.com'),
+        )
+
+    def test_sort_key_and_letter_are_folded(self):
+        contacts = Contact.objects.order_by('pk').values_list('sortKey', 'sortLetter')
+
+        self.assertEqual(list(contacts), [
+            ('emile zoe', 'E'), ('ørjan', 'Ø'), ('anton berg', 'A'), ('anna ahn', 'A'), ('42 labs', '#'), ('_team', '#'),
+        ])
+
+    def test_groups_are_counted_per_letter(self):
+        response = self.client.get(reverse('contact-groups'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {'total': 6, 'groups': [
+            {'letter': 'A', 'count': 2}, {'letter': 'E', 'count': 1}, {'letter': 'Ø', 'count': 1}, {'letter': '#', 'count': 2},
+        ]})
+
+    def test_group_letter_is_folded_like_the_sort_key(self):
+        cases = [
+            ('A', ['Anna Ahn', 'anton Berg']),
+            ('a', ['Anna Ahn', 'anton Berg']),
+            ('E', ['Émile Zoë']),
+            ('é', ['Émile Zoë']),
+            ('ø', ['Ørjan']),
+            ('#', ['42 Labs', '_Team']),
+            ('Z', []),
+        ]
+
+        for letter, names in cases:
+            with self.subTest(letter=letter):
+                response = self.client.get(reverse('contact-group', args=[letter]))
+
+                self.assertEqual(self.names(response), names)
+
+    def test_group_is_paginated_and_follows_renames(self):
+        response = self.client.get(reverse('contact-group', args=['a']), {'pageSize': 1, 'page': 2})
+
+        self.assertEqual(self.names(response), ['anton Berg'])
+        self.assertEqual(response.json()['count'], 2)
+
+        contact = Contact.objects.get(firstname='Ørjan')
+        contact.firstname = 'Åse'
+        contact.save()
+        response = self.client.get(reverse('contact-group', args=['a']))
+
+        self.assertEqual(self.names(response), ['Anna Ahn', 'anton Berg', 'Åse'])
+
+
+class ContactSearchTests(ContactTestCase):
+    """search/ matches word prefixes of the name and email, names ranked first."""
+
+    def setUp(self):
+        super().setUp()
+        self.create_contacts(
+            ('Anna', 'Schmidt', 'a.schmidt@example.com'),
+            ('Anna', 'Ahn', 'ahn@example.com'),
+            ('Émile', 'Müller', 'emile@example.com'),
+            ('Bert', 'Lang', 'annabelle@example.com'),
+        )
+
+    def search(self, query, **params):
+        return self.names(self.client.get(reverse('contact-search'), {'q': query, **params}))
+
+    def test_every_term_must_start_a_word(self):
+        self.assertEqual(self.search('ann sch'), ['Anna Schmidt'])
+        self.assertEqual(self.search('schmidt anna'), ['Anna Schmidt'])
+        self.assertEqual(self.search('nna'), [])
+        self.assertEqual(self.search(''), [])
+
+    def test_name_matches_rank_above_email_matches(self):
+        names = self.search('ann')
+
+        self.assertEqual(sorted(names[:2]), ['Anna Ahn', 'Anna Schmidt'])
+        self.assertEqual(names[2:], ['Bert Lang'])
+
+    def test_accents_and_case_are_ignored(self):
+        self.assertEqual(self.search('EMI'), ['Émile Müller'])
+        self.assertEqual(self.search('mull'), ['Émile Müller'])
+        self.assertEqual(self.search('Müll'), ['Émile Müller'])
+
+    def test_fallback_without_the_index_matches_lowercased_prefixes(self):
+        with mock.patch.object(contact_index, 'is_available', return_value=False):
+            self.assertEqual(self.search('ann sch'), ['Anna Schmidt'])
+            self.assertEqual(self.search('ANN'), ['Anna Ahn', 'Bert Lang', 'Anna Schmidt'])
+            self.assertEqual(self.search('nna'), [])
+            self.assertEqual(self.search('EMILE'), ['Émile Müller'])
+
+    def test_results_are_paginated_with_ids(self):
+        response = self.client.get(reverse('contact-search'), {'q': 'ann', 'pageSize': 2})
+
+        self.assertEqual(response.json()['count'], 3)
+        self.assertEqual(len(response.json()['results']), 2)
+        self.assertEqual(
+            set(response.json()['results'][0]),
+            {'id', 'firstname', 'lastname', 'email', 'phone'}
+        )
@@ -2,6 +2,11 @@
 ASGI config for core project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Serve it with an ASGI server (e.g. ``uvicorn core.asgi:application``) to use the
+live event stream at /api/board-tasks/tasks/stream/.
+
+Under ASGI the API is served by the async viewsets (ASYNC_VIEWS, core/urls_async.py);
+set ASYNC_VIEWS=0 to serve the sync viewsets of core/urls.py instead.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
@@ -12,5 +17,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+os.environ.setdefault('ASYNC_VIEWS', '1')
 
 application = get_asgi_application()
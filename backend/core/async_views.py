@@ -0,0 +1,133 @@
+import copy
+import functools
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import Http404
+from django.shortcuts import aget_object_or_404
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class AsyncAPIViewMixin:
+    """
+    AsyncAPIViewMixin
+    Async request handling for a DRF view or viewset (DRF itself only dispatches
+    synchronously), so under ASGI a request does not occupy a thread while it waits.
+    Place it before the view class.
+
+    - dispatch() is a coroutine. Authentication, permission and throttle checks run
+      through sync_to_async, since a token lookup may query the database.
+    - `async def` handlers are awaited on the event loop. Sync handlers run through
+      sync_to_async, exactly as Django runs a sync view under ASGI, so they respond
+      identically.
+    - Exceptions are handled and responses finalized as in APIView.dispatch().
+    - The view is named and described like the sync view it extends (browsable API,
+      OPTIONS), so responses stay identical there too.
+    """
+    @classmethod
+    def as_view(cls, *args, **initkwargs):
+        view = super().as_view(*args, **initkwargs)
+        if iscoroutinefunction(view):
+            return view
+
+        async def async_view(request, *args, **kwargs):
+            return await view(request, *args, **kwargs)
+
+        # Keeps cls, initkwargs, actions and csrf_exempt, which the routers and Django read.
+        return functools.update_wrapper(async_view, view)
+
+    @classmethod
+    def get_sync_view_class(cls):
+        return next(
+            klass for klass in cls.__mro__
+            if issubclass(klass, APIView) and not issubclass(klass, AsyncAPIViewMixin)
+        )
+
+    def as_sync_view(self):
+        view = copy.copy(self)
+        view.__class__ = self.get_sync_view_class()
+        return view
+
+    def get_view_name(self):
+        return self.as_sync_view().get_view_name()
+
+    def get_view_description(self, html=False):
+        return self.as_sync_view().get_view_description(html)
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncViewSetMixin(AsyncAPIViewMixin):
+    """
+    AsyncViewSetMixin
+    Async list and retrieve for a model viewset, reading through the async ORM; the
+    other actions (writes, which need transactions, and custom actions) keep their
+    sync implementation (see AsyncAPIViewMixin). Place it before the viewset class.
+
+    - get_queryset(), filter_queryset(), the serializer, the paginator and the
+      `list_reader_class` of ValuesListMixin are used exactly as by the sync actions,
+      so both return identical responses.
+    - Paginators may offer apaginate_queryset(); others run through sync_to_async.
+    """
+    async def aget_object(self):
+        """get_object() for async views."""
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        try:
+            instance = await aget_object_or_404(queryset, **filter_kwargs)
+        except (TypeError, ValueError, DjangoValidationError):
+            raise Http404
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+    async def apaginate_queryset(self, queryset):
+        paginator = self.paginator
+        if paginator is None:
+            return None
+        if hasattr(paginator, 'apaginate_queryset'):
+            return await paginator.apaginate_queryset(queryset, self.request, view=self)
+        return await sync_to_async(paginator.paginate_queryset)(queryset, self.request, view=self)
+
+    async def aserialize(self, instances):
+        if not isinstance(instances, list):
+            instances = [instance async for instance in instances]
+        return self.get_serializer(instances, many=True).data
+
+    async def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        reader_class = getattr(self, 'list_reader_class', None)
+        if reader_class is not None:
+            reader = reader_class(context=self.get_serializer_context())
+            queryset = reader.get_queryset(queryset)
+            represent = reader.arepresent
+        else:
+            represent = self.aserialize
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(await represent(page))
+        return Response(await represent(queryset))
+
+    async def retrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        return Response(self.get_serializer(instance).data)
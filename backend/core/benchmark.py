@@ -0,0 +1,154 @@
+import contextlib
+import datetime
+import math
+import random
+import statistics
+import time
+
+from django.db import connections
+from django.test.utils import setup_databases, setup_test_environment, teardown_databases, teardown_test_environment
+from django.utils import timezone
+from core.ranking import spread_ranks
+
+
+@contextlib.contextmanager
+def temporary_database(verbosity=0, name=None):
+    """
+    Runs the block against freshly migrated test databases (like the test runner does),
+    so benchmarks never touch the configured database.
+    `name` puts the default test database into that file instead of SQLite's in-memory
+    database, e.g. when several threads or connections have to share it.
+    """
+    if name is not None:
+        connections['default'].settings_dict['TEST']['NAME'] = str(name)
+    setup_test_environment()
+    old_config = setup_databases(verbosity=verbosity, interactive=False)
+    try:
+        yield
+    finally:
+        teardown_databases(old_config, verbosity=verbosity)
+        teardown_test_environment()
+
+
+def summarize(durations):
+    """
+    Returns latency percentiles (milliseconds) and throughput for a list of
+    durations in seconds.
+    """
+    ordered = sorted(durations)
+
+    def percentile(p):
+        index = min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))
+        return round(ordered[index] * 1000, 3)
+
+    total = sum(ordered)
+    return {
+        'count': len(ordered),
+        'mean_ms': round(statistics.fmean(ordered) * 1000, 3),
+        'p50_ms': percentile(50),
+        'p95_ms': percentile(95),
+        'p99_ms': percentile(99),
+        'max_ms': round(ordered[-1] * 1000, 3),
+        'throughput_rps': round(len(ordered) / total, 2) if total else None,
+    }
+
+
+def measure(func, repeat, warmup=1):
+    for _ in range(warmup):
+        func()
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+FIRSTNAMES = ['Anna', 'Ben', 'Clara', 'David', 'Émile', 'Frida', 'Göran', 'Hana', 'Ivan', 'Julia', 'Zoë', 'Øyvind']
+LASTNAMES = ['Müller', 'Schmidt', 'Schneider', 'Fischer', 'Weber', 'Meyer', 'Wagner', 'Becker', 'Özdemir', 'Nguyen']
+CATEGORIES = ['Technical Task', 'User Story']
+WORDS = ['design', 'landing', 'page', 'refactor', 'api', 'review', 'deploy', 'fix', 'test', 'käse', 'naïve', 'line\u2028break']
+
+
+def seed_dataset(tasks=1000, contacts=100, private_ratio=0.3, owners=20, seed=42, batch_size=5000):
+    """
+    Creates a deterministic board: `contacts` contacts and `tasks` tasks with mixed
+    public/private ownership across `owners` user ids, 0-3 assignees and 0-4 subtasks each.
+    Bypasses change tracking (bulk_create), bumps the collection versions once and
+    rebuilds the board summary.
+    Returns the list of owner ids.
+    """
+    from board_tasks_app.models import Task, TaskAssignment, Subtask, BoardSummary
+    from board_tasks_app.search import task_index
+    from contacts_app.models import Contact
+    from sync_app.models import CollectionVersion
+
+    rng = random.Random(seed)
+    owner_ids = [str(index + 1) for index in range(owners)]
+    seeded = []
+    for index in range(contacts):
+        contact = Contact(
+            firstname=rng.choice(FIRSTNAMES),
+            lastname=f'{rng.choice(LASTNAMES)} {index}',
+            email=f'contact{index}@example.com',
+            phone=f'+49 {rng.randint(100000, 999999)}'
+        )
+        contact.update_sort_key()
+        seeded.append(contact)
+    Contact.objects.bulk_create(seeded, batch_size=batch_size)
+    contact_ids = list(Contact.objects.values_list('id', flat=True))
+
+    base = timezone.make_aware(datetime.datetime(2026, 1, 1), datetime.timezone.utc)
+    statuses = [choice for choice, _ in Task.STATUS_CHOICES]
+    # Ascending in creation order, so every column is ranked in that order.
+    ranks = spread_ranks(tasks)
+    priorities = [choice for choice, _ in Task.PRIORITY_CHOICES]
+    for start in range(0, tasks, batch_size):
+        batch = []
+        for index in range(start, min(start + batch_size, tasks)):
+            is_private = rng.random() < private_ratio
+            batch.append(Task(
+                title=' '.join(rng.choice(WORDS) for _ in range(3)).capitalize(),
+                description=' '.join(rng.choice(WORDS) for _ in range(rng.randint(0, 20))),
+                dueDate=base + datetime.timedelta(days=rng.randint(0, 365), minutes=rng.randint(0, 1440)),
+                priority=rng.choice(priorities),
+                category=rng.choice(CATEGORIES),
+                status=rng.choice(statuses),
+                createdAt=base - datetime.timedelta(days=rng.randint(0, 365), seconds=rng.randint(0, 86400)),
+                updatedAt=None if rng.random() < 0.5 else base,
+                rank=ranks[index],
+                isPrivate=is_private,
+                ownerId=rng.choice(owner_ids)
+            ))
+        for task in batch:
+            # Done at their last update, as migration 0009 assumes for existing tasks.
+            if task.status == 'done':
+                task.completedAt = task.updatedAt or task.createdAt
+        created = Task.objects.bulk_create(batch)
+        assignments, subtasks, counted = [], [], []
+        for task in created:
+            for position, contact_id in enumerate(rng.sample(contact_ids, min(len(contact_ids), rng.randint(0, 3)))):
+                assignments.append(TaskAssignment(task=task, contact_id=contact_id, position=position))
+            items = rng.randint(0, 4)
+            done = 0
+            for position in range(items):
+                completed = rng.random() < 0.5
+                done += completed
+                subtasks.append(Subtask(
+                    task=task,
+                    key=str(position + 1),
+                    title=f'Step {position + 1}',
+                    completed=completed,
+                    position=position
+                ))
+            if items:
+                task.subtasksTotal, task.subtasksDone = items, done
+                counted.append(task)
+        TaskAssignment.objects.bulk_create(assignments, batch_size=batch_size)
+        Subtask.objects.bulk_create(subtasks, batch_size=batch_size)
+        task_index.refresh(task.pk for task in created)
+        Task.objects.bulk_update(counted, ['subtasksTotal', 'subtasksDone'], batch_size=batch_size)
+    BoardSummary.objects.rebuild()
+    CollectionVersion.objects.bump(CollectionVersion.TASKS)
+    CollectionVersion.objects.bump(CollectionVersion.CONTACTS)
+    return owner_ids
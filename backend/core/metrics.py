@@ -0,0 +1,138 @@
+import bisect
+import threading
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+
+def format_labels(names, values, extra=''):
+    pairs = [f'{name}="{escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """
+    Histogram
+    Cumulative-bucket histogram per label combination, rendered in the Prometheus text
+    format. observe() is one bisect and three additions under the registry lock.
+    """
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labels=(), buckets=DURATION_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self.series = {}
+
+    def observe(self, value, *label_values):
+        series = self.series.get(label_values)
+        if series is None:
+            series = self.series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def collect(self):
+        for label_values, (counts, total, count) in sorted(self.series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float('inf')), counts):
+                cumulative += bucket_count
+                le = f'le="{format_value(float(bound))}"'
+                yield f'{self.name}_bucket{format_labels(self.labels, label_values, le)} {cumulative}'
+            yield f'{self.name}_sum{format_labels(self.labels, label_values)} {format_value(total)}'
+            yield f'{self.name}_count{format_labels(self.labels, label_values)} {count}'
+
+
+class Counter:
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.series = {}
+
+    def inc(self, *label_values, amount=1):
+        self.series[label_values] = self.series.get(label_values, 0) + amount
+
+    def collect(self):
+        for label_values, value in sorted(self.series.items()):
+            yield f'{self.name}{format_labels(self.labels, label_values)} {format_value(value)}'
+
+
+class MetricsRegistry:
+    """
+    MetricsRegistry
+    Process-local metrics of this worker. Every worker process keeps its own registry,
+    so Prometheus has to scrape each worker (or run a single worker per port).
+
+    - Metrics are created through histogram() / counter() and updated inside `lock`.
+    - Collectors registered with register_collector() are callables returning
+      (name, type, documentation, [(labels dict, value), ...]) tuples; they export
+      state that lives elsewhere (e.g. the token cache counters) at scrape time.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics = {}
+        self.collectors = []
+
+    def histogram(self, name, documentation, labels=(), buckets=DURATION_BUCKETS):
+        return self.metrics.setdefault(name, Histogram(name, documentation, labels, buckets))
+
+    def counter(self, name, documentation, labels=()):
+        return self.metrics.setdefault(name, Counter(name, documentation, labels))
+
+    def register_collector(self, collector):
+        if collector not in self.collectors:
+            self.collectors.append(collector)
+
+    def clear(self):
+        with self.lock:
+            for metric in self.metrics.values():
+                metric.series.clear()
+
+    def render(self):
+        lines = []
+        with self.lock:
+            for metric in self.metrics.values():
+                lines.append(f'# HELP {metric.name} {metric.documentation}')
+                lines.append(f'# TYPE {metric.name} {metric.kind}')
+                lines.extend(metric.collect())
+        for collector in self.collectors:
+            for name, kind, documentation, samples in collector():
+                lines.append(f'# HELP {name} {documentation}')
+                lines.append(f'# TYPE {name} {kind}')
+                for labels, value in samples:
+                    lines.append(f'{name}{format_labels(labels.keys(), labels.values())} {format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+
+def metrics_view(request):
+    """
+    GET /metrics
+    Prometheus text exposition of this worker's registry. Only clients listed in
+    PERFORMANCE_MONITORING['METRICS_ALLOWED_IPS'] may scrape it.
+    """
+    allowed = getattr(settings, 'PERFORMANCE_MONITORING', {}).get('METRICS_ALLOWED_IPS', ['127.0.0.1', '::1'])
+    if request.META.get('REMOTE_ADDR') not in allowed:
+        return HttpResponseForbidden()
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
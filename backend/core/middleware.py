@@ -0,0 +1,338 @@
+import contextlib
+import contextvars
+import hashlib
+import logging
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.signals import request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import JsonResponse
+from core.metrics import QUERY_BUCKETS, registry
+from core.routers import read_database
+from core.sqlite import WriteQueueFull, get_write_queue
+
+logger = logging.getLogger('core.performance')
+
+current_profile = contextvars.ContextVar('current_profile', default=None)
+
+REQUEST_DURATION = registry.histogram(
+    'api_request_duration_seconds', 'Total time spent in the Django handler.', ['view', 'method'])
+DB_DURATION = registry.histogram(
+    'api_db_duration_seconds', 'Time spent executing SQL per request.', ['view', 'method'])
+DB_QUERIES = registry.histogram(
+    'api_db_queries', 'SQL statements executed per request.', ['view', 'method'], QUERY_BUCKETS)
+SERIALIZE_DURATION = registry.histogram(
+    'api_serialize_duration_seconds', 'Time spent building response data (serializers and list readers).', ['view', 'method'])
+RENDER_DURATION = registry.histogram(
+    'api_render_duration_seconds', 'Time spent rendering response data into bytes.', ['view', 'method'])
+AUTH_DURATION = registry.histogram(
+    'api_auth_duration_seconds', 'Time spent authenticating the request.', ['view', 'method'])
+REQUESTS = registry.counter(
+    'api_requests_total', 'Handled requests by view, method and status code.', ['view', 'method', 'status'])
+
+
+class RequestProfile:
+    """
+    Timings of one request. Phases overlap: SQL run while serializing counts for
+    both `db` and `serialize`.
+    """
+    __slots__ = ('view', 'started', 'queries', 'db', 'serialize', 'render', 'auth', 'statements', 'max_statements', 'active')
+
+    def __init__(self, max_statements):
+        self.view = 'unmatched'
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db = self.serialize = self.render = self.auth = 0.0
+        self.statements = []
+        self.max_statements = max_statements
+        self.active = set()
+
+    def __call__(self, execute, sql, params, many, context):
+        """Database execute_wrapper: counts statements and their time."""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.queries += 1
+            self.db += duration
+            if len(self.statements) < self.max_statements:
+                self.statements.append((duration, sql))
+
+
+@contextlib.contextmanager
+def profile_phase(name):
+    """
+    Adds the time spent in the block to phase `name` of the current request's profile.
+    Nested blocks of the same phase are counted once; outside a profiled request this
+    only costs a context variable lookup.
+    """
+    profile = current_profile.get()
+    if profile is None or name in profile.active:
+        yield
+        return
+    profile.active.add(name)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        setattr(profile, name, getattr(profile, name) + time.perf_counter() - started)
+        profile.active.discard(name)
+
+
+def profile_query(execute, sql, params, many, context):
+    """
+    Database execute_wrapper installed on every connection: records the statement in the
+    profile of the current request. The profile is looked up in the context variable, so
+    queries run through sync_to_async (async views) are counted too.
+    """
+    profile = current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    return profile(execute, sql, params, many, context)
+
+
+def install_query_profiling(connection=None, **kwargs):
+    """
+    Adds profile_query() to `connection`, or to all connections of the current thread.
+    Receives connection_created (connections opened later, e.g. by a writer thread) and
+    request_started, which Django sends from the thread the request's database work runs
+    in (through sync_to_async for async requests), for connections opened earlier.
+    """
+    for wrapper in [connection] if connection is not None else connections.all():
+        if profile_query not in wrapper.execute_wrappers:
+            wrapper.execute_wrappers.append(profile_query)
+
+
+def get_view_name(view_func, method):
+    """Returns e.g. `TaskViewSet.list` for DRF viewsets and `LoginView.post` otherwise."""
+    view_class = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+    if view_class is None:
+        return getattr(view_func, '__name__', 'unknown')
+    actions = getattr(view_func, 'actions', None) or {}
+    return f'{view_class.__name__}.{actions.get(method.lower(), method.lower())}'
+
+
+class PerformanceMiddleware:
+    """
+    PerformanceMiddleware
+    Records, per view and action, the query count, DB time, auth, serializer and render
+    time and the total handler time of every request.
+
+    - Adds a `Server-Timing` header (visible in the browser's network panel).
+    - Logs requests slower than PERFORMANCE_MONITORING['SLOW_REQUEST_MS'] to the
+      `core.performance` logger, with their SQL statements (without parameters; the
+      first SLOW_REQUEST_MAX_STATEMENTS are kept, slowest first).
+    - Feeds the histograms exposed at /metrics (core/metrics.py).
+
+    The profile is held in a context variable, which sync_to_async copies into its
+    worker threads, so async requests (the async views under ASGI) are profiled like
+    sync ones. Streamed bodies (the event stream) run after the middleware returned and
+    are not. The overhead is one execute_wrapper call per query and a few perf_counter()
+    calls per request.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        config = getattr(settings, 'PERFORMANCE_MONITORING', {})
+        self.enabled = config.get('ENABLED', True)
+        self.server_timing = config.get('SERVER_TIMING', True)
+        self.slow_request_seconds = config.get('SLOW_REQUEST_MS', 500) / 1000
+        self.max_statements = config.get('SLOW_REQUEST_MAX_STATEMENTS', 100)
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        if self.enabled:
+            connection_created.connect(install_query_profiling, dispatch_uid='core.performance')
+            request_started.connect(install_query_profiling, dispatch_uid='core.performance')
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not self.enabled:
+            return self.get_response(request)
+        profile = RequestProfile(self.max_statements)
+        request._performance_profile = profile
+        token = current_profile.set(profile)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_profile.reset(token)
+        self.finish(request, response, profile)
+        return response
+
+    async def __acall__(self, request):
+        if not self.enabled:
+            return await self.get_response(request)
+        profile = RequestProfile(self.max_statements)
+        request._performance_profile = profile
+        token = current_profile.set(profile)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_profile.reset(token)
+        self.finish(request, response, profile)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        profile = getattr(request, '_performance_profile', None)
+        if profile is not None:
+            profile.view = get_view_name(view_func, request.method)
+
+    def process_template_response(self, request, response):
+        """Times deferred rendering (DRF responses), which runs after this hook returns."""
+        profile = getattr(request, '_performance_profile', None)
+        if profile is not None:
+            started = time.perf_counter()
+
+            def rendered(response):
+                profile.render += time.perf_counter() - started
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def finish(self, request, response, profile):
+        total = time.perf_counter() - profile.started
+        labels = (profile.view, request.method)
+        with registry.lock:
+            REQUEST_DURATION.observe(total, *labels)
+            DB_DURATION.observe(profile.db, *labels)
+            DB_QUERIES.observe(profile.queries, *labels)
+            SERIALIZE_DURATION.observe(profile.serialize, *labels)
+            RENDER_DURATION.observe(profile.render, *labels)
+            AUTH_DURATION.observe(profile.auth, *labels)
+            REQUESTS.inc(*labels, str(response.status_code))
+        if self.server_timing:
+            response['Server-Timing'] = ', '.join([
+                f'db;dur={profile.db * 1000:.2f};desc="{profile.queries} queries"',
+                f'auth;dur={profile.auth * 1000:.2f}',
+                f'serialize;dur={profile.serialize * 1000:.2f}',
+                f'render;dur={profile.render * 1000:.2f}',
+                f'total;dur={total * 1000:.2f}',
+            ])
+        if total >= self.slow_request_seconds and not getattr(response, 'streaming', False):
+            self.log_slow_request(request, response, profile, total)
+
+    def log_slow_request(self, request, response, profile, total):
+        statements = '\n'.join(
+            f'  {duration * 1000:8.2f} ms  {sql}'
+            for duration, sql in sorted(profile.statements, key=lambda item: item[0], reverse=True)
+        )
+        omitted = profile.queries - len(profile.statements)
+        if omitted > 0:
+            statements += f'\n  ... {omitted} more statements'
+        logger.warning(
+            'Slow request %s %s (%s) -> %s: total=%.1fms db=%.1fms/%d queries auth=%.1fms serialize=%.1fms render=%.1fms\n%s',
+            request.method, request.get_full_path(), profile.view, response.status_code,
+            total * 1000, profile.db * 1000, profile.queries, profile.auth * 1000,
+            profile.serialize * 1000, profile.render * 1000, statements,
+        )
+
+
+class SerializedWriteMiddleware:
+    """
+    SerializedWriteMiddleware
+    Optional single writer for SQLite (DATABASE_WRITE_QUEUE['ENABLED']): the rest of the
+    handling of every POST/PUT/PATCH/DELETE request of this process runs, in arrival
+    order, on one writer thread (core.sqlite.WriteQueue), so request threads never wait
+    on each other's write locks; reads keep running in parallel (WAL).
+
+    - Beyond QUEUE_SIZE waiting writes, requests are answered with 503 and Retry-After.
+    - Other processes still compete for the lock through BEGIN IMMEDIATE and the busy timeout.
+    - Not used under ASGI: Django already runs all sync views of a process on one thread there.
+    Place it before PerformanceMiddleware so the profile covers the writer thread's queries.
+    """
+    # Both, so Django hands over the handler in its own mode and ASGI can be detected.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        config = getattr(settings, 'DATABASE_WRITE_QUEUE', {})
+        if not config.get('ENABLED', False) or iscoroutinefunction(get_response):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.queue = get_write_queue(config.get('QUEUE_SIZE', 64))
+        self.retry_after = config.get('RETRY_AFTER_SECONDS', 1)
+
+    def __call__(self, request):
+        if request.method in ('GET', 'HEAD', 'OPTIONS', 'TRACE'):
+            return self.get_response(request)
+        try:
+            return self.queue.run(self.get_response, request)
+        except WriteQueueFull:
+            response = JsonResponse({'detail': 'Too many writes in progress, please retry shortly.'}, status=503)
+            response['Retry-After'] = str(self.retry_after)
+            return response
+
+
+class ReplicaRoutingMiddleware:
+    """
+    ReplicaRoutingMiddleware
+    Picks the database the reads of a request go to (core.routers.ReplicaRouter): a
+    random replica from DATABASE_REPLICATION['REPLICAS'] for safe methods, the primary
+    for writes. Adding a replica only takes a settings entry.
+
+    Read-your-writes: after a write, reads of the same client (same Authorization
+    header or same address) stay on the primary for STICKY_SECONDS, which must exceed
+    the replication lag. The pins live in the CACHE_ALIAS cache, so that cache has to
+    be shared by all server processes.
+    Not used without replicas.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        config = getattr(settings, 'DATABASE_REPLICATION', {})
+        self.replicas = list(config.get('REPLICAS', []))
+        if not self.replicas:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.sticky_seconds = config.get('STICKY_SECONDS', 5)
+        self.cache_alias = config.get('CACHE_ALIAS', 'default')
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def get_client_keys(self, request):
+        clients = [request.META.get('HTTP_AUTHORIZATION'), request.META.get('REMOTE_ADDR')]
+        return [
+            'db-primary:%s' % hashlib.sha1(client.encode('utf-8')).hexdigest()
+            for client in clients if client
+        ]
+
+    def is_write(self, request):
+        return request.method not in ('GET', 'HEAD', 'OPTIONS', 'TRACE')
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        keys = self.get_client_keys(request)
+        cache = caches[self.cache_alias]
+        pinned = self.is_write(request) or bool(keys and cache.get_many(keys))
+        token = read_database.set(None if pinned else random.choice(self.replicas))
+        try:
+            return self.get_response(request)
+        finally:
+            read_database.reset(token)
+            if self.is_write(request):
+                cache.set_many(dict.fromkeys(keys, True), self.sticky_seconds)
+
+    async def __acall__(self, request):
+        keys = self.get_client_keys(request)
+        cache = caches[self.cache_alias]
+        pinned = self.is_write(request) or bool(keys and await cache.aget_many(keys))
+        token = read_database.set(None if pinned else random.choice(self.replicas))
+        try:
+            return await self.get_response(request)
+        finally:
+            read_database.reset(token)
+            if self.is_write(request):
+                await cache.aset_many(dict.fromkeys(keys, True), self.sticky_seconds)
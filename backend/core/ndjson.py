@@ -0,0 +1,168 @@
+import json
+import time
+
+from django.db import reset_queries, transaction
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+# Newline-delimited JSON: one record per line, so exports can be written and imports
+# read record by record, never holding a whole collection in memory.
+CONTENT_TYPE = 'application/x-ndjson'
+
+
+def dumps(record):
+    """Encodes one record as a line of compact JSON (bytes, with the trailing newline)."""
+    if orjson is not None:
+        return orjson.dumps(record, default=JSONEncoder().default, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(record, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def loads(line):
+    return orjson.loads(line) if orjson is not None else json.loads(line)
+
+
+def export_records(reader, queryset, chunk_size=2000):
+    """
+    Yields the representation of every row of `queryset` built by `reader`
+    (a ValuesListReader), fetching `chunk_size` rows at a time with QuerySet.iterator()
+    and loading their relations per chunk: memory stays flat however large the table is.
+    """
+    rows = reader.get_queryset(queryset).iterator(chunk_size=chunk_size)
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield from reader.build(chunk)
+            chunk = []
+    if chunk:
+        yield from reader.build(chunk)
+
+
+def export_lines(records):
+    for record in records:
+        yield dumps(record)
+
+
+def streaming_response(records, filename):
+    """Streams `records` as an NDJSON download."""
+    response = StreamingHttpResponse(export_lines(records), content_type=CONTENT_TYPE)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+class NdjsonImporter:
+    """
+    NdjsonImporter
+    Imports NDJSON records in chunks with bounded memory.
+
+    - Every record is validated with `serializer_class` (one serializer instance for the
+      whole import, so the fields are only built once). `build(record, data)` turns the
+      validated data into what `write()` stores and may raise ValidationError as well.
+    - Every `chunk_size` valid records are written by `write(items)` in one transaction
+      with bulk queries; `items` are (line number, built) pairs. `write()` may still
+      reject items with `reject()`, e.g. for ids that already exist.
+    - Invalid lines are skipped: `skipped` counts them and `errors` keeps the first
+      `max_errors` as (line number, errors).
+    """
+    serializer_class = None
+    chunk_size = 1000
+    max_errors = 100
+
+    def __init__(self, chunk_size=None, using=None):
+        self.chunk_size = chunk_size or self.chunk_size
+        self.using = using
+        self.imported = 0
+        self.skipped = 0
+        self.errors = []
+        self.seconds = 0.0
+
+    def run(self, lines):
+        """Imports the records of `lines` (an iterable of bytes or str); returns self."""
+        started = time.perf_counter()
+        serializer = self.serializer_class(context=self.get_serializer_context())
+        chunk = []
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError('Expected a JSON object.')
+            except ValueError as error:
+                self.reject(number, {'non_field_errors': [str(error)]})
+                continue
+            try:
+                built = self.build(record, serializer.run_validation(record))
+            except ValidationError as error:
+                self.reject(number, error.detail)
+                continue
+            chunk.append((number, built))
+            if len(chunk) == self.chunk_size:
+                self.flush(chunk)
+                chunk = []
+        if chunk:
+            self.flush(chunk)
+        self.seconds = time.perf_counter() - started
+        return self
+
+    def flush(self, items):
+        with transaction.atomic(using=self.using):
+            self.imported += self.write(items)
+        # With DEBUG on, every connection logs its queries (the SQL of a bulk INSERT is
+        # as long as the chunk) until the next request starts; an import is one long
+        # "request", so drop the log per chunk like Django does per request.
+        reset_queries()
+
+    def reject(self, number, errors):
+        self.skipped += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((number, errors))
+
+    def reject_existing(self, items, existing, key, message):
+        """
+        Rejects the items whose `key(built)` is in `existing` or repeats an earlier
+        item of the chunk; returns the others.
+        """
+        accepted, seen = [], set(existing)
+        for number, built in items:
+            value = key(built)
+            if value is not None and value in seen:
+                self.reject(number, {'non_field_errors': [message.format(value)]})
+                continue
+            if value is not None:
+                seen.add(value)
+            accepted.append((number, built))
+        return accepted
+
+    def get_serializer_context(self):
+        return {}
+
+    def parse_id(self, record):
+        """The record's `id` (kept on import so references survive), None if it has none."""
+        value = record.get('id')
+        if value is None:
+            return None
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise ValidationError({'id': ['Expected a positive integer.']})
+        return value
+
+    def build(self, record, data):
+        return data
+
+    def write(self, items):
+        """Stores the built items of one chunk; returns the number of stored records."""
+        raise NotImplementedError
+
+    def get_report(self):
+        return {
+            'imported': self.imported,
+            'skipped': self.skipped,
+            'seconds': round(self.seconds, 2),
+            'errors': [{'line': number, 'errors': errors} for number, errors in self.errors],
+        }
@@ -0,0 +1,76 @@
+# Fractional rank keys: strings that sort lexicographically (by code point) in the order
+# of the items they rank, with a key between any two neighbours, so moving an item only
+# rewrites its own key. A key reads as the base-62 fraction 0.<digits>; keys never end
+# with the lowest digit, which keeps a key below every other one available.
+# The database has to compare them the same way, i.e. with a binary collation (see Task.rank).
+DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+BASE = len(DIGITS)
+
+
+def rank_between(lower, upper):
+    """
+    Returns a short key between `lower` and `upper` (None: open end).
+    Between two keys this is the shortest one, so keys grow by about one character
+    every six inserts at the same position; at the open ends it is the neighbouring
+    key of at least two digits, so a column takes thousands of appends (or prepends)
+    before its keys grow.
+    """
+    lower = lower or ''
+    if upper is not None and lower >= upper:
+        raise ValueError(f'{lower!r} must sort before {upper!r}')
+    if upper is None and lower:
+        return _shift(lower, 1) or _midpoint(lower, None)
+    if not lower and upper is not None:
+        return _shift(upper, -1) or _midpoint('', upper)
+    return _midpoint(lower, upper)
+
+
+def _shift(key, delta):
+    """Adds `delta` to the last of (at least two) digits; None on overflow."""
+    width = max(len(key), 2)
+    value = 0
+    for char in key.ljust(width, DIGITS[0]):
+        value = value * BASE + DIGITS.index(char)
+    value += delta
+    if value <= 0 or value >= BASE ** width:
+        return None
+    return _digits(value, width).rstrip(DIGITS[0]) or None
+
+
+def _digits(value, width):
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, BASE)
+        digits.append(DIGITS[digit])
+    return ''.join(reversed(digits))
+
+
+def _midpoint(lower, upper):
+    if upper is not None:
+        # Copy the common prefix (the lower key padded with its implicit zeros).
+        prefix = 0
+        while prefix < len(upper) and (lower[prefix] if prefix < len(lower) else DIGITS[0]) == upper[prefix]:
+            prefix += 1
+        if prefix:
+            return upper[:prefix] + _midpoint(lower[prefix:], upper[prefix:])
+    low = DIGITS.index(lower[0]) if lower else 0
+    high = DIGITS.index(upper[0]) if upper is not None else BASE
+    if high - low > 1:
+        return DIGITS[(low + high + 1) // 2]
+    if upper is not None and len(upper) > 1:
+        return upper[0]
+    return DIGITS[low] + _midpoint(lower[1:], None)
+
+
+def is_rank(key):
+    """Whether `key` is a well-formed rank key, e.g. one read from an import file."""
+    return isinstance(key, str) and bool(key) and not key.endswith(DIGITS[0]) and all(char in DIGITS for char in key)
+
+
+def spread_ranks(count):
+    """Returns `count` ascending keys spread evenly over the key space, all short."""
+    width = 1
+    while BASE ** width <= count:
+        width += 1
+    step = BASE ** width // (count + 1)
+    return [_digits(step * index, width).rstrip(DIGITS[0]) for index in range(1, count + 1)]
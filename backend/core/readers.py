@@ -0,0 +1,119 @@
+from asgiref.sync import sync_to_async
+from rest_framework import serializers
+from rest_framework.response import Response
+from core.middleware import profile_phase
+
+# Serializer fields whose to_representation() returns database values of the matching
+# model field unchanged; their columns are copied without a per-value call.
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.EmailField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+)
+
+
+def chunked(values, size):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class ValuesListReader:
+    """
+    ValuesListReader
+    Builds the list representation of `serializer_class` straight from queryset.values()
+    rows, without model instances or per-field serializer calls.
+
+    - Fields are emitted in the serializer's order, after the serializer's own field
+      selection (e.g. sparse fieldsets via the `fields` context entry).
+    - Plain columns are copied (IDENTITY_FIELDS) or formatted with the serializer
+      field's to_representation(), so values are byte-compatible with the serializer.
+    - A field named `<name>` with a `load_<name>(pks)` method is a relation: the loader
+      returns {pk: value} for a whole page with one query per chunk of `chunk_size` pks.
+    - `extra_columns` are fetched but not emitted (e.g. the pagination key).
+    """
+    serializer_class = None
+    extra_columns = ()
+    chunk_size = 900
+
+    def __init__(self, context=None):
+        serializer = self.serializer_class(context=context or {})
+        self.plan = []
+        self.columns = []
+        self.relations = {}
+        for name, field in serializer.fields.items():
+            loader = getattr(self, f'load_{name}', None)
+            if loader is not None:
+                self.relations[name] = loader
+                self.plan.append((name, None, None))
+                continue
+            formatter = None if type(field) in IDENTITY_FIELDS else field.to_representation
+            self.plan.append((name, field.source, formatter))
+            self.columns.append(field.source)
+
+    def get_queryset(self, queryset):
+        self.pk_column = queryset.model._meta.pk.attname
+        columns = dict.fromkeys([self.pk_column, *self.columns, *self.extra_columns])
+        return queryset.prefetch_related(None).values(*columns)
+
+    def load_relations(self, pks):
+        loaded = {}
+        for name, loader in self.relations.items():
+            loaded[name] = {}
+            for chunk in chunked(pks, self.chunk_size):
+                loaded[name].update(loader(chunk))
+        return loaded
+
+    def represent(self, rows):
+        with profile_phase('serialize'):
+            return self.build(list(rows))
+
+    async def arepresent(self, rows):
+        """
+        represent() for async views: a queryset is read with async iteration, the
+        relation loaders run through sync_to_async like the async ORM does.
+        """
+        if not isinstance(rows, list):
+            rows = [row async for row in rows]
+        loaded = {}
+        if self.relations:
+            loaded = await sync_to_async(self.load_relations)([row[self.pk_column] for row in rows])
+        with profile_phase('serialize'):
+            return self.build(rows, loaded)
+
+    def build(self, rows, loaded=None):
+        pk_column = self.pk_column
+        if loaded is None:
+            loaded = self.load_relations([row[pk_column] for row in rows]) if self.relations else {}
+        data = []
+        for row in rows:
+            item = {}
+            for name, column, formatter in self.plan:
+                if column is None:
+                    item[name] = loaded[name].get(row[pk_column]) or []
+                    continue
+                value = row[column]
+                item[name] = value if value is None or formatter is None else formatter(value)
+            data.append(item)
+        return data
+
+
+class ValuesListMixin:
+    """
+    ValuesListMixin
+    Serves the list action of a model viewset through `list_reader_class`
+    (a ValuesListReader) instead of the serializer; filtering and pagination
+    behave exactly as in ListModelMixin.list().
+    """
+    list_reader_class = None
+
+    def list(self, request, *args, **kwargs):
+        if self.list_reader_class is None:
+            return super().list(request, *args, **kwargs)
+        reader = self.list_reader_class(context=self.get_serializer_context())
+        queryset = reader.get_queryset(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(reader.represent(page))
+        return Response(reader.represent(queryset))
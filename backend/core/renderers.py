@@ -0,0 +1,53 @@
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from core.ndjson import CONTENT_TYPE, dumps
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    FastJSONRenderer
+    JSONRenderer that encodes with orjson when it is installed and falls back to the
+    standard library otherwise.
+
+    The orjson path produces the same bytes as JSONRenderer for the payloads of the
+    task and contact endpoints (strings, ints, bools, None, lists and dicts):
+    compact separators, unescaped non-ASCII and escaped U+2028/U+2029. Datetimes and
+    other non-JSON types go through DRF's encoder. Indented output (browsable API,
+    `; indent=` media types), non-default JSON settings and anything orjson rejects
+    use the standard JSONRenderer.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.ensure_ascii or not self.compact or not self.strict:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+
+class NdjsonRenderer(BaseRenderer):
+    """
+    NdjsonRenderer
+    Lets export actions negotiate `application/x-ndjson`. The exports themselves are
+    streamed (core.ndjson.streaming_response); this only renders other responses of
+    those actions, such as validation errors, as a single NDJSON line.
+    """
+    media_type = CONTENT_TYPE
+    format = 'ndjson'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return dumps(data)
@@ -0,0 +1,38 @@
+import contextvars
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+# Database the reads of the current request go to, chosen by ReplicaRoutingMiddleware.
+# None (management commands, signals outside requests, writes) means the primary.
+read_database = contextvars.ContextVar('read_database', default=None)
+
+
+def get_replicas():
+    """Aliases of the read replicas (DATABASE_REPLICATION['REPLICAS'])."""
+    return list(getattr(settings, 'DATABASE_REPLICATION', {}).get('REPLICAS', []))
+
+
+class ReplicaRouter:
+    """
+    ReplicaRouter
+    Sends writes to the primary (`default`) and reads to the replica picked for the
+    current request, if any. The replicas are copies of the primary, so they are
+    never migrated themselves and objects of all of them may be related.
+    """
+    def db_for_read(self, model, **hints):
+        return read_database.get() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *get_replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in get_replicas():
+            return False
+        return None
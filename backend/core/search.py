@@ -0,0 +1,203 @@
+import re
+
+from django.db import DatabaseError, connections, transaction
+from django.db.migrations.recorder import MigrationRecorder
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from rest_framework.pagination import PageNumberPagination
+
+TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+MAX_TERMS = 8
+
+
+def parse_terms(query):
+    """
+    Splits a search box value into lower-cased word terms (at most MAX_TERMS).
+    Accents are kept: FTS5 folds them itself, the fallbacks compare with Lower().
+    """
+    return [term.lower() for term in TERM_PATTERN.findall(query or '')][:MAX_TERMS]
+
+
+def match_expression(terms):
+    """FTS5 query matching rows that contain a word starting with every term."""
+    return ' AND '.join('"%s"*' % term.replace('"', '""') for term in terms)
+
+
+def fts5_supported(connection):
+    """True on SQLite builds with the FTS5 extension."""
+    if connection.vendor != 'sqlite':
+        return False
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(value)')
+            cursor.execute('DROP TABLE temp.fts5_probe')
+    except DatabaseError:
+        return False
+    return True
+
+
+class FullTextIndex:
+    """
+    FullTextIndex
+    A full-text index over `columns` of `model`, kept in an FTS5 table (`table`,
+    external content) on SQLite and maintained by triggers on the model's table.
+
+    - filter() narrows a queryset to the rows matching all terms (word prefixes) and
+      orders it by bm25 rank with the column `weights`, so further filters of the
+      queryset (e.g. visibility) still apply.
+    - create() / drop() add and remove the table and triggers; the migration that
+      introduces the index calls them, so its SQL is only defined here.
+    - ensure() creates the table and triggers when they are missing (and drops triggers
+      of the index it no longer defines) and rebuilds the index from the model's table.
+      It runs after every migrate (post_migrate), since SQLite drops the triggers
+      whenever a migration rebuilds the model's table. `migration` is the (app label,
+      name) of that migration; while it is not applied ensure() does nothing.
+    - Where FTS5 is not available (other databases, or SQLite built without FTS5),
+      `fallback(queryset, terms)` filters and orders the queryset instead; it is meant
+      to use the model's ordinary (e.g. case-folded expression) indexes.
+    """
+    tokenizer = 'unicode61 remove_diacritics 2'
+    prefixes = '1 2 3'
+
+    def __init__(self, model, table, columns, weights=None, fallback=None, migration=None):
+        self.model = model
+        self.table = table
+        self.columns = columns
+        self.weights = weights or [1.0] * len(columns)
+        self.fallback = fallback
+        self.migration = migration
+        self.available = {}
+
+    def get_table_sql(self):
+        return (
+            f"CREATE VIRTUAL TABLE {self.table} USING fts5({', '.join(self.columns)}, "
+            f"content='{self.model._meta.db_table}', content_rowid='{self.model._meta.pk.column}', "
+            f"tokenize='{self.tokenizer}', prefix='{self.prefixes}')"
+        )
+
+    def get_trigger_sql(self):
+        """Returns {trigger name: CREATE TRIGGER statement} keeping the index in sync."""
+        source = self.model._meta.db_table
+        pk = self.model._meta.pk.column
+        columns = ', '.join(self.columns)
+        new_values = ', '.join(f'new.{column}' for column in self.columns)
+        old_values = ', '.join(f'old.{column}' for column in self.columns)
+        insert = f'INSERT INTO {self.table}(rowid, {columns}) VALUES (new.{pk}, {new_values});'
+        delete = (
+            f'INSERT INTO {self.table}({self.table}, rowid, {columns}) '
+            f"VALUES ('delete', old.{pk}, {old_values});"
+        )
+        return {
+            f'{self.table}_insert': f'CREATE TRIGGER {self.table}_insert AFTER INSERT ON {source} BEGIN {insert} END',
+            f'{self.table}_delete': f'CREATE TRIGGER {self.table}_delete AFTER DELETE ON {source} BEGIN {delete} END',
+            f'{self.table}_update': (
+                f'CREATE TRIGGER {self.table}_update AFTER UPDATE OF {columns} ON {source} '
+                f'BEGIN {delete} {insert} END'
+            ),
+        }
+
+    def get_rebuild_sql(self):
+        """Statements that refill the index from the source table(s)."""
+        return [f"INSERT INTO {self.table}({self.table}) VALUES ('rebuild')"]
+
+    def get_create_sql(self):
+        return [self.get_table_sql(), *self.get_trigger_sql().values(), *self.get_rebuild_sql()]
+
+    def get_existing_triggers(self, cursor):
+        """Names of the triggers of this index in the database (named `<table>_...`)."""
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        return {row[0] for row in cursor.fetchall() if row[0].startswith(f'{self.table}_')}
+
+    def create(self, connection):
+        """Creates and fills the index; returns False where FTS5 is not available."""
+        self.available.clear()
+        if not fts5_supported(connection):
+            return False
+        with connection.cursor() as cursor:
+            for statement in self.get_create_sql():
+                cursor.execute(statement)
+        return True
+
+    def drop(self, connection):
+        self.available.clear()
+        if connection.vendor != 'sqlite':
+            return
+        with connection.cursor() as cursor:
+            for name in sorted(self.get_existing_triggers(cursor)):
+                cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+            cursor.execute(f'DROP TABLE IF EXISTS {self.table}')
+
+    def ensure(self, using='default'):
+        """
+        Creates whatever part of the index is missing and rebuilds it; returns True if
+        anything had to be changed. No-op on databases without FTS5.
+        """
+        connection = connections[using]
+        if connection.vendor != 'sqlite':
+            return False
+        if self.migration is not None and self.migration not in MigrationRecorder(connection).applied_migrations():
+            return False
+        self.available.clear()
+        if not fts5_supported(connection):
+            return False
+        triggers = self.get_trigger_sql()
+        with connection.cursor() as cursor:
+            existing = self.get_existing_triggers(cursor)
+            statements = [] if self.table in connection.introspection.table_names(cursor) else [self.get_table_sql()]
+            statements += [sql for name, sql in triggers.items() if name not in existing]
+            statements += [f'DROP TRIGGER {name}' for name in sorted(existing - set(triggers))]
+            if not statements:
+                return False
+            with transaction.atomic(using=using):
+                for statement in [*statements, *self.get_rebuild_sql()]:
+                    cursor.execute(statement)
+        return True
+
+    def is_available(self, using):
+        connection = connections[using]
+        if connection.vendor != 'sqlite':
+            return False
+        key = (using, str(connection.settings_dict['NAME']))
+        if key not in self.available:
+            with connection.cursor() as cursor:
+                self.available[key] = self.table in connection.introspection.table_names(cursor)
+        return self.available[key]
+
+    def filter(self, queryset, terms):
+        if not terms:
+            return queryset.none()
+        if not self.is_available(queryset.db):
+            return self.fallback(queryset, terms)
+        table = self.table
+        weights = ', '.join(str(float(weight)) for weight in self.weights)
+        source = f'{self.model._meta.db_table}.{self.model._meta.pk.column}'
+        expression = match_expression(terms)
+        # The ranked matches are a subquery of their own that SQLite materializes once
+        # (LIMIT -1 keeps it from being flattened) and probes per row through an
+        # automatic index; a plain correlated bm25() subquery would rerun the MATCH for
+        # every matching row.
+        rank = (
+            f'SELECT ranked.rank FROM (SELECT rowid AS id, bm25({table}, {weights}) AS rank '
+            f'FROM {table} WHERE {table} MATCH %s LIMIT -1) AS ranked WHERE ranked.id = {source}'
+        )
+        return queryset.filter(
+            pk__in=RawSQL(f'SELECT rowid FROM {table} WHERE {table} MATCH %s', [expression])
+        ).annotate(search_rank=RawSQL(rank, [expression])).order_by('search_rank', 'pk')
+
+
+class SearchPagination(PageNumberPagination):
+    """
+    Page-numbered search results: `?page=<n>&pageSize=<size>`,
+    returns `{"count", "next", "previous", "results"}`.
+    """
+    page_size = 20
+    page_size_query_param = 'pageSize'
+    max_page_size = 100
+
+
+def prefix_filter(fields, terms):
+    """Q requiring every term to be a prefix of one of the (lower-cased) `fields`."""
+    condition = Q()
+    for term in terms:
+        condition &= Q(*[Q(**{f'{field}__startswith': term}) for field in fields], _connector=Q.OR)
+    return condition
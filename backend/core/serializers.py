@@ -0,0 +1,14 @@
+from core.middleware import profile_phase
+
+
+class ProfiledSerializerMixin:
+    """
+    ProfiledSerializerMixin
+    Times to_representation() as the `serialize` phase of the current request's profile
+    (core.middleware.PerformanceMiddleware). With many=True the list serializer calls it
+    once per item; nested serializers running inside it are not counted twice.
+    Mixed into the serializers that build response data.
+    """
+    def to_representation(self, instance):
+        with profile_phase('serialize'):
+            return super().to_representation(instance)
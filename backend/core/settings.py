@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+from core.sqlite import sqlite_database
 
 # Load environment variables from .env file
 load_dotenv()
@@ -49,6 +50,7 @@ INSTALLED_APPS = [
     'user_auth_app',
     'board_tasks_app',
     'contacts_app',
+    'sync_app',
 ]
 
 MIDDLEWARE = [
@@ -60,9 +62,15 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
+    'core.middleware.SerializedWriteMiddleware',
+    'core.middleware.PerformanceMiddleware',
 ]
 
-ROOT_URLCONF = 'core.urls'
+# core/asgi.py turns ASYNC_VIEWS on: the API is then served by the async viewsets
+# (core/urls_async.py, same routes and responses) instead of the sync DRF viewsets.
+ASYNC_VIEWS = os.getenv('ASYNC_VIEWS', '0') == '1'
+ROOT_URLCONF = 'core.urls_async' if ASYNC_VIEWS else 'core.urls'
 
 TEMPLATES = [
     {
@@ -83,18 +91,67 @@ WSGI_APPLICATION = 'core.wsgi.application'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'user_auth_app.authentication.CachedTokenAuthentication',
     ],
 }
 
+# In-process token -> user cache of CachedTokenAuthentication. Revocations invalidate
+# the local process immediately and other worker processes after TTL_SECONDS.
+TOKEN_AUTH_CACHE = {
+    'MAX_ENTRIES': 10000,
+    'TTL_SECONDS': 300,
+}
+
+# Bounded thread pool for password hashing in login/registration (user_auth_app/hashing.py).
+# Beyond MAX_WORKERS running + QUEUE_SIZE waiting hashes requests get 503, beyond
+# PER_CLIENT pending hashes per address 429. Behind a proxy set CLIENT_IP_HEADER
+# (e.g. 'HTTP_X_FORWARDED_FOR') so the per-client limit sees the real address.
+PASSWORD_HASHING_POOL = {
+    'MAX_WORKERS': int(os.getenv('PASSWORD_HASHING_WORKERS', '4')),
+    'QUEUE_SIZE': 32,
+    'PER_CLIENT': 2,
+    'RETRY_AFTER_SECONDS': 1,
+    'CLIENT_IP_HEADER': None,
+}
+
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
+# SQLITE_PROFILE=production enables WAL, synchronous=NORMAL, cache/mmap pragmas, a busy
+# timeout, persistent connections and BEGIN IMMEDIATE write transactions (core/sqlite.py).
+sqlite_profile = {
+    'profile': os.getenv('SQLITE_PROFILE', 'development'),
+    'conn_max_age': int(os.getenv('SQLITE_CONN_MAX_AGE', '600')),
+    'timeout': int(os.getenv('SQLITE_BUSY_TIMEOUT_SECONDS', '20')),
+}
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+    'default': sqlite_database(BASE_DIR / 'db.sqlite3', **sqlite_profile)
+}
+
+# DATABASE_REPLICAS=/srv/replica1.sqlite3,/srv/replica2.sqlite3 adds read replicas
+# (aliases replica1, replica2, ...), kept current by `manage.py sync_replicas` or external
+# replication. Safe-method requests read from a random replica (core.routers); a client
+# reads from the primary for STICKY_SECONDS after its own writes. The pins are stored in
+# CACHE_ALIAS, which must be shared between processes when running more than one.
+replica_files = [name.strip() for name in os.getenv('DATABASE_REPLICAS', '').split(',') if name.strip()]
+for index, name in enumerate(replica_files, start=1):
+    DATABASES[f'replica{index}'] = {
+        **sqlite_database(name, **sqlite_profile),
+        'TEST': {'MIRROR': 'default'},
     }
+DATABASE_ROUTERS = ['core.routers.ReplicaRouter']
+DATABASE_REPLICATION = {
+    'REPLICAS': [alias for alias in DATABASES if alias != 'default'],
+    'STICKY_SECONDS': int(os.getenv('DATABASE_STICKY_SECONDS', '5')),
+    'CACHE_ALIAS': 'default',
+}
+
+# Optional single writer per process (core.middleware.SerializedWriteMiddleware): write
+# requests run one at a time on a dedicated thread; beyond QUEUE_SIZE waiting writes 503.
+DATABASE_WRITE_QUEUE = {
+    'ENABLED': os.getenv('DATABASE_WRITE_QUEUE', '0') == '1',
+    'QUEUE_SIZE': 64,
+    'RETRY_AFTER_SECONDS': 1,
 }
 
 
@@ -138,3 +195,54 @@ STATIC_URL = 'static/'
 CORS_ALLOWED_ORIGINS = [
     'http://localhost:4200',
 ]
+
+# Delta sync: tombstones older than this are removed by `manage.py compact_tombstones`;
+# clients whose cursor predates the removed range are told to reload the full list.
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv('SYNC_TOMBSTONE_RETENTION_DAYS', '30'))
+
+# Task archive: `manage.py archive_tasks` moves tasks done for more than AFTER_DAYS days
+# from the task table into ArchivedTask, BATCH_SIZE tasks per transaction.
+TASK_ARCHIVE = {
+    'AFTER_DAYS': int(os.getenv('TASK_ARCHIVE_AFTER_DAYS', '30')),
+    'BATCH_SIZE': 500,
+}
+
+# Pub/sub layer for the live event streams (GET /api/board-tasks/tasks/stream/).
+# InProcessBroker fans out within one ASGI process; each subscriber keeps at most
+# QUEUE_SIZE pending notifications and drops the oldest (or disconnects) beyond that.
+SYNC_BROKER = {
+    'BACKEND': 'sync_app.pubsub.InProcessBroker',
+    'OPTIONS': {
+        'queue_size': 16,
+        'overflow': 'drop-oldest',
+    },
+}
+SYNC_STREAM_HEARTBEAT_SECONDS = 15
+
+# Server-side cache of rendered API responses (CachedResponseMixin). Any cache backend
+# works; the keys embed the collection versions, so writes never serve stale entries.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {'MAX_ENTRIES': 1000},
+    },
+}
+API_RESPONSE_CACHE = {
+    'ALIAS': 'default',
+    'TIMEOUT': 300,
+    'LOCK_TIMEOUT': 10,
+    'WAIT_TIMEOUT': 5,
+}
+
+# Per-request instrumentation (core/middleware.py): Server-Timing header, slow request
+# log (logger `core.performance`, with SQL) and Prometheus histograms at /metrics.
+PERFORMANCE_MONITORING = {
+    'ENABLED': True,
+    'SERVER_TIMING': True,
+    'SLOW_REQUEST_MS': int(os.getenv('SLOW_REQUEST_MS', '500')),
+    'SLOW_REQUEST_MAX_STATEMENTS': 100,
+    'METRICS_ALLOWED_IPS': ['127.0.0.1', '::1'],
+}
+
+# Silences the slow request log while the tests run (see core/test_runner.py).
+TEST_RUNNER = 'core.test_runner.TestRunner'
@@ -0,0 +1,134 @@
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Imported by the settings module: no Django imports at module level.
+
+# Applied by the production profile on every new connection (OPTIONS['init_command']).
+PRODUCTION_PRAGMAS = {
+    # Readers no longer block the writer and vice versa; stays set in the database file.
+    'journal_mode': 'WAL',
+    # Durable at every checkpoint instead of every commit; safe with WAL.
+    'synchronous': 'NORMAL',
+    'cache_size': -64000,  # KiB per connection
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+
+def sqlite_database(name, profile='development', conn_max_age=600, timeout=20, pragmas=None):
+    """
+    Returns a DATABASES entry for the SQLite file `name`.
+
+    - `development`: Django's defaults (rollback journal, a new connection per request,
+      DEFERRED transactions that fail with "database is locked" when two of them try to
+      upgrade to a write at the same time).
+    - `production`: PRODUCTION_PRAGMAS (plus `pragmas`) on every new connection, a busy
+      timeout of `timeout` seconds, persistent connections (`conn_max_age`, with health
+      checks) and BEGIN IMMEDIATE for atomic blocks, so a write transaction takes the
+      write lock up front and waits for it instead of failing halfway.
+    """
+    database = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': name,
+    }
+    if profile == 'development':
+        return database
+    if profile != 'production':
+        raise ValueError(f'Unknown SQLite profile: {profile!r}')
+    pragmas = {**PRODUCTION_PRAGMAS, **(pragmas or {})}
+    database.update(
+        CONN_MAX_AGE=conn_max_age,
+        CONN_HEALTH_CHECKS=True,
+        OPTIONS={
+            'timeout': timeout,
+            'transaction_mode': 'IMMEDIATE',
+            'init_command': ';'.join(f'PRAGMA {pragma}={value}' for pragma, value in pragmas.items()),
+        }
+    )
+    return database
+
+
+def copy_database(source, target):
+    """
+    Copies the SQLite database of connection alias `source` into the one of `target`
+    with SQLite's online backup API: consistent, and writers on the source are not
+    blocked for the whole copy. Readers of the target see the new state afterwards.
+    """
+    from django.db import connections
+    source, target = connections[source], connections[target]
+    source.ensure_connection()
+    target.ensure_connection()
+    source.connection.backup(target.connection)
+
+
+class WriteQueueFull(Exception):
+    """Raised when QUEUE_SIZE write requests are already waiting."""
+
+
+class WriteQueue:
+    """
+    WriteQueue
+    Runs callables one at a time, in submission order, on a single writer thread with
+    its own (persistent) database connection. Used by SerializedWriteMiddleware so the
+    threads of one process never compete for SQLite's single write lock.
+
+    - At most `max_pending` calls may be running or waiting; run() raises
+      WriteQueueFull beyond that instead of queueing without bound.
+    - The caller's context variables are copied into the call.
+    """
+    def __init__(self, max_pending=64):
+        self.max_pending = max_pending
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(1, thread_name_prefix='db-writer')
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def run(self, func, *args):
+        """Runs func(*args) on the writer thread and returns its result."""
+        with self.lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise WriteQueueFull()
+            self.pending += 1
+        try:
+            return self.executor.submit(contextvars.copy_context().run, self.call, func, *args).result()
+        finally:
+            with self.lock:
+                self.pending -= 1
+                self.completed += 1
+
+    def call(self, func, *args):
+        from django.db import close_old_connections
+        # What request_started / request_finished do for request threads.
+        close_old_connections()
+        try:
+            return func(*args)
+        finally:
+            close_old_connections()
+
+    def collect_metrics(self):
+        """Collector for core.metrics.registry (exported at /metrics)."""
+        with self.lock:
+            pending, completed, rejected = self.pending, self.completed, self.rejected
+        return [
+            ('db_write_queue_pending', 'gauge', 'Write requests running or waiting for the writer thread.', [({}, pending)]),
+            ('db_write_queue_completed_total', 'counter', 'Write requests run by the writer thread.', [({}, completed)]),
+            ('db_write_queue_rejected_total', 'counter', 'Write requests rejected because the queue was full.', [({}, rejected)]),
+        ]
+
+
+_write_queue = None
+_write_queue_lock = threading.Lock()
+
+
+def get_write_queue(max_pending):
+    """Returns the process-wide WriteQueue, creating it on first use."""
+    global _write_queue
+    with _write_queue_lock:
+        if _write_queue is None:
+            from core.metrics import registry
+            _write_queue = WriteQueue(max_pending)
+            registry.register_collector(_write_queue.collect_metrics)
+        return _write_queue
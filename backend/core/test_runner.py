@@ -0,0 +1,25 @@
+import logging
+
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    DiscoverRunner that keeps the slow request log (logger `core.performance`) out of
+    the test output: password hashing alone takes longer than SLOW_REQUEST_MS, so the
+    auth tests would dump their SQL on every run. assertLogs() still sees the records.
+    """
+    quiet_loggers = ['core.performance']
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.logger_levels = {}
+        for name in self.quiet_loggers:
+            logger = logging.getLogger(name)
+            self.logger_levels[name] = logger.level
+            logger.setLevel(logging.ERROR)
+
+    def teardown_test_environment(self, **kwargs):
+        for name, level in self.logger_levels.items():
+            logging.getLogger(name).setLevel(level)
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,452 @@
+import datetime
+import io
+import os
+import tempfile
+import time
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connections, transaction
+from django.db.utils import load_backend
+from django.test import AsyncClient, Client, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APITestCase
+from board_tasks_app.api.readers import TaskListReader
+from board_tasks_app.api.serializers import TaskSerializer
+from board_tasks_app.models import BoardSettings, Subtask, Task
+from contacts_app.api.readers import ContactListReader
+from contacts_app.api.serializers import ContactSerializer
+from contacts_app.models import Contact
+from core.async_views import AsyncAPIViewMixin
+from core.middleware import current_profile
+from core.renderers import FastJSONRenderer
+from core.sqlite import sqlite_database
+from sync_app.models import CollectionVersion
+from user_auth_app.models import User
+
+REPLICA = 'replica'
+STICKY_SECONDS = 5
+
+
+@override_settings(
+    DATABASE_ROUTERS=['core.routers.ReplicaRouter'],
+    DATABASE_REPLICATION={'REPLICAS': [REPLICA], 'STICKY_SECONDS': STICKY_SECONDS, 'CACHE_ALIAS': 'default'},
+    API_RESPONSE_CACHE={'ALIAS': 'replica-dummy'},
+    CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'replica-routing'},
+        'replica-dummy': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+    },
+)
+class ReplicaRoutingTests(TransactionTestCase):
+    """
+    ReplicaRoutingMiddleware / ReplicaRouter against a primary and a replica SQLite file
+    (copied with `sync_replicas`): reads go to the replica, writes to the primary, and a
+    client that wrote reads from the primary for STICKY_SECONDS.
+    """
+    url = reverse('tasks-list')
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        # The primary is a file of its own (as in StressWritesTests; the test database's
+        # connection is put back for the teardown). The replica connection only exists
+        # in this thread for the duration of the test: it is not in DATABASES.
+        original_settings, original_connection = connections.settings['default'], connections['default']
+        connections.settings['default'] = {
+            **original_settings,
+            **sqlite_database(os.path.join(directory.name, 'primary.sqlite3')),
+        }
+        connections['default'] = connections.create_connection('default')
+        replica = {**original_settings, **sqlite_database(os.path.join(directory.name, 'replica.sqlite3'))}
+        connections[REPLICA] = load_backend(replica['ENGINE']).DatabaseWrapper(replica, REPLICA)
+        self.addCleanup(self.restore_connections, original_settings, original_connection)
+        call_command('migrate', verbosity=0)
+        self.writer = self.create_client('writer@example.com', '10.0.0.1')
+        self.reader = self.create_client('reader@example.com', '10.0.0.2')
+        self.sync()
+
+    def restore_connections(self, original_settings, original_connection):
+        for alias in ['default', REPLICA]:
+            connections[alias].close()
+        del connections[REPLICA]
+        connections.settings['default'] = original_settings
+        connections['default'] = original_connection
+
+    def create_client(self, email, address):
+        user = User.objects.create_user(email, email.split('@')[0], 'test-password')
+        client = APIClient(REMOTE_ADDR=address)
+        client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=user).key}')
+        return client
+
+    def sync(self):
+        call_command('sync_replicas', stdout=io.StringIO())
+
+    def send(self, method, *args, **kwargs):
+        """Returns the response and the numbers of queries run on the primary and the replica."""
+        with CaptureQueriesContext(connections['default']) as primary, CaptureQueriesContext(connections[REPLICA]) as replica:
+            response = method(*args, **kwargs)
+        return response, len(primary), len(replica)
+
+    def titles(self, client):
+        response, primary_queries, replica_queries = self.send(client.get, self.url, {'viewMode': 'public'})
+        self.assertEqual(response.status_code, 200)
+        return [task['title'] for task in response.json()], primary_queries, replica_queries
+
+    def test_reads_go_to_the_replica(self):
+        titles, primary_queries, replica_queries = self.titles(self.reader)
+
+        self.assertEqual(titles, [])
+        self.assertEqual(primary_queries, 0)
+        self.assertGreater(replica_queries, 0)
+
+    def test_writer_sticks_to_the_primary_until_the_window_passes(self):
+        response, _, replica_queries = self.send(self.writer.post, self.url, {
+            'title': 'Routed', 'description': '', 'dueDate': '2026-06-01T00:00:00Z',
+            'createdAt': '2026-01-01T00:00:00Z', 'priority': 'medium', 'category': 'User Story',
+            'status': 'todo', 'subtasks': [], 'isPrivate': False,
+        }, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(replica_queries, 0)
+
+        titles, _, replica_queries = self.titles(self.writer)
+
+        self.assertEqual(titles, ['Routed'])
+        self.assertEqual(replica_queries, 0)
+
+        titles, primary_queries, _ = self.titles(self.reader)
+
+        self.assertEqual(titles, [])
+        self.assertEqual(primary_queries, 0)
+
+        self.sync()
+        titles, primary_queries, _ = self.titles(self.reader)
+
+        self.assertEqual(titles, ['Routed'])
+        self.assertEqual(primary_queries, 0)
+
+        titles, _, replica_queries = self.titles(self.writer)
+
+        self.assertEqual(titles, ['Routed'])
+        self.assertEqual(replica_queries, 0)
+
+        # The pin expires with the cache entry: move the cache's clock past the window.
+        later = mock.Mock(time=mock.Mock(return_value=time.time() + STICKY_SECONDS + 1))
+        with mock.patch('django.core.cache.backends.locmem.time', later):
+            titles, primary_queries, replica_queries = self.titles(self.writer)
+
+        self.assertEqual(titles, ['Routed'])
+        self.assertEqual(primary_queries, 0)
+        self.assertGreater(replica_queries, 0)
+
+
+class ValuesListReaderTests(APITestCase):
+    """
+    The list read path (ValuesListReader rows rendered by FastJSONRenderer) produces the
+    same bytes as the serializer rendered by DRF's JSONRenderer.
+    """
+
+    def setUp(self):
+        user = User.objects.create_user('tester@example.com', 'Tester', 'test-password')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=user).key}')
+        self.contacts = [
+            Contact.objects.create(firstname=first, lastname=last, email=f'{index}@example.com', phone='+49 1')
+            for index, (first, last) in enumerate([('Émile', 'Zoë'), ('Ørjan', ''), ('Anna', 'Ahn')])
+        ]
+        now = timezone.now()
+        values = {'priority': 'medium', 'category': 'User Story', 'createdAt': now}
+        self.assigned = Task.objects.create(
+            title='Assigned', description='Line\u2028break "quoted" ünïcode', dueDate=now + datetime.timedelta(days=2),
+            updatedAt=now, status='inprogress', **values
+        )
+        self.assigned.assignments.create(contact=self.contacts[2], position=0)
+        self.assigned.assignments.create(contact=self.contacts[0], position=1)
+        Subtask.objects.replace({self.assigned: [
+            {'key': 'b', 'title': 'Second', 'completed': True},
+            {'key': 'a', 'title': 'First', 'completed': False},
+        ]})
+        Task.objects.create(title='Bare', dueDate=now, updatedAt=None, **values)
+        Task.objects.create(title='Private', dueDate=now, isPrivate=True, ownerId='7', **values)
+
+    def render_reader(self, reader_class, queryset, fields=None):
+        reader = reader_class(context={'fields': fields})
+        return FastJSONRenderer().render(reader.represent(reader.get_queryset(queryset)))
+
+    def render_serializer(self, serializer_class, queryset, fields=None):
+        return JSONRenderer().render(serializer_class(queryset, many=True, context={'fields': fields}).data)
+
+    def test_tasks_match_the_serializer(self):
+        queryset = Task.objects.prefetch_related('assignments', 'subtasks').order_by('title')
+        sparse = [
+            None,
+            ['title', 'assignedTo', 'dueDate', 'updatedAt', 'isPrivate'],
+            ['title', 'subtasks', 'subtasksTotal', 'subtasksDone'],
+        ]
+
+        for fields in sparse:
+            with self.subTest(fields=fields):
+                expected = self.render_serializer(TaskSerializer, queryset, fields)
+
+                self.assertEqual(self.render_reader(TaskListReader, queryset, fields), expected)
+
+        first = JSONRenderer().render(TaskSerializer(queryset[0]).data)
+        self.assertIn(b'"assignedTo":["%d","%d"]' % (self.contacts[2].pk, self.contacts[0].pk), first)
+        self.assertIn(b'"updatedAt":null', self.render_reader(TaskListReader, queryset.filter(title='Bare')))
+
+    def test_list_endpoint_matches_the_serializer(self):
+        params = {'viewMode': 'private', 'userId': '7'}
+        scopes = [
+            ({'ordering': 'title'}, Task.objects.filter(isPrivate=False), None),
+            ({**params, 'ordering': 'title'}, Task.objects.filter(isPrivate=True, ownerId='7'), None),
+            ({'ordering': 'title', 'fields': 'title,assignedTo'}, Task.objects.filter(isPrivate=False), ['title', 'assignedTo']),
+        ]
+
+        for query, queryset, fields in scopes:
+            with self.subTest(query=query):
+                response = self.client.get(reverse('tasks-list'), query)
+
+                queryset = queryset.prefetch_related('assignments', 'subtasks').order_by('title')
+                self.assertEqual(response.content, self.render_serializer(TaskSerializer, queryset, fields))
+
+    def test_contacts_match_the_serializer(self):
+        queryset = Contact.objects.order_by('pk')
+        expected = self.render_serializer(ContactSerializer, queryset)
+
+        self.assertEqual(self.render_reader(ContactListReader, queryset), expected)
+        response = self.client.get(reverse('contact-list'))
+        self.assertEqual(sorted(response.json(), key=lambda item: item['email']), ContactSerializer(queryset, many=True).data)
+        self.assertIn('Ørjan'.encode(), response.content)
+
+
+class PerformanceMiddlewareTests(APITestCase):
+    """Sync and async requests both report their queries and serializer time."""
+
+    def setUp(self):
+        user = User.objects.create_user('tester@example.com', 'Tester', 'test-password')
+        self.token = Token.objects.create(user=user).key
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+        self.task = Task.objects.create(
+            title='Profiled', priority='medium', category='User Story',
+            createdAt=timezone.now(), dueDate=timezone.now() + datetime.timedelta(days=7)
+        )
+
+    def assertProfiled(self, response, profile):
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(profile.queries, 0)
+        self.assertEqual(len(profile.statements), profile.queries)
+        self.assertGreater(profile.db, 0)
+        self.assertGreater(profile.serialize, 0)
+        self.assertIn(f'desc="{profile.queries} queries"', response['Server-Timing'])
+        self.assertIsNone(current_profile.get())
+
+    def test_sync_request(self):
+        response = self.client.get(reverse('tasks-detail', args=[self.task.pk]))
+
+        self.assertEqual(response.wsgi_request._performance_profile.view, 'TaskViewSet.retrieve')
+        self.assertProfiled(response, response.wsgi_request._performance_profile)
+
+    @override_settings(PERFORMANCE_MONITORING={**settings.PERFORMANCE_MONITORING, 'SLOW_REQUEST_MS': 0})
+    def test_slow_request_is_logged_with_its_sql(self):
+        with self.assertLogs('core.performance', 'WARNING') as logs:
+            response = self.client.get(reverse('tasks-detail', args=[self.task.pk]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn(f'GET /api/board-tasks/tasks/{self.task.pk}/ (TaskViewSet.retrieve) -> 200', logs.output[0])
+        self.assertIn('FROM "board_tasks_app_task"', logs.output[0])
+
+    @override_settings(ROOT_URLCONF='core.urls_async')
+    async def test_async_request(self):
+        response = await self.async_client.get(
+            reverse('tasks-detail', args=[self.task.pk]), headers={'Authorization': f'Token {self.token}'}
+        )
+
+        self.assertEqual(response.asgi_request._performance_profile.view, 'AsyncTaskViewSet.retrieve')
+        self.assertProfiled(response, response.asgi_request._performance_profile)
+
+
+class AsyncURLConfTests(APITestCase):
+    """
+    core.urls_async answers exactly like core.urls. Every scenario runs through the sync
+    views, is rolled back and runs again through the async views; the rollback also resets
+    the primary keys and collection versions, so both runs must return the same statuses,
+    bodies and ETags (304s and change feeds included).
+    """
+    urlconfs = {'core.urls': Client, 'core.urls_async': AsyncClient}
+
+    def setUp(self):
+        user = User.objects.create_user('tester@example.com', 'Tester', 'test-password')
+        self.token = Token.objects.create(user=user).key
+        self.contact = Contact.objects.create(firstname='Anna', lastname='Ahn', email='anna@example.com', phone='+49 1')
+        self.task = Task.objects.create(
+            title='First', priority='medium', category='User Story',
+            createdAt=timezone.now(), dueDate=timezone.now() + datetime.timedelta(days=7)
+        )
+        self.task.assignments.create(contact=self.contact, position=0)
+        BoardSettings.objects.create(userId='7', viewMode='public', lastChanged='2026-01-01')
+
+    def run_scenario(self, scenario):
+        """Returns the transcript of `scenario` after checking both URLconfs produce it."""
+        transcripts = []
+        for urlconf, client_class in self.urlconfs.items():
+            cache.clear()
+            self.http, self.views = client_class(), set()
+            with override_settings(ROOT_URLCONF=urlconf), transaction.atomic():
+                transcripts.append(scenario())
+                transaction.set_rollback(True)
+
+            self.assertEqual(
+                {issubclass(view, AsyncAPIViewMixin) for view in self.views},
+                {client_class is AsyncClient}, urlconf
+            )
+        self.assertEqual(transcripts[1], transcripts[0])
+        return transcripts[1]
+
+    def send(self, method, url, data=None, etag=None, authenticated=True):
+        """Sends a request through the client of the current run; returns (status, body, ETag)."""
+        headers = {'Authorization': f'Token {self.token}'} if authenticated else {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if method == 'get':
+            kwargs = {'data': data}
+        else:
+            kwargs = {'data': data or {}, 'content_type': 'application/json'}
+        request = getattr(self.http, method)
+        if isinstance(self.http, AsyncClient):
+            request = async_to_sync(request)
+        response = request(url, headers=headers, **kwargs)
+
+        self.views.add(response.resolver_match.func.cls)
+        return response.status_code, response.json() if response.content else None, response.get('ETag')
+
+    def statuses(self, transcript):
+        return [status_code for status_code, _, _ in transcript]
+
+    def test_tasks(self):
+        list_url, detail_url = reverse('tasks-list'), reverse('tasks-detail', args=[self.task.pk])
+        since = CollectionVersion.objects.sequence(CollectionVersion.TASKS)[0]
+        payload = {
+            'title': 'Second', 'description': '', 'dueDate': '2026-06-01T00:00:00Z',
+            'createdAt': '2026-01-01T00:00:00Z', 'priority': 'urgent', 'category': 'Technical Task',
+            'status': 'todo', 'assignedTo': [str(self.contact.pk)], 'isPrivate': False,
+            'subtasks': [{'id': 'a', 'title': 'Sub', 'completed': False}],
+        }
+
+        def scenario():
+            transcript = [self.send('get', list_url), self.send('get', detail_url)]
+            list_etag, detail_etag = transcript[0][2], transcript[1][2]
+            transcript += [
+                self.send('get', list_url, etag=list_etag),
+                self.send('get', detail_url, etag=detail_etag),
+                self.send('get', list_url, {'pageSize': 1}),
+                self.send('get', list_url, {'fields': 'title,assignedTo', 'ordering': '-title'}),
+                self.send('get', reverse('tasks-detail', args=[999999])),
+                self.send('get', list_url, authenticated=False),
+                self.send('post', list_url, payload),
+                self.send('post', list_url, {**payload, 'dueDate': None}),
+            ]
+            second = reverse('tasks-detail', args=[Task.objects.latest('pk').pk])
+            transcript += [
+                self.send('patch', second, {'status': 'done'}),
+                self.send('post', f'{second}move/', {'status': 'todo', 'before': self.task.pk}),
+                self.send('delete', detail_url),
+                self.send('get', list_url, etag=list_etag),
+                self.send('get', reverse('tasks-changes'), {'since': since}),
+            ]
+            return transcript
+
+        transcript = self.run_scenario(scenario)
+
+        self.assertEqual(self.statuses(transcript), [200, 200, 304, 304, 200, 200, 404, 401, 201, 400, 200, 200, 204, 200, 200])
+        self.assertEqual([task['title'] for task in transcript[-2][1]], ['Second'])
+        changes = transcript[-1][1]
+        self.assertEqual([task['title'] for task in changes['changes']], ['Second'])
+        self.assertEqual(changes['deleted'], [self.task.pk])
+
+    def test_contacts(self):
+        list_url, detail_url = reverse('contact-list'), reverse('contact-detail', args=[self.contact.pk])
+        since = CollectionVersion.objects.sequence(CollectionVersion.CONTACTS)[0]
+
+        def scenario():
+            transcript = [self.send('get', list_url), self.send('get', detail_url), self.send('get', reverse('tasks-list'))]
+            list_etag, detail_etag, tasks_etag = [etag for _, _, etag in transcript]
+            transcript += [
+                self.send('get', list_url, etag=list_etag),
+                self.send('get', detail_url, etag=detail_etag),
+                self.send('get', reverse('contact-groups')),
+                self.send('get', reverse('contact-group', args=['a'])),
+                self.send('get', reverse('contact-search'), {'q': 'ann'}),
+                self.send('post', list_url, {'firstname': 'Bert', 'lastname': 'Berg', 'email': 'bert@example.com', 'phone': '2'}),
+                self.send('post', list_url, {'firstname': 'Bert', 'email': 'invalid'}),
+            ]
+            created = reverse('contact-detail', args=[Contact.objects.latest('pk').pk])
+            transcript += [
+                self.send('patch', created, {'lastname': 'Brandt'}),
+                self.send('delete', detail_url),
+                self.send('get', list_url, etag=list_etag),
+                self.send('get', reverse('tasks-list'), etag=tasks_etag),
+                self.send('get', reverse('contact-changes'), {'since': since}),
+            ]
+            return transcript
+
+        transcript = self.run_scenario(scenario)
+
+        self.assertEqual(self.statuses(transcript), [200, 200, 200, 304, 304, 200, 200, 200, 201, 400, 200, 204, 200, 200, 200])
+        self.assertEqual([contact['lastname'] for contact in transcript[-3][1]], ['Brandt'])
+        self.assertEqual(transcript[-2][1][0]['assignedTo'], [])
+        changes = transcript[-1][1]
+        self.assertEqual([contact['lastname'] for contact in changes['changes']], ['Brandt'])
+        self.assertEqual(changes['deleted'], [self.contact.pk])
+
+    def test_board_settings(self):
+        list_url, detail_url = reverse('board-settings-list'), reverse('board-settings-detail', args=['7'])
+
+        def scenario():
+            transcript = [self.send('get', list_url), self.send('get', detail_url)]
+            list_etag, detail_etag = transcript[0][2], transcript[1][2]
+            transcript += [
+                self.send('get', list_url, etag=list_etag),
+                self.send('get', detail_url, etag=detail_etag),
+                self.send('get', reverse('board-settings-detail', args=['8'])),
+                self.send('post', list_url, {'userId': '8', 'viewMode': 'private', 'lastChanged': '2026-02-01'}),
+                self.send('patch', detail_url, {'viewMode': 'private'}),
+                self.send('get', detail_url, etag=detail_etag),
+                self.send('get', list_url, etag=list_etag),
+            ]
+            return transcript
+
+        transcript = self.run_scenario(scenario)
+
+        self.assertEqual(self.statuses(transcript), [200, 200, 304, 304, 404, 201, 200, 200, 200])
+        self.assertEqual(transcript[-2][1]['viewMode'], 'private')
+        self.assertEqual([item['userId'] for item in transcript[-1][1]], ['7', '8'])
+
+    def test_login_and_guest_login(self):
+        def guest_login():
+            status_code, body, etag = self.send('post', reverse('guest_login'), authenticated=False)
+            # The guest user and its token are created anew in each run.
+            body['token'] = Token.objects.get(key=body['token']).user_id
+            body['user'].pop('createdAt')
+            return status_code, body, etag
+
+        def scenario():
+            return [
+                guest_login(),
+                guest_login(),
+                self.send('post', reverse('login'), {'email': 'tester@example.com', 'password': 'test-password'}, authenticated=False),
+                self.send('post', reverse('login'), {'email': 'tester@example.com', 'password': 'wrong'}, authenticated=False),
+            ]
+
+        transcript = self.run_scenario(scenario)
+
+        self.assertEqual(self.statuses(transcript), [200, 200, 200, 401])
+        self.assertEqual(transcript[0][1]['token'], transcript[0][1]['user']['id'])
+        self.assertEqual(transcript[1][1], transcript[0][1])
+        self.assertEqual(transcript[2][1]['token'], self.token)
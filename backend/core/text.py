@@ -0,0 +1,68 @@
+import re
+import unicodedata
+
+from django.utils.html import escape
+
+# Words as the FTS5 unicode61 tokenizer splits them (letters and digits; `_` separates).
+WORD_PATTERN = re.compile(r'[^\W_]+', re.UNICODE)
+
+
+def fold(text):
+    """Case- and accent-folds `text` (Müller -> muller) for sorting and matching."""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+
+def sort_letter(text):
+    """Letter bucket of `text`: its folded, upper-cased initial (Émile -> E), `#` if that is no letter."""
+    initial = fold(text).lstrip()[:1]
+    return initial.upper() if initial.isalpha() else '#'
+
+
+def find_prefix_matches(text, terms):
+    """
+    Returns (start, end) spans of `text` covering the part of each word that one of
+    `terms` is a prefix of, compared folded (`mull` matches the "Müll" of "Müller").
+    """
+    folded_terms = sorted({fold(term) for term in terms if term}, key=len, reverse=True)
+    spans = []
+    for word in WORD_PATTERN.finditer(text or ''):
+        folded_word = fold(word.group())
+        term = next((term for term in folded_terms if folded_word.startswith(term)), None)
+        if term is None:
+            continue
+        # Folding may change the length (ligatures, "İ"), so walk the original characters.
+        end, covered = word.start(), 0
+        while covered < len(term) and end < word.end():
+            covered += len(fold(text[end]))
+            end += 1
+        spans.append((word.start(), end))
+    return spans
+
+
+def highlight(text, terms, length=None):
+    """
+    HTML-escaped `text` with every word prefix matching one of `terms` wrapped in
+    <mark>...</mark>, or None if nothing matches. With `length`, only a window of about
+    that many characters around the first match is kept ("…" marks cut ends).
+    """
+    spans = find_prefix_matches(text, terms)
+    if not spans:
+        return None
+    start, end = 0, len(text)
+    if length is not None and len(text) > length:
+        start = max(0, spans[0][0] - length // 4)
+        if start and (space := text.rfind(' ', 0, start)) != -1 and start - space < 20:
+            start = space + 1
+        end = min(len(text), start + length)
+        if end < len(text) and (space := text.find(' ', end)) != -1 and space - end < 20:
+            end = space
+    parts = ['…' if start else '']
+    position = start
+    for span_start, span_end in spans:
+        if span_start < start or span_end > end:
+            continue
+        parts += [escape(text[position:span_start]), '<mark>', escape(text[span_start:span_end]), '</mark>']
+        position = span_end
+    parts += [escape(text[position:end]), '…' if end < len(text) else '']
+    return ''.join(parts)
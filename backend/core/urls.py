@@ -16,10 +16,12 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from core.metrics import metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/auth/', include('user_auth_app.api.urls')),    
     path('api/contacts/', include('contacts_app.api.urls')),
     path('api/board-tasks/', include('board_tasks_app.api.urls')),   
+    path('metrics', metrics_view, name='metrics'),
 ]
\ No newline at end of file
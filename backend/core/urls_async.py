@@ -0,0 +1,17 @@
+"""
+URL configuration served under ASGI (core/asgi.py sets ASYNC_VIEWS).
+
+Same routes and route names as core/urls.py, with the async equivalents of the task,
+board settings, contact and auth views.
+"""
+from django.contrib import admin
+from django.urls import path, include
+from core.metrics import metrics_view
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+    path('api/auth/', include('user_auth_app.api.async_urls')),
+    path('api/contacts/', include('contacts_app.api.async_urls')),
+    path('api/board-tasks/', include('board_tasks_app.api.async_urls')),
+    path('metrics', metrics_view, name='metrics'),
+]
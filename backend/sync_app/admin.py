@@ -0,0 +1,12 @@
+from django.contrib import admin
+from .models import CollectionVersion, Tombstone
+
+@admin.register(CollectionVersion)
+class CollectionVersionAdmin(admin.ModelAdmin):
+    list_display = ('name', 'version', 'compactedSeq', 'changedAt')
+    readonly_fields = ('name', 'version', 'compactedSeq', 'changedAt')
+
+@admin.register(Tombstone)
+class TombstoneAdmin(admin.ModelAdmin):
+    list_display = ('id', 'collection', 'objectId', 'seq', 'deletedAt')
+    list_filter = ('collection',)
@@ -0,0 +1,316 @@
+import asyncio
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from core.middleware import profile_phase
+from sync_app.feeds import ChangeFeed
+from sync_app.models import CollectionVersion
+
+
+class ConditionalGetMixin:
+    """
+    ConditionalGetMixin
+    Adds strong ETag / Last-Modified headers to list and retrieve responses of a viewset.
+
+    - The validators are derived from the CollectionVersion counters of `version_collections`
+      plus the request path and query string, so they change on every write.
+    - A matching If-None-Match (or a not-newer If-Modified-Since) is answered with 304
+      before the queryset or the serializer is touched.
+    """
+    version_collections = []
+    conditional_actions = ['list', 'retrieve']
+
+    def get_conditional_state(self, request):
+        """
+        Returns (etag, last_changed) for the request; computed once per request.
+        """
+        state = getattr(request, '_conditional_state', None)
+        if state is not None:
+            return state
+        versions, last_changed = CollectionVersion.objects.state(self.version_collections)
+        request._conditional_state = self.build_conditional_state(request, versions, last_changed)
+        return request._conditional_state
+
+    async def aget_conditional_state(self, request):
+        """get_conditional_state() for async views."""
+        state = getattr(request, '_conditional_state', None)
+        if state is not None:
+            return state
+        versions, last_changed = await CollectionVersion.objects.astate(self.version_collections)
+        request._conditional_state = self.build_conditional_state(request, versions, last_changed)
+        return request._conditional_state
+
+    def build_conditional_state(self, request, versions, last_changed):
+        fingerprint = '|'.join([
+            request.path,
+            '&'.join(sorted(request.META.get('QUERY_STRING', '').split('&'))),
+            *[f'{name}:{versions[name]}' for name in sorted(versions)],
+        ])
+        etag = '"%s"' % hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()
+        return etag, last_changed
+
+    def build_response(self, handler, request, *args, **kwargs):
+        return handler(request, *args, **kwargs)
+
+    async def abuild_response(self, handler, request, *args, **kwargs):
+        return await handler(request, *args, **kwargs)
+
+    def conditional_response(self, handler, request, *args, **kwargs):
+        etag, last_changed = self.get_conditional_state(request)
+        response = self.get_not_modified_response(request, etag, last_changed)
+        if response is None:
+            response = self.build_response(handler, request, *args, **kwargs)
+        return self.add_validators(response, etag, last_changed)
+
+    async def aconditional_response(self, handler, request, *args, **kwargs):
+        """conditional_response() for async views; `handler` is a coroutine function."""
+        etag, last_changed = await self.aget_conditional_state(request)
+        response = self.get_not_modified_response(request, etag, last_changed)
+        if response is None:
+            response = await self.abuild_response(handler, request, *args, **kwargs)
+        return self.add_validators(response, etag, last_changed)
+
+    def get_not_modified_response(self, request, etag, last_changed):
+        last_modified = last_changed.timestamp() if last_changed else None
+        return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    def add_validators(self, response, etag, last_changed):
+        last_modified = last_changed.timestamp() if last_changed else None
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+            response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        if 'list' not in self.conditional_actions:
+            return super().list(request, *args, **kwargs)
+        return self.conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        if 'retrieve' not in self.conditional_actions:
+            return super().retrieve(request, *args, **kwargs)
+        return self.conditional_response(super().retrieve, request, *args, **kwargs)
+
+
+class CachedResponseMixin(ConditionalGetMixin):
+    """
+    CachedResponseMixin
+    Server-side cache of the rendered responses of `cached_actions`, on top of the
+    conditional GET handling.
+
+    - The cache key is derived from the ETag (path, query parameters including the
+      viewMode/userId scope, CollectionVersion counters) plus host and media type.
+      Every write bumps the collection version through the model signals (or explicitly
+      in the bulk paths), so entries are never served after a change; stale entries
+      simply expire.
+    - Concurrent misses for the same key are coalesced: the first request takes a lock
+      via cache.add() and renders the response, the others wait for the entry.
+    - Only uses get/add/set/delete, so it works with every Django cache backend.
+    """
+    cached_actions = []
+
+    def get_response_cache_settings(self):
+        return {
+            'ALIAS': 'default',
+            'TIMEOUT': 300,
+            'LOCK_TIMEOUT': 10,
+            'WAIT_TIMEOUT': 5,
+            'POLL_INTERVAL': 0.05,
+            **getattr(settings, 'API_RESPONSE_CACHE', {}),
+        }
+
+    def get_response_cache_key(self, request):
+        etag, _ = self.get_conditional_state(request)
+        raw = '|'.join([etag, request.get_host(), request.accepted_media_type or ''])
+        return 'api-response:%s' % hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def build_response(self, handler, request, *args, **kwargs):
+        if self.action not in self.cached_actions:
+            return super().build_response(handler, request, *args, **kwargs)
+        config = self.get_response_cache_settings()
+        cache = caches[config['ALIAS']]
+        key = self.get_response_cache_key(request)
+        entry = cache.get(key)
+        if entry is None:
+            entry = self.rebuild_cached_response(cache, config, key, handler, request, *args, **kwargs)
+            if isinstance(entry, HttpResponseBase):
+                return entry
+        content_type, content = entry
+        return HttpResponse(content, content_type=content_type)
+
+    def rebuild_cached_response(self, cache, config, key, handler, request, *args, **kwargs):
+        """
+        Renders and stores the response for `key`, or waits for the request that holds the
+        rebuild lock. Returns the cache entry, or the uncached response for non-200 results.
+        """
+        lock_key = f'{key}:lock'
+        deadline = time.monotonic() + config['WAIT_TIMEOUT']
+        locked = cache.add(lock_key, 1, config['LOCK_TIMEOUT'])
+        while not locked and time.monotonic() < deadline:
+            time.sleep(config['POLL_INTERVAL'])
+            entry = cache.get(key)
+            if entry is not None:
+                return entry
+            locked = cache.add(lock_key, 1, config['LOCK_TIMEOUT'])
+        try:
+            if locked and (entry := cache.get(key)) is not None:
+                return entry
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            entry = self.render_cache_entry(request, response)
+            cache.set(key, entry, config['TIMEOUT'])
+            return entry
+        finally:
+            if locked:
+                cache.delete(lock_key)
+
+    async def abuild_response(self, handler, request, *args, **kwargs):
+        """build_response() for async views, through the async cache API."""
+        if self.action not in self.cached_actions:
+            return await super().abuild_response(handler, request, *args, **kwargs)
+        config = self.get_response_cache_settings()
+        cache = caches[config['ALIAS']]
+        key = self.get_response_cache_key(request)
+        entry = await cache.aget(key)
+        if entry is None:
+            entry = await self.arebuild_cached_response(cache, config, key, handler, request, *args, **kwargs)
+            if isinstance(entry, HttpResponseBase):
+                return entry
+        content_type, content = entry
+        return HttpResponse(content, content_type=content_type)
+
+    async def arebuild_cached_response(self, cache, config, key, handler, request, *args, **kwargs):
+        """rebuild_cached_response() for async views: waiting does not hold a thread."""
+        lock_key = f'{key}:lock'
+        deadline = time.monotonic() + config['WAIT_TIMEOUT']
+        locked = await cache.aadd(lock_key, 1, config['LOCK_TIMEOUT'])
+        while not locked and time.monotonic() < deadline:
+            await asyncio.sleep(config['POLL_INTERVAL'])
+            entry = await cache.aget(key)
+            if entry is not None:
+                return entry
+            locked = await cache.aadd(lock_key, 1, config['LOCK_TIMEOUT'])
+        try:
+            if locked and (entry := await cache.aget(key)) is not None:
+                return entry
+            response = await handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            entry = self.render_cache_entry(request, response)
+            await cache.aset(key, entry, config['TIMEOUT'])
+            return entry
+        finally:
+            if locked:
+                await cache.adelete(lock_key)
+
+    def render_cache_entry(self, request, response):
+        response.accepted_renderer = request.accepted_renderer
+        response.accepted_media_type = request.accepted_media_type
+        response.renderer_context = self.get_renderer_context()
+        with profile_phase('render'):
+            response.render()
+        return response['Content-Type'], response.content
+
+
+class AsyncConditionalGetMixin:
+    """
+    AsyncConditionalGetMixin
+    Applies the conditional GET handling (and the response cache) of ConditionalGetMixin /
+    CachedResponseMixin to the async list and retrieve of core.async_views.AsyncViewSetMixin.
+    Place it before AsyncViewSetMixin on a viewset that uses one of those mixins.
+    """
+    async def list(self, request, *args, **kwargs):
+        if 'list' not in self.conditional_actions:
+            return await super().list(request, *args, **kwargs)
+        return await self.aconditional_response(super().list, request, *args, **kwargs)
+
+    async def retrieve(self, request, *args, **kwargs):
+        if 'retrieve' not in self.conditional_actions:
+            return await super().retrieve(request, *args, **kwargs)
+        return await self.aconditional_response(super().retrieve, request, *args, **kwargs)
+
+
+class ChangeFeedMixin:
+    """
+    ChangeFeedMixin
+    Adds GET <collection>/changes/?since=<cursor> for delta sync to a model viewset.
+
+    - Rows carry the changeSeq stamped from the CollectionVersion counter of
+      `change_collection` on every write; deletions leave a Tombstone with their sequence.
+    - The response holds the rows changed after `since` (`changes`), the ids that left
+      the collection or the client's scope (`deleted`) and the `cursor` for the next call.
+      `hasMore` is true while further pages are pending.
+    - Without `since`, or when `since` lies before the compacted part of the deletion log,
+      `resync` is true: the client reloads the full list and continues from `cursor`.
+    - Writes through the viewset run in a transaction so the counter bump and the row
+      become visible together and a cursor never skips a change.
+    """
+    change_collection = None
+    change_serializer_class = None
+    change_page_size = 500
+    change_max_page_size = 5000
+
+    def get_change_queryset(self):
+        return self.change_serializer_class.Meta.model.objects.all()
+
+    def is_in_change_scope(self, instance):
+        """
+        Returns False for changed rows the requesting client must not keep (e.g. tasks
+        that became private); they are reported in `deleted` instead of `changes`.
+        """
+        return True
+
+    def get_change_limit(self, request):
+        try:
+            limit = int(request.query_params.get('limit', self.change_page_size))
+        except (TypeError, ValueError):
+            raise ValidationError({'limit': ['Expected an integer.']})
+        return max(1, min(limit, self.change_max_page_size))
+
+    @action(detail=False, methods=['get'], url_path='changes')
+    def changes(self, request):
+        raw_since = request.query_params.get('since')
+        if raw_since is not None and not raw_since.isdigit():
+            raise ValidationError({'since': ['Expected a cursor returned by a previous call.']})
+        since = int(raw_since) if raw_since is not None else None
+        feed = ChangeFeed(self.change_collection, self.get_change_queryset())
+        page = feed.read(since, self.get_change_limit(request))
+
+        changed, deleted = [], page.deleted
+        for instance in page.rows:
+            if self.is_in_change_scope(instance):
+                changed.append(instance)
+            else:
+                deleted.append(instance.pk)
+        serializer = self.change_serializer_class(changed, many=True, context=self.get_serializer_context())
+        return Response({
+            'cursor': page.cursor,
+            'resync': page.resync,
+            'hasMore': page.has_more,
+            'changes': serializer.data,
+            'deleted': deleted,
+        })
+
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            super().perform_create(serializer)
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            super().perform_update(serializer)
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            super().perform_destroy(instance)
@@ -0,0 +1,70 @@
+from sync_app.models import CollectionVersion, Tombstone
+
+
+class ChangePage:
+    """
+    One page of a collection's change log.
+    `rows` are the changed model instances, `deleted` the ids of deleted rows and
+    `cursor` the sequence number to continue from. `resync` means the log can not
+    be replayed from the requested position and the client must reload everything.
+    """
+    def __init__(self, cursor, resync=False, has_more=False, rows=(), deleted=()):
+        self.cursor = cursor
+        self.resync = resync
+        self.has_more = has_more
+        self.rows = list(rows)
+        self.deleted = list(deleted)
+
+
+class ChangeFeed:
+    """
+    ChangeFeed
+    Reads the change log of a collection whose rows carry a `changeSeq` stamped from
+    its CollectionVersion counter and whose deletions are recorded as Tombstones.
+    Shared by the changes/ endpoints and the event streams.
+    """
+    def __init__(self, collection, queryset):
+        self.collection = collection
+        self.queryset = queryset
+
+    def sequence(self):
+        return CollectionVersion.objects.sequence(self.collection)
+
+    def get_upper_bound(self, since, version, limit):
+        """
+        Returns the highest sequence number of this page: the `limit`-th change after
+        `since` (rows and tombstones merged), or `version` when fewer are pending.
+        Every change sharing that sequence number is included, so batched writes
+        stamped with one number are never split across pages.
+        """
+        row_seqs = list(
+            self.queryset.model.objects.filter(changeSeq__gt=since, changeSeq__lte=version)
+            .order_by('changeSeq').values_list('changeSeq', flat=True)[:limit + 1]
+        )
+        tombstone_seqs = list(
+            Tombstone.objects.filter(collection=self.collection, seq__gt=since, seq__lte=version)
+            .order_by('seq').values_list('seq', flat=True)[:limit + 1]
+        )
+        seqs = sorted(row_seqs + tombstone_seqs)
+        if len(seqs) <= limit:
+            return version
+        return seqs[limit - 1]
+
+    def read(self, since, limit, until=None):
+        """
+        Returns the ChangePage following `since`, holding at most about `limit` changes.
+        With `until` the page does not extend past that sequence number, which makes the
+        result reproducible for concurrent readers catching up to the same version.
+        """
+        version, compacted_seq = self.sequence()
+        if since is None or since < compacted_seq or since > version:
+            return ChangePage(version, resync=True)
+        if until is not None:
+            version = min(version, until)
+        upper = self.get_upper_bound(since, version, limit)
+        rows = self.queryset.filter(changeSeq__gt=since, changeSeq__lte=upper).order_by('changeSeq', 'pk')
+        deleted = (
+            Tombstone.objects.filter(collection=self.collection, seq__gt=since, seq__lte=upper)
+            .order_by('seq').values_list('objectId', flat=True)
+        )
+        return ChangePage(upper, has_more=upper < version, rows=rows, deleted=deleted)
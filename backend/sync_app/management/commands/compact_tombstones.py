@@ -0,0 +1,33 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from sync_app.models import Tombstone
+
+
+class Command(BaseCommand):
+    """
+    Removes tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS and records the
+    compacted sequence per collection, so delta-sync clients with an older cursor
+    receive `resync: true` instead of silently missing deletions.
+    Meant to run periodically (e.g. daily from cron).
+    """
+    help = 'Removes expired delta-sync tombstones.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=settings.SYNC_TOMBSTONE_RETENTION_DAYS,
+            help='Keep tombstones younger than this many days.'
+        )
+
+    def handle(self, *args, **options):
+        older_than = timezone.now() - datetime.timedelta(days=options['retention_days'])
+        collections = Tombstone.objects.values_list('collection', flat=True).distinct()
+        for collection in list(collections):
+            with transaction.atomic():
+                deleted = Tombstone.objects.compact(collection, older_than)
+            self.stdout.write(f'{collection}: removed {deleted} tombstones')
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def create_collections(apps, schema_editor):
+    CollectionVersion = apps.get_model('sync_app', 'CollectionVersion')
+    for name in ['tasks', 'contacts', 'board-settings']:
+        CollectionVersion.objects.get_or_create(name=name)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CollectionVersion',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('version', models.BigIntegerField(default=0)),
+                ('changedAt', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunPython(create_collections, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def start_change_log(apps, schema_editor):
+    """
+    Rows written before this migration carry changeSeq 0 and have no tombstones,
+    so the existing history is marked as compacted: the first delta sync resyncs.
+    """
+    CollectionVersion = apps.get_model('sync_app', 'CollectionVersion')
+    for name in ['tasks', 'contacts']:
+        collection, _ = CollectionVersion.objects.get_or_create(name=name)
+        collection.version += 1
+        collection.compactedSeq = collection.version
+        collection.save()
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sync_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collectionversion',
+            name='compactedSeq',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('collection', models.CharField(max_length=50)),
+                ('objectId', models.BigIntegerField()),
+                ('seq', models.BigIntegerField()),
+                ('deletedAt', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['collection', 'seq'], name='tombstone_collection_seq_idx')],
+            },
+        ),
+        migrations.RunPython(start_change_log, migrations.RunPython.noop),
+    ]
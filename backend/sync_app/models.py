@@ -0,0 +1,124 @@
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
+from sync_app.pubsub import broker
+
+class CollectionVersionManager(models.Manager):
+    """
+    CollectionVersionManager
+    Custom manager for CollectionVersion model.
+
+    Methods:
+    - bump: Increments the version of a collection after a write.
+    - state / astate: Returns the versions and the latest change time of several collections.
+    - sequence: Returns the current version and the compaction horizon of a collection.
+    """
+    def bump(self, name, count=1):
+        """
+        Increments the version of the collection `name` by `count` and returns the new version.
+        Must be called inside the transaction of the write it records; the new version is
+        published to the `name` channel of the pub/sub broker once that transaction commits.
+        """
+        now = timezone.now()
+        updated = self.filter(name=name).update(version=F('version') + count, changedAt=now)
+        if not updated:
+            self.get_or_create(name=name, defaults={'version': count, 'changedAt': now})
+        version = self.filter(name=name).values_list('version', flat=True).get()
+        transaction.on_commit(lambda: broker.publish(name, version), using=self.db, robust=True)
+        return version
+
+    def sequence(self, name):
+        """
+        Returns (version, compactedSeq) of the collection `name`.
+        Changes at or below compactedSeq can no longer be replayed from the deletion log.
+        """
+        row = self.filter(name=name).values_list('version', 'compactedSeq').first()
+        return row or (0, 0)
+
+    def state(self, names):
+        """
+        Returns ({name: version}, latest changedAt) for the given collections with one query.
+        Collections that were never written report version 0.
+        """
+        return self.fold_state(names, self.filter(name__in=names).values_list('name', 'version', 'changedAt'))
+
+    async def astate(self, names):
+        """state() for async views."""
+        rows = [row async for row in self.filter(name__in=names).values_list('name', 'version', 'changedAt')]
+        return self.fold_state(names, rows)
+
+    def fold_state(self, names, rows):
+        versions = {name: 0 for name in names}
+        last_changed = None
+        for name, version, changed_at in rows:
+            versions[name] = version
+            if last_changed is None or changed_at > last_changed:
+                last_changed = changed_at
+        return versions, last_changed
+
+class CollectionVersion(models.Model):
+    """
+    CollectionVersion model.
+    Monotonic write counter per API collection (tasks, contacts, board settings).
+    Used to answer conditional GETs without touching the collection tables and as the
+    change sequence stamped on rows (changeSeq) and tombstones for delta sync.
+    """
+    TASKS = 'tasks'
+    CONTACTS = 'contacts'
+    BOARD_SETTINGS = 'board-settings'
+
+    name = models.CharField(max_length=50, primary_key=True)
+    version = models.BigIntegerField(default=0)
+    compactedSeq = models.BigIntegerField(default=0)
+    changedAt = models.DateTimeField(default=timezone.now)
+
+    objects = CollectionVersionManager()
+
+    def __str__(self):
+        return f"{self.name}@{self.version}"
+
+class TombstoneManager(models.Manager):
+    """
+    TombstoneManager
+    Custom manager for Tombstone model.
+
+    Methods:
+    - record: Stores tombstones for deleted rows of a collection.
+    - compact: Drops tombstones older than the retention window.
+    """
+    def record(self, collection, object_ids, seq):
+        self.bulk_create([
+            self.model(collection=collection, objectId=object_id, seq=seq)
+            for object_id in object_ids
+        ])
+
+    def compact(self, collection, older_than):
+        """
+        Deletes the tombstones of `collection` created before `older_than` and moves the
+        collection's compactedSeq up to the newest deleted sequence number.
+        Returns the number of deleted tombstones.
+        """
+        expired = self.filter(collection=collection, deletedAt__lt=older_than)
+        horizon = expired.aggregate(models.Max('seq'))['seq__max']
+        if horizon is None:
+            return 0
+        deleted, _ = self.filter(collection=collection, seq__lte=horizon).delete()
+        CollectionVersion.objects.filter(name=collection, compactedSeq__lt=horizon).update(compactedSeq=horizon)
+        return deleted
+
+class Tombstone(models.Model):
+    """
+    Tombstone model.
+    Records the deletion of a row so delta-sync clients can drop it locally.
+    """
+    collection = models.CharField(max_length=50)
+    objectId = models.BigIntegerField()
+    seq = models.BigIntegerField()
+    deletedAt = models.DateTimeField(default=timezone.now)
+
+    objects = TombstoneManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['collection', 'seq'], name='tombstone_collection_seq_idx'),
+        ]
@@ -0,0 +1,139 @@
+import asyncio
+import collections
+import threading
+
+from django.conf import settings
+from django.utils.functional import SimpleLazyObject
+from django.utils.module_loading import import_string
+
+
+class SubscriptionClosed(Exception):
+    """Raised by Subscription.get() once the broker dropped the subscription."""
+
+
+class Subscription:
+    """
+    Subscription
+    Bounded mailbox of one subscriber, consumed from the subscriber's event loop.
+
+    Backpressure: the broker never blocks on a slow consumer. When the mailbox is full
+    the oldest message is discarded (policy `drop-oldest`, counted in `dropped`) or the
+    subscription is closed (policy `disconnect`) so the client reconnects and catches up.
+    """
+    DROP_OLDEST = 'drop-oldest'
+    DISCONNECT = 'disconnect'
+
+    def __init__(self, broker, channel, max_queue, overflow):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.messages = collections.deque()
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.ready = asyncio.Event()
+        self.closed = False
+        self.dropped = 0
+
+    def deliver(self, message):
+        """Runs on the subscriber's event loop."""
+        if self.closed:
+            return
+        if len(self.messages) >= self.max_queue:
+            self.dropped += 1
+            if self.overflow == self.DISCONNECT:
+                self.close()
+                return
+            self.messages.popleft()
+        self.messages.append(message)
+        self.ready.set()
+
+    async def get(self, timeout=None):
+        """
+        Returns the next message, or None when `timeout` seconds pass without one.
+        """
+        if not self.messages and not self.closed:
+            self.ready.clear()
+            try:
+                await asyncio.wait_for(self.ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        if self.closed:
+            raise SubscriptionClosed()
+        return self.messages.popleft()
+
+    def drain(self):
+        """Returns and removes all messages that are already waiting."""
+        messages = list(self.messages)
+        self.messages.clear()
+        return messages
+
+    def close(self):
+        self.closed = True
+        self.ready.set()
+        self.broker.unsubscribe(self)
+
+
+class BaseBroker:
+    """
+    BaseBroker
+    Interface of the pub/sub layer used to fan out change notifications.
+    `publish` is called from synchronous code (typically a transaction.on_commit hook),
+    `subscribe` from an async view running on the ASGI event loop.
+    """
+    def __init__(self, queue_size=16, overflow=Subscription.DROP_OLDEST):
+        self.queue_size = queue_size
+        self.overflow = overflow
+
+    def publish(self, channel, message):
+        raise NotImplementedError
+
+    def subscribe(self, channel):
+        raise NotImplementedError
+
+    def unsubscribe(self, subscription):
+        raise NotImplementedError
+
+
+class InProcessBroker(BaseBroker):
+    """
+    InProcessBroker
+    Fans messages out to the subscribers of the current process.
+    Sufficient for a single ASGI worker and for tests; deployments with several
+    worker processes configure a broker backed by an external pub/sub service.
+    """
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.lock = threading.Lock()
+        self.subscribers = collections.defaultdict(set)
+
+    def publish(self, channel, message):
+        with self.lock:
+            subscribers = list(self.subscribers.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, message)
+            except RuntimeError:
+                self.unsubscribe(subscription)
+
+    def subscribe(self, channel):
+        subscription = Subscription(self, channel, self.queue_size, self.overflow)
+        with self.lock:
+            self.subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            self.subscribers[subscription.channel].discard(subscription)
+
+    def subscriber_count(self, channel):
+        with self.lock:
+            return len(self.subscribers.get(channel, ()))
+
+
+def create_broker():
+    config = getattr(settings, 'SYNC_BROKER', {})
+    backend = import_string(config.get('BACKEND', 'sync_app.pubsub.InProcessBroker'))
+    return backend(**config.get('OPTIONS', {}))
+
+
+broker = SimpleLazyObject(create_broker)
@@ -0,0 +1,176 @@
+import asyncio
+import collections
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.settings import api_settings
+from sync_app.pubsub import SubscriptionClosed, broker
+
+
+def get_token_authenticator():
+    """
+    Returns the configured token authentication class (the first DEFAULT_AUTHENTICATION_CLASSES
+    entry derived from TokenAuthentication), so streams accept the same tokens as the REST API.
+    """
+    for authentication_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        if issubclass(authentication_class, TokenAuthentication):
+            return authentication_class()
+    return TokenAuthentication()
+
+
+async def authenticate_stream(request):
+    """
+    Authenticates a stream request with `Authorization: Token <key>` or, because the
+    browser EventSource API can not set headers, with a `token` query parameter.
+    Returns the user or raises AuthenticationFailed.
+    """
+    authenticator = get_token_authenticator()
+    header = request.headers.get('Authorization', '').split()
+    if len(header) == 2 and header[0] == authenticator.keyword:
+        key = header[1]
+    else:
+        key = request.GET.get('token')
+    if not key:
+        raise AuthenticationFailed('Authentication credentials were not provided.')
+    user, _ = await sync_to_async(authenticator.authenticate_credentials)(key)
+    return user
+
+
+class SharedPageLoader:
+    """
+    SharedPageLoader
+    Loads and serializes change pages once per process for all open streams.
+
+    Subscribers of a collection usually wake up for the same notification at the same
+    cursor, so the page for (since, until) is read from the database by the first one
+    and awaited by the others. A small LRU keeps recent pages for late subscribers.
+    """
+    max_entries = 64
+
+    def __init__(self):
+        self.pages = collections.OrderedDict()
+
+    def get(self, key, load):
+        loop = asyncio.get_running_loop()
+        cache_key = (id(loop), *key)
+        page = self.pages.get(cache_key)
+        if page is None or (page.done() and page.exception() is not None):
+            page = loop.create_task(sync_to_async(load)())
+            self.pages[cache_key] = page
+            while len(self.pages) > self.max_entries:
+                self.pages.popitem(last=False)
+        else:
+            self.pages.move_to_end(cache_key)
+        return asyncio.shield(page)
+
+
+class ChangeStream:
+    """
+    ChangeStream
+    Server-Sent Events stream of a collection's changes for one subscriber.
+
+    - Waits for version notifications on the collection's broker channel and replays
+      the change log (ChangeFeed) from its cursor up to the notified version, so no
+      change is lost even when notifications are dropped under backpressure.
+    - Emits `<prefix>.changed` with the serialized row, `<prefix>.deleted` with the id
+      (also for rows that left the subscriber's scope) and `resync` when the log can
+      not be replayed. After each page an `id:` line carries the cursor, so a
+      reconnecting EventSource resumes via the Last-Event-ID header.
+    - Sends a comment line as heartbeat when nothing happened for a while.
+    """
+    loader = SharedPageLoader()
+
+    def __init__(self, feed, serialize, in_scope, prefix, since, limit=500):
+        self.feed = feed
+        self.serialize = serialize
+        self.in_scope = in_scope
+        self.prefix = prefix
+        self.since = since
+        self.limit = limit
+        self.heartbeat = getattr(settings, 'SYNC_STREAM_HEARTBEAT_SECONDS', 15)
+
+    def load_page(self, since, until):
+        page = self.feed.read(since, self.limit, until=until)
+        page.items = [(instance, self.serialize(instance)) for instance in page.rows]
+        return page
+
+    def format_event(self, event, data):
+        return f'event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n'
+
+    def render_page(self, page):
+        chunks = []
+        if page.resync:
+            chunks.append(self.format_event('resync', {'cursor': page.cursor}))
+        for pk in page.deleted:
+            chunks.append(self.format_event(f'{self.prefix}.deleted', {'id': pk}))
+        for instance, data in page.items:
+            if self.in_scope(instance):
+                chunks.append(self.format_event(f'{self.prefix}.changed', data))
+            else:
+                chunks.append(self.format_event(f'{self.prefix}.deleted', {'id': instance.pk}))
+        chunks.append(f'id: {page.cursor}\n\n')
+        return ''.join(chunks)
+
+    async def catch_up(self, until):
+        # A cursor ahead of the version (e.g. from before a restore) gets a resync page too.
+        while self.since != until:
+            since = self.since
+            page = await self.loader.get(
+                (self.feed.collection, since, until, self.limit),
+                lambda: self.load_page(since, until)
+            )
+            yield self.render_page(page)
+            self.since = page.cursor
+            if page.resync or not page.has_more:
+                break
+
+    async def events(self):
+        subscription = broker.subscribe(self.feed.collection)
+        try:
+            version, _ = await sync_to_async(self.feed.sequence)()
+            yield 'retry: 5000\n\n'
+            if self.since is None:
+                self.since = version
+                yield f'id: {version}\n\n'
+            else:
+                async for chunk in self.catch_up(version):
+                    yield chunk
+            while True:
+                version = await subscription.get(timeout=self.heartbeat)
+                if version is None:
+                    yield ': keepalive\n\n'
+                    continue
+                # One write usually bumps the version several times; catch up to the newest only.
+                version = max([version, *subscription.drain()])
+                async for chunk in self.catch_up(version):
+                    yield chunk
+        except SubscriptionClosed:
+            return
+        finally:
+            subscription.close()
+
+    def as_response(self):
+        response = StreamingHttpResponse(self.events(), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+
+def parse_stream_cursor(request):
+    """
+    Returns the cursor to resume from: the Last-Event-ID header sent by a reconnecting
+    EventSource, else the `since` query parameter, else None (start at the current version).
+    """
+    raw = request.headers.get('Last-Event-ID') or request.GET.get('since')
+    if raw is None or not raw.isdigit():
+        return None
+    return int(raw)
+
+
+def authentication_failed_response(exc):
+    return JsonResponse({'detail': str(exc.detail)}, status=401)
@@ -0,0 +1,515 @@
+import asyncio
+import contextlib
+import datetime
+import io
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from board_tasks_app.models import BoardSettings, Task
+from contacts_app.models import Contact
+from sync_app.feeds import ChangeFeed
+from sync_app.models import CollectionVersion, Tombstone
+from sync_app.pubsub import InProcessBroker, Subscription, SubscriptionClosed
+from sync_app.streams import ChangeStream, SharedPageLoader
+from user_auth_app.models import User
+
+
+def create_contact(name):
+    return Contact.objects.create(firstname='Anna', lastname=name, email=f'{name}@example.com', phone='1')
+
+
+class ChangeFeedTests(APITestCase):
+    """ChangeFeed pages rows and tombstones by change sequence number."""
+
+    def setUp(self):
+        self.feed = ChangeFeed(CollectionVersion.CONTACTS, Contact.objects.all())
+        self.start = self.version()
+
+    def version(self):
+        return CollectionVersion.objects.sequence(CollectionVersion.CONTACTS)[0]
+
+    def test_cursor_advances_past_read_changes(self):
+        first = create_contact('Ahn')
+        page = self.feed.read(self.start, 10)
+
+        self.assertFalse(page.resync)
+        self.assertFalse(page.has_more)
+        self.assertEqual([row.pk for row in page.rows], [first.pk])
+        self.assertEqual(page.cursor, self.version())
+
+        second = create_contact('Berg')
+        next_page = self.feed.read(page.cursor, 10)
+
+        self.assertEqual([row.pk for row in next_page.rows], [second.pk])
+        self.assertEqual(next_page.cursor, self.version())
+        self.assertEqual(self.feed.read(next_page.cursor, 10).rows, [])
+
+    def test_pages_do_not_split_a_sequence_number(self):
+        with transaction.atomic():
+            CollectionVersion.objects.bump(CollectionVersion.CONTACTS)
+            batch = [create_contact(name) for name in ['Ahn', 'Berg', 'Cruz']]
+            seq = self.version()
+            Contact.objects.filter(pk__in=[contact.pk for contact in batch]).update(changeSeq=seq)
+        latest = create_contact('Diaz')
+
+        page = self.feed.read(self.start, 2)
+
+        self.assertTrue(page.has_more)
+        self.assertEqual(page.cursor, seq)
+        self.assertEqual(sorted(row.pk for row in page.rows), sorted(contact.pk for contact in batch))
+        rest = self.feed.read(page.cursor, 2)
+        self.assertFalse(rest.has_more)
+        self.assertEqual([row.pk for row in rest.rows], [latest.pk])
+
+    def test_deleted_ids_come_from_tombstones(self):
+        kept, removed = create_contact('Ahn'), create_contact('Berg')
+        since = self.version()
+        removed_id = removed.pk
+
+        removed.delete()
+        page = self.feed.read(since, 10)
+
+        self.assertEqual(page.rows, [])
+        self.assertEqual(page.deleted, [removed_id])
+        self.assertTrue(Tombstone.objects.filter(collection=CollectionVersion.CONTACTS, objectId=removed_id, seq=page.cursor).exists())
+        self.assertEqual([row.pk for row in self.feed.read(self.start, 10).rows], [kept.pk])
+
+    def test_unknown_or_compacted_cursor_requires_resync(self):
+        create_contact('Ahn')
+        version = self.version()
+
+        self.assertTrue(self.feed.read(None, 10).resync)
+        self.assertTrue(self.feed.read(version + 1, 10).resync)
+        page = self.feed.read(version, 10)
+        self.assertFalse(page.resync)
+
+        create_contact('Berg').delete()
+        Tombstone.objects.update(deletedAt=timezone.now() - datetime.timedelta(days=60))
+        call_command('compact_tombstones', '--retention-days', '30', stdout=io.StringIO())
+
+        self.assertFalse(Tombstone.objects.exists())
+        self.assertEqual(CollectionVersion.objects.sequence(CollectionVersion.CONTACTS), (self.version(), self.version()))
+        resync = self.feed.read(version, 10)
+        self.assertTrue(resync.resync)
+        self.assertEqual(resync.cursor, self.version())
+        self.assertFalse(self.feed.read(self.version(), 10).resync)
+
+
+class ChangesEndpointTests(APITestCase):
+    """GET tasks/changes/ reports scoped changes, deletions and the next cursor."""
+    url = reverse('tasks-changes')
+
+    def setUp(self):
+        user = User.objects.create_user('tester@example.com', 'Tester', 'test-password')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=user).key}')
+
+    def create_task(self, **fields):
+        values = {
+            'title': 'Task',
+            'priority': 'medium',
+            'category': 'User Story',
+            'createdAt': timezone.now(),
+            'dueDate': timezone.now() + datetime.timedelta(days=7),
+        }
+        values.update(fields)
+        return Task.objects.create(**values)
+
+    def test_changes_since_cursor(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()['resync'])
+        cursor = response.json()['cursor']
+
+        public = self.create_task(title='Public')
+        private = self.create_task(title='Private')
+        doomed = self.create_task(title='Doomed')
+        private.isPrivate, private.ownerId = True, '7'
+        private.save()
+        doomed_id = doomed.pk
+        doomed.delete()
+        response = self.client.get(self.url, {'since': cursor, 'viewMode': 'public'})
+
+        body = response.json()
+        self.assertFalse(body['resync'])
+        self.assertFalse(body['hasMore'])
+        self.assertEqual([task['id'] for task in body['changes']], [public.pk])
+        self.assertEqual(sorted(body['deleted']), sorted([private.pk, doomed_id]))
+        self.assertEqual(body['cursor'], CollectionVersion.objects.sequence(CollectionVersion.TASKS)[0])
+
+        response = self.client.get(self.url, {'since': body['cursor']})
+
+        self.assertEqual((response.json()['changes'], response.json()['deleted']), ([], []))
+
+    def test_limit_pages_the_feed(self):
+        since = CollectionVersion.objects.sequence(CollectionVersion.TASKS)[0]
+        tasks = [self.create_task(title=f'Task {index}') for index in range(3)]
+
+        response = self.client.get(self.url, {'since': since, 'limit': 2})
+
+        body = response.json()
+        self.assertTrue(body['hasMore'])
+        self.assertEqual([task['id'] for task in body['changes']], [task.pk for task in tasks[:2]])
+        response = self.client.get(self.url, {'since': body['cursor'], 'limit': 2})
+        self.assertFalse(response.json()['hasMore'])
+        self.assertEqual([task['id'] for task in response.json()['changes']], [tasks[2].pk])
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(self.url, {'since': 'abc'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('since', response.json())
+
+
+class CachedResponseTests(APITestCase):
+    """Cached list and settings responses switch to a new key on every write."""
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user('tester@example.com', 'Tester', 'test-password')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=user).key}')
+        self.task = Task.objects.create(
+            title='First', priority='medium', category='User Story',
+            createdAt=timezone.now(), dueDate=timezone.now() + datetime.timedelta(days=7)
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def get(self, url, params=None):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(captured)
+
+    def titles(self, params=None):
+        response, queries = self.get(reverse('tasks-list'), params)
+        return sorted(task['title'] for task in response.json()), queries
+
+    def test_warm_hit_skips_the_query(self):
+        cold, cold_queries = self.titles()
+
+        warm, warm_queries = self.titles()
+
+        self.assertEqual(warm, cold)
+        self.assertLess(warm_queries, cold_queries)
+
+    def test_write_is_visible_on_the_next_read(self):
+        self.titles()
+
+        self.task.title = 'Renamed'
+        self.task.save()
+        Task.objects.create(
+            title='Second', priority='medium', category='User Story',
+            createdAt=timezone.now(), dueDate=timezone.now() + datetime.timedelta(days=7)
+        )
+
+        self.assertEqual(self.titles()[0], ['Renamed', 'Second'])
+        self.task.delete()
+        self.assertEqual(self.titles()[0], ['Second'])
+
+    def test_bulk_write_is_visible_on_the_next_read(self):
+        self.titles()
+
+        response = self.client.post(reverse('tasks-bulk'), {'operations': [
+            {'op': 'update', 'id': self.task.pk, 'data': {'title': 'Bulk'}},
+        ]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.titles()[0], ['Bulk'])
+
+    def test_scope_is_part_of_the_key(self):
+        Task.objects.create(
+            title='Private', priority='medium', category='User Story', isPrivate=True, ownerId='7',
+            createdAt=timezone.now(), dueDate=timezone.now() + datetime.timedelta(days=7)
+        )
+
+        self.assertEqual(self.titles({'viewMode': 'public'})[0], ['First'])
+        self.assertEqual(self.titles({'viewMode': 'private', 'userId': '7'})[0], ['Private'])
+        self.assertEqual(self.titles({'viewMode': 'private', 'userId': '8'})[0], [])
+
+    def test_contact_and_settings_writes_are_visible(self):
+        contact = create_contact('Ahn')
+        settings = BoardSettings.objects.create(userId='7')
+        contacts_url, settings_url = reverse('contact-list'), reverse('board-settings-detail', args=['7'])
+        self.get(contacts_url)
+        self.get(settings_url)
+
+        contact.lastname = 'Berg'
+        contact.save()
+        settings.viewMode = 'private'
+        settings.save()
+
+        self.assertEqual([item['lastname'] for item in self.get(contacts_url)[0].json()], ['Berg'])
+        self.assertEqual(self.get(settings_url)[0].json()['viewMode'], 'private')
+
+
+class ConditionalGetTests(APITestCase):
+    """ConditionalGetMixin answers a matching If-None-Match with 304 until the collection changes."""
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user('tester@example.com', 'Tester', 'test-password')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=user).key}')
+        self.contact = create_contact('Ahn')
+        self.task = Task.objects.create(
+            title='First', priority='medium', category='User Story',
+            createdAt=timezone.now(), dueDate=timezone.now() + datetime.timedelta(days=7)
+        )
+        self.task.assignees.add(self.contact)
+
+    def tearDown(self):
+        cache.clear()
+
+    def etag(self, url, params=None):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+        self.assertIn('Last-Modified', response)
+        return response['ETag']
+
+    def revalidate(self, url, etag, params=None):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        return response, [query['sql'] for query in captured]
+
+    def test_matching_etag_is_not_modified(self):
+        url = reverse('tasks-list')
+        etag = self.etag(url)
+
+        response, queries = self.revalidate(url, etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+        self.assertFalse([sql for sql in queries if 'board_tasks_app_task' in sql])
+
+    def test_etag_depends_on_the_query_string(self):
+        url = reverse('tasks-list')
+
+        public = self.etag(url, {'viewMode': 'public'})
+
+        self.assertNotEqual(public, self.etag(url, {'viewMode': 'private', 'userId': '7'}))
+        self.assertEqual(public, self.etag(url, {'viewMode': 'public'}))
+
+    def test_task_write_changes_the_etag(self):
+        list_url, detail_url = reverse('tasks-list'), reverse('tasks-detail', args=[self.task.pk])
+        list_etag, detail_etag = self.etag(list_url), self.etag(detail_url)
+
+        response = self.client.patch(detail_url, {'title': 'Renamed'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response, _ = self.revalidate(list_url, list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], list_etag)
+        self.assertEqual([task['title'] for task in response.json()], ['Renamed'])
+        self.assertEqual(self.revalidate(detail_url, detail_etag)[0].status_code, status.HTTP_200_OK)
+
+    def test_private_board_change_changes_the_etag(self):
+        list_url = reverse('tasks-list')
+        settings = BoardSettings.objects.create(userId='7')
+        settings_url = reverse('board-settings-detail', args=['7'])
+        params = {'viewMode': 'private', 'userId': '7'}
+        list_etag, settings_etag = self.etag(list_url, params), self.etag(settings_url)
+
+        self.task.isPrivate, self.task.ownerId = True, '7'
+        self.task.save()
+        settings.viewMode = 'private'
+        settings.save()
+
+        response, _ = self.revalidate(list_url, list_etag, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([task['title'] for task in response.json()], ['First'])
+        response, _ = self.revalidate(settings_url, settings_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['viewMode'], 'private')
+
+    def test_contact_delete_changes_the_task_and_contact_etags(self):
+        tasks_url, contacts_url = reverse('tasks-list'), reverse('contact-list')
+        tasks_etag, contacts_etag = self.etag(tasks_url), self.etag(contacts_url)
+
+        response = self.client.delete(reverse('contact-detail', args=[self.contact.pk]))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        response, _ = self.revalidate(tasks_url, tasks_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[0]['assignedTo'], [])
+        response, _ = self.revalidate(contacts_url, contacts_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), [])
+
+
+class BrokerTests(APITestCase):
+    """CollectionVersion.objects.bump() publishes the new version once the write commits."""
+
+    def setUp(self):
+        self.broker = InProcessBroker(queue_size=16)
+        patcher = mock.patch('sync_app.models.broker', self.broker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_publish_after_commit(self):
+        subscription = self.broker.subscribe(CollectionVersion.CONTACTS)
+
+        def write():
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                create_contact('Ahn')
+            self.assertEqual(len(callbacks), 1)
+            return CollectionVersion.objects.sequence(CollectionVersion.CONTACTS)[0]
+
+        version = await sync_to_async(write)()
+
+        self.assertEqual(await subscription.get(timeout=1), version)
+        self.assertEqual(subscription.drain(), [])
+
+    async def test_rollback_publishes_nothing(self):
+        subscription = self.broker.subscribe(CollectionVersion.CONTACTS)
+
+        def write():
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                try:
+                    with transaction.atomic():
+                        create_contact('Ahn')
+                        raise RuntimeError('rolled back')
+                except RuntimeError:
+                    pass
+            return callbacks
+
+        callbacks = await sync_to_async(write)()
+
+        self.assertEqual(callbacks, [])
+        self.assertIsNone(await subscription.get(timeout=0.05))
+
+
+class SubscriptionTests(SimpleTestCase):
+    """A subscriber that falls behind loses the oldest notifications or its subscription."""
+
+    async def publish(self, broker, messages):
+        for message in messages:
+            broker.publish('tasks', message)
+        # publish() hands the messages to the subscriber's loop; let it deliver them.
+        await asyncio.sleep(0)
+
+    async def test_drop_oldest(self):
+        broker = InProcessBroker(queue_size=2, overflow=Subscription.DROP_OLDEST)
+        subscription = broker.subscribe('tasks')
+
+        await self.publish(broker, [1, 2, 3])
+
+        self.assertEqual(subscription.dropped, 1)
+        self.assertEqual(await subscription.get(timeout=1), 2)
+        self.assertEqual(subscription.drain(), [3])
+        self.assertEqual(broker.subscriber_count('tasks'), 1)
+
+    async def test_disconnect(self):
+        broker = InProcessBroker(queue_size=2, overflow=Subscription.DISCONNECT)
+        subscription = broker.subscribe('tasks')
+        other = broker.subscribe('contacts')
+
+        await self.publish(broker, [1, 2, 3])
+
+        self.assertTrue(subscription.closed)
+        self.assertEqual(broker.subscriber_count('tasks'), 0)
+        with self.assertRaises(SubscriptionClosed):
+            await subscription.get(timeout=1)
+        self.assertFalse(other.closed)
+
+
+@override_settings(SYNC_STREAM_HEARTBEAT_SECONDS=0.05)
+class TaskEventStreamTests(APITestCase):
+    """GET tasks/stream/ authenticates like the API and resumes from Last-Event-ID."""
+    url = reverse('tasks-stream')
+
+    def setUp(self):
+        user = User.objects.create_user('tester@example.com', 'Tester', 'test-password')
+        self.token = Token.objects.create(user=user).key
+        # Pages are shared per process and keyed by cursor; the rolled-back test data reuses cursors.
+        patcher = mock.patch.object(ChangeStream, 'loader', SharedPageLoader())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_task(self, title, **fields):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Task.objects.create(
+                title=title, priority='medium', category='User Story',
+                createdAt=timezone.now(), dueDate=timezone.now() + datetime.timedelta(days=7), **fields
+            )
+
+    def version(self):
+        return CollectionVersion.objects.sequence(CollectionVersion.TASKS)[0]
+
+    async def read_until(self, chunks, text):
+        """Reads stream chunks until `text` was received; returns everything read."""
+        received = ''
+        async with asyncio.timeout(5):
+            while text not in received:
+                received += (await anext(chunks)).decode()
+        return received
+
+    @contextlib.asynccontextmanager
+    async def stream(self, **kwargs):
+        """Opens the stream and yields its chunks; the stream is closed on exit."""
+        response = await self.async_client.get(self.url, **kwargs)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        chunks = aiter(response.streaming_content)
+        try:
+            yield chunks
+        finally:
+            await chunks.aclose()
+
+    async def test_missing_or_invalid_token_is_rejected(self):
+        for params in [{}, {'token': 'invalid'}]:
+            response = await self.async_client.get(self.url, params)
+
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+            self.assertIn('detail', response.json())
+
+    async def test_token_in_query_starts_at_the_current_version(self):
+        await sync_to_async(self.create_task)('Before')
+        version = await sync_to_async(self.version)()
+
+        async with self.stream(data={'token': self.token}) as chunks:
+            received = await self.read_until(chunks, f'id: {version}\n\n')
+            keepalive = await self.read_until(chunks, ': keepalive')
+
+        self.assertTrue(received.startswith('retry: 5000'))
+        self.assertNotIn('task.changed', received)
+        self.assertNotIn('task.changed', keepalive)
+
+    async def test_last_event_id_resumes_and_follows_new_writes(self):
+        since = await sync_to_async(self.version)()
+        missed = await sync_to_async(self.create_task)('Missed')
+        hidden = await sync_to_async(self.create_task)('Hidden', isPrivate=True, ownerId='7')
+        version = await sync_to_async(self.version)()
+
+        headers = {'Authorization': f'Token {self.token}', 'Last-Event-ID': str(since)}
+        async with self.stream(data={'viewMode': 'public'}, headers=headers) as chunks:
+            replayed = await self.read_until(chunks, f'id: {version}\n\n')
+            live = await sync_to_async(self.create_task)('Live')
+            followed = await self.read_until(chunks, f'"id": {live.pk}')
+
+        self.assertIn('event: task.changed', replayed)
+        self.assertIn(f'"id": {missed.pk}', replayed)
+        self.assertIn(f'event: task.deleted\ndata: {{"id": {hidden.pk}}}', replayed)
+        self.assertIn('"title": "Live"', followed)
+        self.assertNotIn('Missed', followed)
+
+    async def test_compacted_cursor_requests_a_resync(self):
+        await sync_to_async(self.create_task)('Task')
+        version = await sync_to_async(self.version)()
+
+        async with self.stream(data={'token': self.token, 'since': version + 5}) as chunks:
+            received = await self.read_until(chunks, f'id: {version}\n\n')
+
+        self.assertIn(f'event: resync\ndata: {{"cursor": {version}}}', received)
@@ -0,0 +1,25 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_suppressed = ContextVar('sync_tracking_suppressed', default=False)
+
+
+def tracking_enabled():
+    """
+    Returns False while inside suppress_tracking().
+    Model signal receivers check this before recording a change.
+    """
+    return not _suppressed.get()
+
+
+@contextmanager
+def suppress_tracking():
+    """
+    Disables per-row change tracking in model signal receivers.
+    Used by bulk write paths that record their changes once for the whole batch.
+    """
+    token = _suppressed.set(True)
+    try:
+        yield
+    finally:
+        _suppressed.reset(token)
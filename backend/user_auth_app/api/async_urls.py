@@ -0,0 +1,10 @@
+from django.urls import path
+from .async_views import AsyncRegistrationView, AsyncLoginView, AsyncGuestLoginView, AsyncTokenCacheStatsView
+
+# Same routes and names as urls.py, served by the async views under ASGI.
+urlpatterns = [
+    path('registration/', AsyncRegistrationView.as_view(), name='registration'),
+    path('login/', AsyncLoginView.as_view(), name='login'),
+    path('guest-login/', AsyncGuestLoginView.as_view(), name='guest_login'),
+    path('token-cache/', AsyncTokenCacheStatsView.as_view(), name='token_cache_stats'),
+]
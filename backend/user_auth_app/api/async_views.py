@@ -0,0 +1,77 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.signals import user_login_failed
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.response import Response
+from core.async_views import AsyncAPIViewMixin
+from .views import GuestLoginView, LoginView, RegistrationView, TokenCacheStatsView
+from ..authentication import token_cache
+from ..hashing import get_client_address, hashing_pool, verify_password
+from ..models import User
+
+class AsyncRegistrationView(AsyncAPIViewMixin, RegistrationView):
+    """
+    AsyncRegistrationView
+    Async equivalent of RegistrationView, served under ASGI (core/urls_async.py):
+    the request waits for the hashing pool without occupying a thread.
+    """
+    async def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        password_hash = await hashing_pool.run(
+            get_client_address(request),
+            make_password,
+            serializer.validated_data['password']
+        )
+        user, token = await sync_to_async(self.register)(serializer, password_hash)
+        return self.registration_response(user, token)
+
+class AsyncLoginView(AsyncAPIViewMixin, LoginView):
+    """
+    AsyncLoginView
+    Async equivalent of LoginView, served under ASGI (core/urls_async.py):
+    the password check waits for the hashing pool without occupying a thread.
+    """
+    async def post(self, request):
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = await User.objects.filter(email=serializer.validated_data['email']).afirst()
+        valid, upgraded_hash = await hashing_pool.run(
+            get_client_address(request),
+            verify_password,
+            user.password if user else None,
+            serializer.validated_data['password']
+        )
+        if not valid or not user.is_active:
+            await user_login_failed.asend(sender=self.__class__, **self.get_failure_details(request, serializer))
+            return self.failure_response()
+        await sync_to_async(self.login)(user, upgraded_hash)
+        token, _ = await Token.objects.aget_or_create(user=user)
+        return self.login_response(user, token)
+
+class AsyncGuestLoginView(AsyncAPIViewMixin, GuestLoginView):
+    """
+    AsyncGuestLoginView
+    Async equivalent of GuestLoginView, served under ASGI (core/urls_async.py):
+    the guest user and token are fetched or created through the async ORM.
+    """
+    async def post(self, request):
+        guest_user, created = await User.objects.aget_or_create(
+            email=self.guest_email,
+            defaults=self.guest_defaults
+        )
+        if created:
+            guest_user.set_password(None)
+            await guest_user.asave()
+
+        token, _ = await Token.objects.aget_or_create(user=guest_user)
+        return self.login_response(guest_user, token)
+
+class AsyncTokenCacheStatsView(AsyncAPIViewMixin, TokenCacheStatsView):
+    """
+    AsyncTokenCacheStatsView
+    Async equivalent of TokenCacheStatsView, served under ASGI (core/urls_async.py).
+    """
+    async def get(self, request):
+        return Response(token_cache.stats(), status=status.HTTP_200_OK)
@@ -2,6 +2,13 @@ from rest_framework import serializers
 from ..models import User
 from contacts_app.models import Contact
 
+def split_name(name):
+    """Splits a user's name into the (firstname, lastname) of their Contact at the first space."""
+    name_parts = (name or '').strip().split(' ', 1)
+    firstname = name_parts[0] if name_parts else ''
+    lastname = name_parts[1] if len(name_parts) > 1 else ''
+    return firstname, lastname
+
 class UserSerializer(serializers.ModelSerializer):
     """UserSerializer
     Serializes and deserializes User instances for API requests and responses."""
@@ -29,7 +36,8 @@ class RegisterSerializer(serializers.ModelSerializer):
 
     On creation:
     - Removes confirmPassword and acceptPrivacyPolicy from data.
-    - Sets the user's password securely.
+    - Sets the user's password securely (or stores `password_hash` when the caller
+      already hashed it, e.g. in the hashing pool: serializer.save(password_hash=...)).
     - Splits name into firstname and lastname.
     - Creates a corresponding Contact entry for the user.
     """
@@ -51,13 +59,15 @@ class RegisterSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         validated_data.pop('confirmPassword', None)
         validated_data.pop('acceptPrivacyPolicy', None)
+        password_hash = validated_data.pop('password_hash', None)
         password = validated_data.pop('password')
         user = User(**validated_data)
-        user.set_password(password)
+        if password_hash:
+            user.password = password_hash
+        else:
+            user.set_password(password)
         user.save()
-        name_parts = (user.name or '').strip().split(' ', 1)
-        firstname = name_parts[0] if name_parts else ''
-        lastname = name_parts[1] if len(name_parts) > 1 else ''
+        firstname, lastname = split_name(user.name)
         Contact.objects.create(
             firstname=firstname,
             lastname=lastname,
@@ -1,8 +1,9 @@
 from django.urls import path
-from .views import RegistrationView, LoginView, GuestLoginView
+from .views import RegistrationView, LoginView, GuestLoginView, TokenCacheStatsView
 
 urlpatterns = [
     path('registration/', RegistrationView.as_view(), name='registration'),
     path('login/', LoginView.as_view(), name='login'),
     path('guest-login/', GuestLoginView.as_view(), name='guest_login'), 
+    path('token-cache/', TokenCacheStatsView.as_view(), name='token_cache_stats'),
 ]
@@ -1,9 +1,15 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework.permissions import IsAdminUser
 from rest_framework.authtoken.models import Token
-from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import update_last_login
+from django.contrib.auth.signals import user_login_failed
+from django.db import transaction
 from .serializers import RegisterSerializer, LoginSerializer, UserSerializer
+from ..authentication import token_cache
+from ..hashing import get_client_address, hashing_pool, verify_password
 from ..models import User
 
 class RegistrationView(generics.CreateAPIView):
@@ -12,15 +18,32 @@ class RegistrationView(generics.CreateAPIView):
     Handles user registration via POST request.
 
     - Uses RegisterSerializer for validation and creation.
+    - Hashes the password in the bounded hashing pool (user_auth_app/hashing.py) before
+      the user is saved; 503 (pool full) and 429 (too many hashes pending for the client
+      address) carry a `Retry-After` header.
     - On success, creates an authentication token for the new user.
     - Returns a success message, token, and user data.
     """
     serializer_class = RegisterSerializer
 
     def create(self, request, *args, **kwargs):
-        response = super().create(request, *args, **kwargs)
-        user = User.objects.get(email=response.data['email'])
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        password_hash = hashing_pool.call(
+            get_client_address(request),
+            make_password,
+            serializer.validated_data['password']
+        )
+        user, token = self.register(serializer, password_hash)
+        return self.registration_response(user, token)
+
+    @transaction.atomic
+    def register(self, serializer, password_hash):
+        user = serializer.save(password_hash=password_hash)
         token, _ = Token.objects.get_or_create(user=user)
+        return user, token
+
+    def registration_response(self, user, token):
         return Response({
             'message': 'Registration successful',
             'token': token.key,
@@ -33,7 +56,12 @@ class LoginView(APIView):
     Handles user login via POST request.
 
     - Uses LoginSerializer for validation.
-    - Authenticates user with provided email and password.
+    - Authenticates user with provided email and password; the password check runs in
+      the hashing pool (same rules as ModelBackend: inactive users are rejected,
+      outdated hashes are upgraded; 503/429 with `Retry-After` when the pool is busy).
+    - Only the model backend is supported: the check bypasses authenticate(), so
+      AUTHENTICATION_BACKENDS is not consulted. It sends user_login_failed (with the
+      view class as sender) and updates last_login like authenticate() and login() do.
     - On success, returns a token and user data.
     - On failure, returns 401 Unauthorized with error message.
     """
@@ -42,19 +70,38 @@ class LoginView(APIView):
     def post(self, request):
         serializer = self.serializer_class(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = authenticate(
-            email=serializer.validated_data['email'],
-            password=serializer.validated_data['password']
+        user = User.objects.filter(email=serializer.validated_data['email']).first()
+        valid, upgraded_hash = hashing_pool.call(
+            get_client_address(request),
+            verify_password,
+            user.password if user else None,
+            serializer.validated_data['password']
         )
-        if user:
-            token, _ = Token.objects.get_or_create(user=user)
-            return Response({
-                'message': 'Login successful',
-                'token': token.key,
-                'user': UserSerializer(user).data
-            }, status=status.HTTP_200_OK)
+        if not valid or not user.is_active:
+            user_login_failed.send(sender=self.__class__, **self.get_failure_details(request, serializer))
+            return self.failure_response()
+        self.login(user, upgraded_hash)
+        token, _ = Token.objects.get_or_create(user=user)
+        return self.login_response(user, token)
 
+    def login(self, user, upgraded_hash):
+        if upgraded_hash:
+            user.password = upgraded_hash
+            user.save(update_fields=['password'])
+        update_last_login(None, user)
+
+    def get_failure_details(self, request, serializer):
+        return {'credentials': {'email': serializer.validated_data['email']}, 'request': request}
+
+    def failure_response(self):
         return Response({'detail': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
+
+    def login_response(self, user, token):
+        return Response({
+            'message': 'Login successful',
+            'token': token.key,
+            'user': UserSerializer(user).data
+        }, status=status.HTTP_200_OK)
     
 class GuestLoginView(APIView):
     """
@@ -66,18 +113,37 @@ class GuestLoginView(APIView):
     - Generates or retrieves an authentication token for the guest user.
     - Returns a success message, token, and guest user data.
     """
+    guest_email = 'guest@example.com'
+    guest_defaults = {'name': 'Guest User'}
+
     def post(self, request):
         guest_user, created = User.objects.get_or_create(
-            email='guest@example.com',
-            defaults={'name': 'Guest User'}
+            email=self.guest_email,
+            defaults=self.guest_defaults
         )
         if created:
             guest_user.set_password(None) 
             guest_user.save()
 
         token, _ = Token.objects.get_or_create(user=guest_user)
+        return self.login_response(guest_user, token)
+
+    def login_response(self, guest_user, token):
         return Response({
             'message': 'Guest login successful',
             'token': token.key,
             'user': UserSerializer(guest_user).data
-        }, status=status.HTTP_200_OK)
\ No newline at end of file
+        }, status=status.HTTP_200_OK)
+
+class TokenCacheStatsView(APIView):
+    """
+    TokenCacheStatsView
+    Returns the hit/miss/eviction counters of this process's token cache.
+
+    - Only available to staff users.
+    - A warm cache shows hits growing while misses stay flat.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(token_cache.stats(), status=status.HTTP_200_OK)
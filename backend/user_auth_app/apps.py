@@ -3,3 +3,11 @@ from django.apps import AppConfig
 
 class UserAuthAppConfig(AppConfig):
     name = 'user_auth_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from core.metrics import registry
+        from .authentication import token_cache
+        from .hashing import hashing_pool
+        registry.register_collector(token_cache.collect_metrics)
+        registry.register_collector(hashing_pool.collect_metrics)
@@ -0,0 +1,149 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework.authentication import TokenAuthentication
+from core.middleware import profile_phase
+
+
+class TokenCache:
+    """
+    TokenCache
+    Thread-safe, bounded LRU mapping token keys to (user, token) with a time-to-live.
+
+    - The least recently used entry is evicted once `max_entries` is reached.
+    - Entries expire after `ttl` seconds; this also bounds how long another worker
+      process can keep serving a token that was revoked through this process.
+    - Counts hits, misses and evictions for monitoring (see stats()).
+    """
+    def __init__(self, max_entries=10000, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.user_keys = {}
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[2] <= now:
+                if entry is not None:
+                    self.remove(key)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            user, token, _ = entry
+        # Each request gets its own copy, so attribute changes never leak between requests.
+        return copy.copy(user), token
+
+    def set(self, key, user, token, generation=None):
+        """
+        Stores a lookup result. Pass the `generation` read before the database lookup:
+        if an invalidation happened in between, the possibly stale result is not cached.
+        """
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            self.remove(key)
+            self.entries[key] = (user, token, time.monotonic() + self.ttl)
+            self.user_keys.setdefault(user.pk, set()).add(key)
+            while len(self.entries) > self.max_entries:
+                self.remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def remove(self, key):
+        """Drops `key` from the entries and the per-user index; the caller holds the lock."""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self.user_keys.get(entry[0].pk)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.user_keys[entry[0].pk]
+
+    def invalidate(self, key):
+        with self.lock:
+            self.generation += 1
+            self.remove(key)
+
+    def invalidate_user(self, user_id):
+        with self.lock:
+            self.generation += 1
+            for key in list(self.user_keys.get(user_id, ())):
+                self.remove(key)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.user_keys.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self.entries),
+                'maxEntries': self.max_entries,
+                'ttlSeconds': self.ttl,
+            }
+
+    def collect_metrics(self):
+        """Collector for core.metrics.registry (exported at /metrics)."""
+        stats = self.stats()
+        return [
+            ('token_auth_cache_hits_total', 'counter', 'Token lookups served from the cache.', [({}, stats['hits'])]),
+            ('token_auth_cache_misses_total', 'counter', 'Token lookups that queried the database.', [({}, stats['misses'])]),
+            ('token_auth_cache_evictions_total', 'counter', 'Entries evicted by the LRU bound.', [({}, stats['evictions'])]),
+            ('token_auth_cache_entries', 'gauge', 'Tokens currently cached.', [({}, stats['size'])]),
+        ]
+
+
+def create_token_cache():
+    config = getattr(settings, 'TOKEN_AUTH_CACHE', {})
+    return TokenCache(
+        max_entries=config.get('MAX_ENTRIES', 10000),
+        ttl=config.get('TTL_SECONDS', 300)
+    )
+
+
+token_cache = create_token_cache()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    CachedTokenAuthentication
+    Drop-in replacement for TokenAuthentication that serves token -> user lookups from
+    an in-process TokenCache, so requests with a known token run no auth query.
+
+    Invalidation (user_auth_app/signals.py):
+    - Deleting a token drops its entry.
+    - Saving or deleting a user (deactivation, password change, ...) drops all entries
+      of that user.
+    Only successful lookups are cached; unknown tokens and inactive users always hit
+    the database.
+    """
+    cache = token_cache
+
+    def authenticate(self, request):
+        with profile_phase('auth'):
+            return super().authenticate(request)
+
+    def authenticate_credentials(self, key):
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation
+        user, token = super().authenticate_credentials(key)
+        self.cache.set(key, user, token, generation)
+        return user, token
@@ -0,0 +1,166 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from rest_framework.exceptions import APIException
+
+
+class HashingRejected(APIException):
+    """
+    Raised when a hash can not be queued. Answered by DRF's exception handler with
+    `{"detail": ...}` and a `Retry-After` header of `wait` seconds.
+    """
+    status_code = 503
+    default_detail = 'Too many logins in progress, please retry shortly.'
+    default_code = 'hashing_unavailable'
+
+    def __init__(self, wait):
+        super().__init__()
+        self.wait = wait
+
+
+class HashingQueueFull(HashingRejected):
+    """All workers are busy and the queue is full."""
+
+
+class ClientHashLimitExceeded(HashingRejected):
+    """The client address already has its share of hashes pending."""
+    status_code = 429
+    default_detail = 'Too many concurrent login attempts from this address.'
+    default_code = 'hashing_client_limit'
+
+
+class HashingPool:
+    """
+    HashingPool
+    Bounded executor for password hashing (PBKDF2 and the other Django hashers release
+    the GIL while hashing, so threads hash in parallel without blocking request handling).
+
+    - At most `max_workers` hashes run at once and `queue_size` more may wait; further
+      submissions raise HashingQueueFull instead of queueing without bound.
+    - Each client address may have at most `per_client` hashes pending; more raise
+      ClientHashLimitExceeded.
+    - A slot is released when its hash finishes, even if the waiting request was
+      cancelled, so abandoned requests still count against the bound.
+    """
+    def __init__(self, max_workers=4, queue_size=32, per_client=2, retry_after=1):
+        self.max_workers = max_workers
+        self.capacity = max_workers + queue_size
+        self.per_client = per_client
+        self.retry_after = retry_after
+        self.lock = threading.Lock()
+        self.executor = None
+        self.pending = 0
+        self.client_pending = {}
+        self.completed = 0
+        self.rejected_full = 0
+        self.rejected_client = 0
+
+    def get_executor(self):
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='password-hashing')
+            return self.executor
+
+    def acquire(self, client):
+        with self.lock:
+            if self.pending >= self.capacity:
+                self.rejected_full += 1
+                raise HashingQueueFull(self.retry_after)
+            if self.client_pending.get(client, 0) >= self.per_client:
+                self.rejected_client += 1
+                raise ClientHashLimitExceeded(self.retry_after)
+            self.pending += 1
+            self.client_pending[client] = self.client_pending.get(client, 0) + 1
+
+    def release(self, client):
+        with self.lock:
+            self.pending -= 1
+            self.completed += 1
+            remaining = self.client_pending.get(client, 1) - 1
+            if remaining:
+                self.client_pending[client] = remaining
+            else:
+                self.client_pending.pop(client, None)
+
+    def submit(self, client, func, *args):
+        """Queues func(*args) in the pool for `client`; raises HashingRejected when full."""
+        self.acquire(client)
+        try:
+            future = self.get_executor().submit(func, *args)
+        except BaseException:
+            self.release(client)
+            raise
+        future.add_done_callback(lambda _: self.release(client))
+        return future
+
+    def call(self, client, func, *args):
+        """Runs func(*args) in the pool and waits for the result (sync views)."""
+        return self.submit(client, func, *args).result()
+
+    async def run(self, client, func, *args):
+        """Runs func(*args) in the pool without blocking the event loop (async views)."""
+        return await asyncio.wrap_future(self.submit(client, func, *args))
+
+    def stats(self):
+        with self.lock:
+            return {
+                'pending': self.pending,
+                'capacity': self.capacity,
+                'completed': self.completed,
+                'rejectedFull': self.rejected_full,
+                'rejectedClient': self.rejected_client,
+            }
+
+    def collect_metrics(self):
+        """Collector for core.metrics.registry (exported at /metrics)."""
+        stats = self.stats()
+        return [
+            ('password_hashing_pending', 'gauge', 'Hashes running or queued.', [({}, stats['pending'])]),
+            ('password_hashing_completed_total', 'counter', 'Hashes finished by the pool.', [({}, stats['completed'])]),
+            ('password_hashing_rejected_total', 'counter', 'Hash submissions rejected by the pool bounds.', [
+                ({'reason': 'queue_full'}, stats['rejectedFull']),
+                ({'reason': 'client_limit'}, stats['rejectedClient']),
+            ]),
+        ]
+
+
+def create_hashing_pool():
+    config = getattr(settings, 'PASSWORD_HASHING_POOL', {})
+    return HashingPool(
+        max_workers=config.get('MAX_WORKERS', 4),
+        queue_size=config.get('QUEUE_SIZE', 32),
+        per_client=config.get('PER_CLIENT', 2),
+        retry_after=config.get('RETRY_AFTER_SECONDS', 1)
+    )
+
+
+hashing_pool = create_hashing_pool()
+
+
+def get_client_address(request):
+    """
+    Returns the address the per-client limit applies to: REMOTE_ADDR, or the first
+    entry of PASSWORD_HASHING_POOL['CLIENT_IP_HEADER'] behind a trusted proxy.
+    """
+    header = getattr(settings, 'PASSWORD_HASHING_POOL', {}).get('CLIENT_IP_HEADER')
+    if header and request.META.get(header):
+        return request.META[header].split(',')[0].strip()
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def verify_password(encoded, raw_password):
+    """
+    Checks `raw_password` against the stored hash like ModelBackend.authenticate():
+    without a stored hash the password is still hashed once, so unknown emails take as
+    long as wrong passwords. Returns (valid, upgraded hash or None) — the caller saves an
+    upgraded hash when the hasher settings changed since the password was set.
+    """
+    if encoded is None:
+        make_password(raw_password)
+        return False, None
+    upgraded = []
+    valid = check_password(raw_password, encoded, setter=lambda raw: upgraded.append(make_password(raw)))
+    return valid, upgraded[0] if upgraded else None
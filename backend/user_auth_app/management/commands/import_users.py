@@ -0,0 +1,249 @@
+import csv
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.db import connections, transaction
+from rest_framework.authtoken.models import Token
+from contacts_app.models import Contact
+from sync_app.models import CollectionVersion
+from sync_app.tracking import suppress_tracking
+from user_auth_app.api.serializers import split_name
+from user_auth_app.models import User
+
+NAME_MAX_LENGTH = User._meta.get_field('name').max_length
+
+
+def setup_worker():
+    """Process pool initializer; needed where workers are spawned instead of forked."""
+    django.setup()
+
+
+def hash_passwords(passwords):
+    return [make_password(password) for password in passwords]
+
+
+class Command(BaseCommand):
+    """
+    Imports users from CSV (header: name,email,password) or NDJSON (one object with
+    name, email and password per line) and creates, per user, the same rows as
+    POST /api/auth/registration/: User, Contact (name split like RegisterSerializer)
+    and Token.
+
+    - Passwords are hashed across a process pool; the next batch is hashed while the
+      current one is inserted.
+    - Each batch is inserted with bulk_create in one transaction and recorded in the
+      progress file afterwards; a rerun continues after the last committed row
+      (--restart starts over).
+    - Invalid rows (missing fields, invalid or duplicate email) are skipped and written
+      to the error report as NDJSON: {"row": <n>, "email": ..., "errors": {...}}.
+    """
+    help = 'Bulk-imports users (with contact and token) from a CSV or NDJSON file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or NDJSON file with name, email and password per user.')
+        parser.add_argument('--format', choices=['csv', 'ndjson'], help='Defaults to the file extension.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='Hashing processes; 0 hashes in this process.')
+        parser.add_argument('--progress-file', help='Defaults to <path>.progress.json.')
+        parser.add_argument('--report', help='Error report; defaults to <path>.errors.ndjson.')
+        parser.add_argument('--restart', action='store_true', help='Ignore the progress file and start from the first row.')
+
+    def handle(self, *args, **options):
+        path = os.path.abspath(options['path'])
+        if not os.path.isfile(path):
+            raise CommandError(f'{path} does not exist.')
+        file_format = options['format'] or ('csv' if path.lower().endswith('.csv') else 'ndjson')
+        progress_path = options['progress_file'] or f'{path}.progress.json'
+        report_path = options['report'] or f'{path}.errors.ndjson'
+        progress = {'source': path, 'row': 0, 'imported': 0, 'failed': 0}
+        if not options['restart'] and os.path.exists(progress_path):
+            with open(progress_path, encoding='utf-8') as handle:
+                saved = json.load(handle)
+            if saved.get('source') != path:
+                raise CommandError(f'{progress_path} belongs to {saved.get("source")}; use --restart or --progress-file.')
+            progress = saved
+            self.stdout.write(f'Resuming after row {progress["row"]}.')
+
+        self.verbosity = options['verbosity']
+        self.progress_path = progress_path
+        self.progress = progress
+        self.started = time.perf_counter()
+        self.imported_now = 0
+        workers = options['workers']
+        # Forked workers must not share the parent's database connections.
+        connections.close_all()
+        executor = ProcessPoolExecutor(workers, initializer=setup_worker) if workers > 0 else None
+        try:
+            with open(report_path, 'a' if progress['row'] else 'w', encoding='utf-8') as report:
+                self.report = report
+                previous = None
+                for batch in self.read_batches(path, file_format, options['batch_size'], progress['row']):
+                    self.exclude_existing(batch)
+                    hashes = self.submit_hashes(executor, batch, workers)
+                    if previous is not None:
+                        self.insert_batch(*previous)
+                    previous = (batch, hashes)
+                if previous is not None:
+                    self.insert_batch(*previous)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        elapsed = time.perf_counter() - self.started
+        self.stdout.write(self.style.SUCCESS(
+            f'Done: {progress["imported"]} imported, {progress["failed"]} failed '
+            f'({self.imported_now / elapsed if elapsed else 0:.0f} users/s this run). '
+            f'Errors: {report_path}'
+        ))
+
+    def read_rows(self, path, file_format):
+        """Yields (row number, dict or error message), numbering data rows from 1."""
+        with open(path, encoding='utf-8-sig', newline='') as handle:
+            if file_format == 'csv':
+                for number, row in enumerate(csv.DictReader(handle), start=1):
+                    yield number, row
+                return
+            number = 0
+            for line in handle:
+                if not line.strip():
+                    continue
+                number += 1
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    yield number, f'Invalid JSON: {exc.msg}'
+                    continue
+                yield number, row if isinstance(row, dict) else 'Expected a JSON object.'
+
+    def read_batches(self, path, file_format, batch_size, skip_rows):
+        """
+        Yields batches of validated rows. A batch is a dict with `last_row`, `records`
+        [(row, name, email, password)] and `errors` [(row, email, errors)].
+        """
+        seen = set()
+        batch = {'last_row': skip_rows, 'records': [], 'errors': []}
+        for number, row in self.read_rows(path, file_format):
+            if number <= skip_rows:
+                continue
+            batch['last_row'] = number
+            record, errors = self.validate_row(row)
+            if record is not None and record[1] in seen:
+                errors = {'email': ['Duplicate email in this file.']}
+            if errors:
+                email = row.get('email') if isinstance(row, dict) else None
+                batch['errors'].append((number, email, errors))
+            else:
+                seen.add(record[1])
+                batch['records'].append((number, *record))
+            if len(batch['records']) + len(batch['errors']) >= batch_size:
+                yield batch
+                batch = {'last_row': number, 'records': [], 'errors': []}
+        if batch['records'] or batch['errors']:
+            yield batch
+
+    def validate_row(self, row):
+        """Returns ((name, email, password), None) or (None, errors) in the DRF error format."""
+        if not isinstance(row, dict):
+            return None, {'non_field_errors': [row]}
+        errors = {}
+        name = str(row.get('name') or '').strip()
+        email = User.objects.normalize_email(str(row.get('email') or '').strip())
+        password = row.get('password')
+        if not name:
+            errors['name'] = ['This field is required.']
+        elif len(name) > NAME_MAX_LENGTH:
+            errors['name'] = [f'Ensure this field has no more than {NAME_MAX_LENGTH} characters.']
+        if not email:
+            errors['email'] = ['This field is required.']
+        else:
+            try:
+                validate_email(email)
+            except ValidationError:
+                errors['email'] = ['Enter a valid email address.']
+        if not isinstance(password, str) or not password:
+            errors['password'] = ['This field is required.']
+        if errors:
+            return None, errors
+        return (name, email, password), None
+
+    def exclude_existing(self, batch):
+        """Moves rows whose email is already registered to the errors before they are hashed."""
+        existing = set(
+            User.objects.filter(email__in=[record[2] for record in batch['records']]).values_list('email', flat=True)
+        )
+        if not existing:
+            return
+        batch['errors'].extend(
+            (record[0], record[2], {'email': ['user with this email already exists.']})
+            for record in batch['records'] if record[2] in existing
+        )
+        batch['records'] = [record for record in batch['records'] if record[2] not in existing]
+
+    def submit_hashes(self, executor, batch, workers):
+        passwords = [record[3] for record in batch['records']]
+        if executor is None:
+            return [hash_passwords(passwords)]
+        size = max(1, math.ceil(len(passwords) / workers))
+        return [executor.submit(hash_passwords, passwords[start:start + size]) for start in range(0, len(passwords), size)]
+
+    def insert_batch(self, batch, hashes):
+        password_hashes = [value for part in hashes for value in (part if isinstance(part, list) else part.result())]
+        records = batch['records']
+        errors = list(batch['errors'])
+        with transaction.atomic(), suppress_tracking():
+            # Registrations may have happened since exclude_existing() ran.
+            existing = set(
+                User.objects.filter(email__in=[record[2] for record in records]).values_list('email', flat=True)
+            )
+            users = []
+            for (number, name, email, _), password_hash in zip(records, password_hashes):
+                if email in existing:
+                    errors.append((number, email, {'email': ['user with this email already exists.']}))
+                    continue
+                users.append(User(name=name, email=email, password=password_hash))
+            users = User.objects.bulk_create(users)
+            if users and users[0].pk is None:
+                ids = dict(User.objects.filter(email__in=[user.email for user in users]).values_list('email', 'id'))
+                for user in users:
+                    user.pk = ids[user.email]
+            if users:
+                seq = CollectionVersion.objects.bump(CollectionVersion.CONTACTS)
+                contacts = []
+                for user in users:
+                    firstname, lastname = split_name(user.name)
+                    contact = Contact(firstname=firstname, lastname=lastname, email=user.email, phone='', changeSeq=seq)
+                    contact.update_sort_key()
+                    contacts.append(contact)
+                Contact.objects.bulk_create(contacts)
+                Token.objects.bulk_create([Token(key=Token.generate_key(), user=user) for user in users])
+        self.record_progress(batch['last_row'], len(users), sorted(errors))
+
+    def record_progress(self, last_row, imported, errors):
+        for number, email, row_errors in errors:
+            self.report.write(json.dumps({'row': number, 'email': email, 'errors': row_errors}, ensure_ascii=False) + '\n')
+        self.report.flush()
+        self.progress.update(
+            row=last_row,
+            imported=self.progress['imported'] + imported,
+            failed=self.progress['failed'] + len(errors)
+        )
+        temporary = f'{self.progress_path}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as handle:
+            json.dump(self.progress, handle)
+        os.replace(temporary, self.progress_path)
+        self.imported_now += imported
+        if self.verbosity > 0:
+            elapsed = time.perf_counter() - self.started
+            self.stdout.write(
+                f'Row {last_row}: {self.progress["imported"]} imported, {self.progress["failed"]} failed '
+                f'({self.imported_now / elapsed:.0f} users/s)'
+            )
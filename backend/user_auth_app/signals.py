@@ -0,0 +1,19 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from .authentication import token_cache
+from .models import User
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    token_cache.invalidate(instance.key)
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_tokens(sender, instance, **kwargs):
+    """
+    Any user change (deactivation, password change, ...) drops the user's cached tokens,
+    so the next request re-reads the user from the database.
+    """
+    token_cache.invalidate_user(instance.pk)
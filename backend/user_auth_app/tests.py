@@ -1,3 +1,363 @@
-from django.test import TestCase
+import io
+import json
+import os
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.signals import user_login_failed
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APITestCase
+from contacts_app.models import Contact
+from .api.async_views import AsyncLoginView
+from .api.views import LoginView
+from .authentication import CachedTokenAuthentication, TokenCache, token_cache
+from .hashing import hashing_pool
+from .models import User
+
+
+class TokenCacheTests(APITestCase):
+    """TokenCache bounds, expiry and invalidation bookkeeping."""
+
+    def setUp(self):
+        self.users = [User.objects.create_user(f'user{index}@example.com', 'User', 'test-password') for index in range(3)]
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TokenCache(max_entries=2)
+        cache.set('a', self.users[0], None)
+        cache.set('b', self.users[1], None)
+        cache.get('a')
+
+        cache.set('c', self.users[2], None)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertEqual(set(cache.user_keys), {self.users[0].pk, self.users[2].pk})
+
+    def test_expired_entry_is_a_miss(self):
+        cache = TokenCache(ttl=0)
+        cache.set('a', self.users[0], None)
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['size'], 0)
+        self.assertEqual(cache.user_keys, {})
+
+    def test_invalidate_user_drops_all_their_keys(self):
+        cache = TokenCache()
+        cache.set('a', self.users[0], None)
+        cache.set('b', self.users[0], None)
+        cache.set('c', self.users[1], None)
+
+        cache.invalidate_user(self.users[0].pk)
+
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+
+    def test_lookup_racing_an_invalidation_is_not_cached(self):
+        cache = TokenCache()
+        generation = cache.generation
+        cache.invalidate_user(self.users[0].pk)
+
+        cache.set('a', self.users[0], None, generation)
+
+        self.assertIsNone(cache.get('a'))
+
+    def test_cached_user_is_a_copy(self):
+        cache = TokenCache()
+        cache.set('a', self.users[0], None)
+
+        cache.get('a')[0].name = 'Changed'
+
+        self.assertEqual(cache.get('a')[0].name, 'User')
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    """Warm lookups run no query; token and user changes take effect on the next request."""
+    url = reverse('token_cache_stats')
+
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user('staff@example.com', 'Staff', 'test-password', is_staff=True)
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def tearDown(self):
+        token_cache.clear()
+
+    def test_warm_lookup_runs_no_query(self):
+        authentication = CachedTokenAuthentication()
+        authentication.authenticate_credentials(self.token.key)
+
+        with self.assertNumQueries(0):
+            user, token = authentication.authenticate_credentials(self.token.key)
+
+        self.assertEqual((user.pk, token.key), (self.user.pk, self.token.key))
+
+    def test_deleted_token_is_rejected(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+        self.token.delete()
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_user_changes_take_effect_immediately(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+        self.user.is_staff = False
+        self.user.save()
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+        with self.assertRaises(AuthenticationFailed):
+            CachedTokenAuthentication().authenticate_credentials(self.token.key)
+
+    def test_stats_count_hits_and_misses(self):
+        self.client.get(self.url)
+        self.client.get(self.url)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.json()['misses'], response.json()['hits']), (1, 2))
+        self.assertEqual(response.json()['size'], 1)
+
+
+class LoginViewTests(APITestCase):
+    """Login updates last_login and reports failures through user_login_failed."""
+    url = reverse('login')
+
+    def setUp(self):
+        self.user = User.objects.create_user('tester@example.com', 'Tester', 'test-password')
+        self.failures, self.senders = [], []
+        user_login_failed.connect(self.record_failure)
+
+    def tearDown(self):
+        user_login_failed.disconnect(self.record_failure)
+
+    def record_failure(self, sender, credentials, **kwargs):
+        self.failures.append(credentials)
+        self.senders.append(sender)
+
+    def test_login_updates_last_login(self):
+        response = self.client.post(self.url, {'email': 'tester@example.com', 'password': 'test-password'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['token'], Token.objects.get(user=self.user).key)
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+        self.assertEqual(self.failures, [])
+
+    def test_failed_login_sends_user_login_failed(self):
+        User.objects.create_user('inactive@example.com', 'Inactive', 'test-password', is_active=False)
+        attempts = [
+            ('tester@example.com', 'wrong-password'),
+            ('unknown@example.com', 'test-password'),
+            ('inactive@example.com', 'test-password'),
+        ]
+        for email, password in attempts:
+            response = self.client.post(self.url, {'email': email, 'password': password}, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.failures, [{'email': email} for email, _ in attempts])
+        self.assertEqual(self.senders, [LoginView] * len(attempts))
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.last_login)
+
+    def test_invalid_body_is_answered_by_drf(self):
+        response = self.client.post(self.url, {'email': 'not-an-email'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.json()), {'email', 'password'})
+
+    def test_busy_hashing_pool_asks_to_retry(self):
+        credentials = {'email': 'tester@example.com', 'password': 'test-password'}
+        limits = [('capacity', 0, status.HTTP_503_SERVICE_UNAVAILABLE), ('per_client', 0, status.HTTP_429_TOO_MANY_REQUESTS)]
+        for name, value, expected in limits:
+            with mock.patch.object(hashing_pool, name, value):
+                response = self.client.post(self.url, credentials, format='json')
+
+            self.assertEqual(response.status_code, expected)
+            self.assertEqual(response['Retry-After'], str(hashing_pool.retry_after))
+            self.assertIn('detail', response.json())
+        self.assertEqual(self.failures, [])
+
+
+class RegistrationViewTests(APITestCase):
+    """Registration hashes in the pool and answers errors through DRF."""
+    url = reverse('registration')
+    payload = {
+        'name': 'Anna Ahn',
+        'email': 'anna@example.com',
+        'password': 'test-password',
+        'confirmPassword': 'test-password',
+        'acceptPrivacyPolicy': True,
+    }
+
+    def test_registered_user_can_log_in(self):
+        response = self.client.post(self.url, self.payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['token'], Token.objects.get(user__email='anna@example.com').key)
+        response = self.client.post(reverse('login'), {'email': 'anna@example.com', 'password': 'test-password'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_invalid_registration(self):
+        self.client.post(self.url, self.payload, format='json')
+
+        duplicate = self.client.post(self.url, self.payload, format='json')
+        mismatch = self.client.post(self.url, {**self.payload, 'email': 'b@example.com', 'confirmPassword': 'other'}, format='json')
+
+        self.assertEqual(duplicate.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', duplicate.json())
+        self.assertEqual(mismatch.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(mismatch.json(), {'non_field_errors': ['Passwords do not match']})
+        self.assertEqual(User.objects.count(), 1)
+
+
+@override_settings(ROOT_URLCONF='core.urls_async')
+class AsyncAuthViewTests(APITestCase):
+    """Under core.urls_async registration and login are served by the async views."""
+
+    def setUp(self):
+        self.senders = []
+        user_login_failed.connect(self.record_failure)
+        self.addCleanup(user_login_failed.disconnect, self.record_failure)
+
+    def record_failure(self, sender, **kwargs):
+        self.senders.append(sender)
+
+    async def post(self, name, data):
+        return await self.async_client.post(reverse(name), data, content_type='application/json')
+
+    async def test_register_and_log_in(self):
+        response = await self.post('registration', RegistrationViewTests.payload)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = await self.post('login', {'email': 'anna@example.com', 'password': 'test-password'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['user']['email'], 'anna@example.com')
+        user = await User.objects.aget(email='anna@example.com')
+        self.assertIsNotNone(user.last_login)
+
+    async def test_failures(self):
+        response = await self.post('login', {'email': 'unknown@example.com', 'password': 'test-password'})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.senders, [AsyncLoginView])
+        response = await self.post('registration', {**RegistrationViewTests.payload, 'acceptPrivacyPolicy': False})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        with mock.patch.object(hashing_pool, 'capacity', 0):
+            response = await self.post('login', {'email': 'unknown@example.com', 'password': 'test-password'})
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response['Retry-After'], str(hashing_pool.retry_after))
+
+
+class ImportUsersTests(APITestCase):
+    """import_users creates registrable users in batches, reports bad rows and resumes."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        User.objects.create_user('taken@example.com', 'Taken', 'test-password')
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', encoding='utf-8') as handle:
+            handle.write(content)
+        return path
+
+    def run_import(self, path, *args):
+        output = io.StringIO()
+        call_command('import_users', path, '--workers', '0', '--batch-size', '2', *args, stdout=output)
+        return output.getvalue()
+
+    def read_report(self, path):
+        with open(f'{path}.errors.ndjson', encoding='utf-8') as handle:
+            return [json.loads(line) for line in handle]
+
+    def test_csv_rows_are_imported_or_reported(self):
+        path = self.write('users.csv', '\n'.join([
+            'name,email,password',
+            'Anna Ahn,anna@example.com,secret-1',
+            'Ben,ben@EXAMPLE.com,secret-2',
+            'Anna Again,anna@example.com,secret-3',
+            'Taken,taken@example.com,secret-4',
+            'No Mail,not-an-email,secret-5',
+            ',empty@example.com,secret-6',
+            'No Password,nopass@example.com,',
+            f'{"x" * 300},long@example.com,secret-7',
+        ]) + '\n')
+
+        output = self.run_import(path)
+
+        self.assertIn('Done: 2 imported, 6 failed', output)
+        self.assertEqual(
+            sorted(User.objects.values_list('email', flat=True)),
+            ['anna@example.com', 'ben@example.com', 'taken@example.com']
+        )
+        self.assertEqual(
+            [(row['row'], row['email'], sorted(row['errors'])) for row in self.read_report(path)],
+            [
+                (3, 'anna@example.com', ['email']),
+                (4, 'taken@example.com', ['email']),
+                (5, 'not-an-email', ['email']),
+                (6, 'empty@example.com', ['name']),
+                (7, 'nopass@example.com', ['password']),
+                (8, 'long@example.com', ['name']),
+            ]
+        )
+        self.assertEqual(self.read_report(path)[0]['errors'], {'email': ['Duplicate email in this file.']})
+        self.assertEqual(self.read_report(path)[1]['errors'], {'email': ['user with this email already exists.']})
+        anna = User.objects.get(email='anna@example.com')
+        self.assertTrue(Token.objects.filter(user=anna).exists())
+        contact = Contact.objects.get(email='anna@example.com')
+        self.assertEqual((contact.firstname, contact.lastname, contact.sortKey), ('Anna', 'Ahn', 'anna ahn'))
+
+    def test_imported_users_can_log_in(self):
+        path = self.write('users.ndjson', '\n'.join([
+            json.dumps({'name': 'Anna Ahn', 'email': 'anna@example.com', 'password': 'secret-1'}),
+            '{"name": "Broken"',
+            '["not", "an", "object"]',
+            '',
+            json.dumps({'name': 'Ben', 'email': 'ben@example.com', 'password': 'secret-2'}),
+        ]))
+
+        self.run_import(path)
+
+        self.assertEqual(
+            [(row['row'], list(row['errors'])) for row in self.read_report(path)],
+            [(2, ['non_field_errors']), (3, ['non_field_errors'])]
+        )
+        for email, password in [('anna@example.com', 'secret-1'), ('ben@example.com', 'secret-2')]:
+            response = self.client.post(reverse('login'), {'email': email, 'password': password}, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()['token'], Token.objects.get(user__email=email).key)
+        response = self.client.post(reverse('login'), {'email': 'anna@example.com', 'password': 'secret-2'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_rerun_resumes_after_the_last_committed_row(self):
+        rows = ['name,email,password', 'Anna,anna@example.com,secret-1', 'Ben,ben@example.com,secret-2']
+        path = self.write('users.csv', '\n'.join(rows) + '\n')
+        self.run_import(path)
+
+        self.write('users.csv', '\n'.join([*rows, 'Cleo,cleo@example.com,secret-3']) + '\n')
+        output = self.run_import(path)
+
+        self.assertIn('Resuming after row 2.', output)
+        self.assertIn('Done: 3 imported, 0 failed', output)
+        self.assertEqual(User.objects.filter(email__in=['anna@example.com', 'ben@example.com', 'cleo@example.com']).count(), 3)
+        with self.assertRaisesMessage(CommandError, 'use --restart or --progress-file'):
+            self.run_import(self.write('other.csv', rows[0] + '\n'), '--progress-file', f'{path}.progress.json')
@@ -12,7 +12,7 @@
  * @property subtasks - Array of subtasks belonging to this task.
  * @property createdAt - ISO timestamp when the task was created.
  * @property updatedAt - (Optional) ISO timestamp of the last update.
- * @property order - (Optional) Order index for sorting.
+ * @property rank - (Optional, read-only) Fractional rank key; tasks sort by it (by code point) within a column.
  * @property isPrivate - (Optional) Whether the task is private.
  * @property ownerId - (Optional) The user ID of the task owner.
  */
@@ -28,7 +28,7 @@ export interface Task {
   subtasks: Subtask[];
   createdAt: string;
   updatedAt?: string;
-  order?: number;
+  rank?: string;
   isPrivate?: boolean;  
   ownerId?: string;   
 }
@@ -57,4 +57,25 @@ export interface BoardSettings {
   userId: string;
   viewMode: 'public' | 'private';
   lastChanged?: string;
+}
+
+/**
+ * Represents the task counters of the current board, as returned by the summary endpoint.
+ *
+ * @property total - Number of tasks on the board.
+ * @property todo - Number of tasks with status 'todo'.
+ * @property inprogress - Number of tasks with status 'inprogress'.
+ * @property awaitfeedback - Number of tasks with status 'awaitfeedback'.
+ * @property done - Number of tasks with status 'done'.
+ * @property urgent - Number of tasks with priority 'urgent'.
+ * @property nextDeadline - Earliest due date (ISO string) of the urgent tasks that are not done, or null.
+ */
+export interface BoardSummary {
+  total: number;
+  todo: number;
+  inprogress: number;
+  awaitfeedback: number;
+  done: number;
+  urgent: number;
+  nextDeadline: string | null;
 }
\ No newline at end of file
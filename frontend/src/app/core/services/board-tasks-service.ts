@@ -2,7 +2,7 @@ import { Injectable, inject } from '@angular/core';
 import { HttpClient, HttpParams, HttpHeaders } from '@angular/common/http';
 import { Observable, BehaviorSubject, combineLatest, firstValueFrom } from 'rxjs';
 import { map, switchMap } from 'rxjs/operators';
-import { Task, BoardSettings } from '../interfaces/board-tasks-interface';
+import { Task, BoardSettings, BoardSummary } from '../interfaces/board-tasks-interface';
 import { AuthService } from './auth-service';
 
 @Injectable({
@@ -163,6 +163,31 @@ export class BoardTasksService {
     );
   }
 
+  /**
+ * Returns the task counters of the current board (same view mode rules as getAllTasks),
+ * computed by the backend, so the summary does not need to load every task.
+ *
+ * @returns An observable of the board summary.
+ */
+  getSummary(): Observable<BoardSummary> {
+    return combineLatest([
+      this.viewMode$,
+      this.authService.currentUser$,
+      this.refresh$
+    ]).pipe(
+      switchMap(([viewMode, user]) => {
+        let params = new HttpParams().set('viewMode', viewMode === 'private' && user?.id ? 'private' : 'public');
+        if (viewMode === 'private' && user?.id) {
+          params = params.set('userId', user.id);
+        }
+        return this.http.get<BoardSummary>(`${this.apiUrl}/summary/`, {
+          params,
+          ...this.authHeaders(),
+        });
+      })
+    );
+  }
+
   /**
  * Returns all tasks grouped by their status as an observable.
  *
@@ -233,6 +258,39 @@ export class BoardTasksService {
     }
   }
 
+  /**
+ * Moves a task between two neighbours of a column (drag & drop). The server only
+ * writes the moved task, giving it a rank key between the neighbours' keys.
+ *
+ * @param taskId - The ID of the task to move.
+ * @param status - The column the task is dropped into.
+ * @param afterId - (Optional) The ID of the task right above the drop position.
+ * @param beforeId - (Optional) The ID of the task right below the drop position.
+ * @returns The moved task with its new rank.
+ */
+  async moveTaskBetween(
+    taskId: string,
+    status: 'todo' | 'inprogress' | 'awaitfeedback' | 'done',
+    afterId?: string,
+    beforeId?: string
+  ): Promise<Task> {
+    const body = {
+      status,
+      after: afterId ? Number(afterId) : null,
+      before: beforeId ? Number(beforeId) : null,
+    };
+    try {
+      const task = await firstValueFrom(
+        this.http.post<Task>(`${this.apiUrl}/tasks/${taskId}/move/`, body, this.authHeaders())
+      );
+      this.refreshSubject.next();
+      return task;
+    } catch (error) {
+      console.error('Task move failed:', error);
+      throw error;
+    }
+  }
+
   /**
  * Updates the status of a task via the API and sets the updatedAt timestamp.
  *
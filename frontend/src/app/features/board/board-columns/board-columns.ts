@@ -217,7 +217,7 @@ export class BoardColumns implements OnInit {
    */
   private async handleReorderInSameColumn(event: CdkDragDrop<Task[]>) {
     moveItemInArray(event.container.data, event.previousIndex, event.currentIndex);
-    await this.updateTaskOrder(event.container.data);
+    await this.saveTaskPosition(event.item.data as Task, event.container.data, event.currentIndex);
   }
 
 /**
@@ -233,20 +233,24 @@ export class BoardColumns implements OnInit {
       event.currentIndex
     );
     task.status = this.columnId as 'todo' | 'inprogress' | 'awaitfeedback' | 'done';
-    await this.taskService.updateTask(task.id!, task);
-    await this.updateTaskOrder(event.previousContainer.data);
-    await this.updateTaskOrder(event.container.data);
+    await this.saveTaskPosition(task, event.container.data, event.currentIndex);
   }
 
   /**
-   * handles updating the order of tasks in the database.
+   * handles saving the new position of a dropped task in the database.
+   * Only the dropped task is written; it is ranked between its new neighbours.
+   * @param task 
    * @param tasks 
+   * @param index 
    */
-  private async updateTaskOrder(tasks: Task[]) {
-    for (const [index, task] of tasks.entries()) {
-      if (task.id) {
-        await this.taskService.updateTask(task.id, { order: index });
-      }
-    }
+  private async saveTaskPosition(task: Task, tasks: Task[], index: number) {
+    if (!task.id) return;
+    const moved = await this.taskService.moveTaskBetween(
+      task.id,
+      task.status,
+      tasks[index - 1]?.id,
+      tasks[index + 1]?.id
+    );
+    task.rank = moved.rank;
   }
 }
@@ -8,6 +8,16 @@ import { AddTaskModal } from './add-task-modal/add-task-modal';
 import { TaskCardModal } from './task-card/task-card-modal/task-card-modal';
 import { BoardHeader } from './board-header/board-header';
 
+/**
+ * Compares two tasks by their rank keys. Keys are compared by code point (like the
+ * server does), not with localeCompare, which would ignore the case of the digits.
+ */
+function compareRank(a: Task, b: Task): number {
+  const left = a.rank ?? '';
+  const right = b.rank ?? '';
+  return left < right ? -1 : left > right ? 1 : 0;
+}
+
 /**
  * Main board component for task management with Kanban-style columns.
  * Handles task display, creation, editing, deletion, search, and view mode switching.
@@ -90,7 +100,7 @@ export class Board implements OnInit, OnDestroy {
 
   /**
    * Loads tasks from the API and subscribes to updates.
-   * Sorts tasks by order and updates the display.
+   * Sorts tasks by rank and updates the display.
    */
   loadTasks() {
     this.isLoading = true;
@@ -109,7 +119,7 @@ export class Board implements OnInit, OnDestroy {
   }
 
   /**
-   * Sorts all tasks by their order property within each status category.
+   * Sorts all tasks by their rank key within each status category.
    * 
    * @param tasks - Object containing task arrays grouped by status
    */
@@ -119,12 +129,10 @@ export class Board implements OnInit, OnDestroy {
     awaitfeedback: Task[];
     done: Task[];
   }): void {
-    this.allTasks.todo = tasks.todo.sort((a, b) => (a.order ?? 0) - (b.order ?? 0));
-    this.allTasks.inprogress = tasks.inprogress.sort((a, b) => (a.order ?? 0) - (b.order ?? 0));
-    this.allTasks.awaitfeedback = tasks.awaitfeedback.sort(
-      (a, b) => (a.order ?? 0) - (b.order ?? 0)
-    );
-    this.allTasks.done = tasks.done.sort((a, b) => (a.order ?? 0) - (b.order ?? 0));
+    this.allTasks.todo = tasks.todo.sort(compareRank);
+    this.allTasks.inprogress = tasks.inprogress.sort(compareRank);
+    this.allTasks.awaitfeedback = tasks.awaitfeedback.sort(compareRank);
+    this.allTasks.done = tasks.done.sort(compareRank);
   }
 
   /**
@@ -214,11 +222,11 @@ export class Board implements OnInit, OnDestroy {
   }
 
   /**
-   * Sorts tasks in all columns by their order property.
+   * Sorts tasks in all columns by their rank key.
    */
   private sortColumnTasks(): void {
     this.columns.forEach((col) => {
-      col.tasks.sort((a, b) => (a.order ?? 0) - (b.order ?? 0));
+      col.tasks.sort(compareRank);
     });
   }
 
@@ -2,7 +2,7 @@ import { Component, OnInit, OnDestroy, inject } from '@angular/core';
 import { CommonModule } from '@angular/common';
 import { Router } from '@angular/router';
 import { BoardTasksService } from '../../core/services/board-tasks-service';
-import { Task } from '../../core/interfaces/board-tasks-interface';
+import { BoardSummary } from '../../core/interfaces/board-tasks-interface';
 import { Subscription } from 'rxjs';
 import { AuthService } from '../../core/services/auth-service';
 
@@ -49,11 +49,11 @@ export class Summary implements OnInit, OnDestroy {
   }
 
   /**
- * Loads and subscribes to all tasks, then calculates statistics.
+ * Loads and subscribes to the board summary, then applies its statistics.
  */
   private loadTaskStatistics(): void {
-    this.tasksSubscription = this.boardTasksService.getAllTasks().subscribe((tasks: Task[]) => {
-      this.calculateStatistics(tasks);
+    this.tasksSubscription = this.boardTasksService.getSummary().subscribe((summary: BoardSummary) => {
+      this.applyStatistics(summary);
     });
   }
 
@@ -120,59 +120,19 @@ export class Summary implements OnInit, OnDestroy {
   }
 
   /**
- * Calculates and updates all task-related statistics and the upcoming deadline.
+ * Updates all task-related statistics and the upcoming deadline from the board summary.
+ * The upcoming deadline is the earliest due date of the urgent tasks that are not done.
  *
- * @param tasks - The array of tasks to analyze.
+ * @param summary - The counters of the current board.
  */
-  private calculateStatistics(tasks: Task[]): void {
-    this.todoCount = tasks.filter((t) => t.status === 'todo').length;
-    this.doneCount = tasks.filter((t) => t.status === 'done').length;
-    this.urgentCount = tasks.filter((t) => t.priority === 'urgent').length;
-    this.tasksInBoardCount = tasks.length;
-    this.tasksInProgressCount = tasks.filter((t) => t.status === 'inprogress').length;
-    this.awaitingFeedbackCount = tasks.filter((t) => t.status === 'awaitfeedback').length;
-    this.upcomingDeadline = this.calculateUpcomingDeadline(tasks);
-  }
-
-  /**
- * Calculates the upcoming deadline based on the highest-priority tasks.
- *
- * @param tasks - The array of tasks to analyze.
- * @returns The formatted upcoming deadline or 'No deadline'.
- */
-  private calculateUpcomingDeadline(tasks: Task[]): string {
-    const tasksWithDueDate = this.filterTasksWithUrgentDeadline(tasks);
-    if (tasksWithDueDate.length === 0) {
-      return 'No deadline';
-    }
-    const earliestTask = this.findEarliestTask(tasksWithDueDate);
-    return this.formatDeadline(earliestTask.dueDate!);
-  }
-
-  /**
- * Filters tasks to only include those with a due date, not done, and with 'urgent' priority.
- *
- * @param tasks - The array of tasks to filter.
- * @returns An array of filtered tasks.
- */
-  private filterTasksWithUrgentDeadline(tasks: Task[]): Task[] {
-    return tasks.filter(
-      (t) => t.dueDate && t.status !== 'done' && t.priority !== 'low' && t.priority !== 'medium'
-    );
-  }
-
-  /**
- * Finds the task with the earliest due date from a list of tasks.
- *
- * @param tasks - The array of tasks to search.
- * @returns The task with the earliest due date.
- */
-  private findEarliestTask(tasks: Task[]): Task {
-    return tasks.sort((a, b) => {
-      const dateA = this.getDateFromDueDate(a.dueDate!);
-      const dateB = this.getDateFromDueDate(b.dueDate!);
-      return dateA.getTime() - dateB.getTime();
-    })[0];
+  private applyStatistics(summary: BoardSummary): void {
+    this.todoCount = summary.todo;
+    this.doneCount = summary.done;
+    this.urgentCount = summary.urgent;
+    this.tasksInBoardCount = summary.total;
+    this.tasksInProgressCount = summary.inprogress;
+    this.awaitingFeedbackCount = summary.awaitfeedback;
+    this.upcomingDeadline = summary.nextDeadline ? this.formatDeadline(summary.nextDeadline) : 'No deadline';
   }
 
   /**